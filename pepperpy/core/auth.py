@@ -0,0 +1,354 @@
+"""OAuth token management for PepperPy.
+
+Providers that authenticate with OAuth share the same needs: keep a valid
+access token around, refresh it before it expires so requests never wait on
+the identity provider, avoid stampeding the token endpoint when many
+requests notice an expired token at once, and survive transient failures of
+the token endpoint. ``TokenManager`` implements this on top of any async
+token fetcher; ``OAuthClientCredentials`` adds the client-credentials grant.
+
+Example:
+    ```python
+    tokens = OAuthClientCredentials(
+        "https://idm.example.com/oauth/token", client_id, client_secret
+    )
+    headers = {"Authorization": f"Bearer {await tokens.get_token()}"}
+    ...
+    await tokens.close()
+    ```
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+from pepperpy.core.errors import AuthenticationError
+from pepperpy.core.logging import get_logger
+from pepperpy.core.observability import create_counter, get_metric
+from pepperpy.core.retry import RetryStrategy, retry_async
+from pepperpy.core.transport import get_transport_manager
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class OAuthToken:
+    """Access token and its lifetime.
+
+    Attributes:
+        access_token: Token value
+        expires_at: ``time.monotonic()`` value at which the token expires
+        token_type: Token type, usually "Bearer"
+        scope: Granted scope, if reported
+    """
+
+    access_token: str
+    expires_at: float
+    token_type: str = "Bearer"
+    scope: str | None = None
+
+    @classmethod
+    def from_response(
+        cls, payload: dict[str, Any], default_lifetime: float = 300.0
+    ) -> "OAuthToken":
+        """Build a token from an OAuth token endpoint response.
+
+        Args:
+            payload: Decoded JSON response
+            default_lifetime: Lifetime assumed when ``expires_in`` is missing
+
+        Returns:
+            Parsed token
+
+        Raises:
+            AuthenticationError: If the response has no access token
+        """
+        access_token = payload.get("access_token")
+        if not access_token:
+            raise AuthenticationError(
+                "No access token found in authentication response"
+            )
+        try:
+            lifetime = float(payload.get("expires_in", default_lifetime))
+        except (TypeError, ValueError):
+            lifetime = default_lifetime
+        return cls(
+            access_token=access_token,
+            expires_at=time.monotonic() + lifetime,
+            token_type=payload.get("token_type") or "Bearer",
+            scope=payload.get("scope"),
+        )
+
+    @property
+    def expires_in(self) -> float:
+        """Seconds until the token expires."""
+        return self.expires_at - time.monotonic()
+
+
+class TransientAuthError(AuthenticationError):
+    """Token endpoint failure worth retrying (5xx, 429, network errors)."""
+
+    pass
+
+
+class TokenManager:
+    """Keeps an OAuth access token fresh.
+
+    - The token is refreshed in the background ``refresh_margin`` seconds
+      (or ``refresh_ratio`` of its lifetime, whichever comes first) before it
+      expires, so callers normally never wait for the token endpoint.
+    - Concurrent refreshes are single-flighted: every caller that needs a new
+      token awaits the same fetch.
+    - Fetches are retried with exponential backoff on transient errors;
+      rejected credentials fail immediately.
+    - If a background refresh fails the current token keeps being served
+      until it expires.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[OAuthToken]],
+        name: str = "oauth",
+        refresh_margin: float = 60.0,
+        refresh_ratio: float = 0.8,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            fetch: Coroutine function returning a new token
+            name: Name used in logs and metrics
+            refresh_margin: Seconds before expiry to refresh
+            refresh_ratio: Fraction of the lifetime after which to refresh
+            max_retries: Retries per refresh on transient errors
+            retry_delay: Initial delay between retries in seconds
+        """
+        self.name = name
+        self.refresh_margin = refresh_margin
+        self.refresh_ratio = refresh_ratio
+        self._fetch = retry_async(
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            strategy=RetryStrategy.EXPONENTIAL_JITTER,
+            retry_on=[Exception],
+            should_retry_cb=_is_transient,
+            retry_budget=False,
+        )(fetch)
+        self._token: OAuthToken | None = None
+        self._refresh_task: asyncio.Task[OAuthToken] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def token(self) -> OAuthToken | None:
+        """Current token, if any."""
+        return self._token
+
+    async def get_token(self, force_refresh: bool = False) -> str:
+        """Get a valid access token.
+
+        Args:
+            force_refresh: Fetch a new token even if the current one is valid
+
+        Returns:
+            Access token
+
+        Raises:
+            AuthenticationError: If no valid token could be obtained
+        """
+        token = self._token
+        if not force_refresh and token is not None and token.expires_in > 0:
+            if self._needs_refresh(token):
+                self._refresh_in_background()
+            return token.access_token
+        return (await self.refresh()).access_token
+
+    async def refresh(self) -> OAuthToken:
+        """Fetch a new token, joining a refresh already in flight.
+
+        Returns:
+            New token
+
+        Raises:
+            AuthenticationError: If the token could not be fetched
+        """
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._do_refresh())
+            self._refresh_task = task
+        # Shielded so one cancelled caller does not abort everyone's refresh
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """Forget the current token, e.g. after the API answered 401."""
+        self._token = None
+
+    async def close(self) -> None:
+        """Stop background refreshes and drop the token."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._token = None
+
+    async def _do_refresh(self) -> OAuthToken:
+        """Fetch a token and schedule its background refresh."""
+        started = time.monotonic()
+        try:
+            token = await self._fetch()
+        except Exception as e:
+            _refresh_metric().increment(labels={"name": self.name, "outcome": "error"})
+            logger.error(f"Failed to refresh {self.name} token: {e}")
+            if isinstance(e, AuthenticationError):
+                raise
+            raise AuthenticationError(
+                f"Failed to refresh {self.name} token: {e}", provider=self.name
+            ) from e
+
+        _refresh_metric().increment(labels={"name": self.name, "outcome": "success"})
+        logger.debug(
+            f"Refreshed {self.name} token in {time.monotonic() - started:.2f}s, "
+            f"expires in {token.expires_in:.0f}s"
+        )
+        self._token = token
+        self._schedule(token)
+        return token
+
+    def _refresh_at(self, token: OAuthToken) -> float:
+        """Monotonic time at which a token should be refreshed."""
+        lifetime = max(0.0, token.expires_in)
+        lead = max(self.refresh_margin, lifetime * (1 - self.refresh_ratio))
+        return token.expires_at - min(lead, lifetime)
+
+    def _needs_refresh(self, token: OAuthToken) -> bool:
+        """Whether a token is inside its refresh window."""
+        return time.monotonic() >= self._refresh_at(token)
+
+    def _schedule(self, token: OAuthToken) -> None:
+        """Arm the timer that refreshes a token ahead of expiry."""
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = max(0.0, self._refresh_at(token) - time.monotonic())
+        self._timer = asyncio.get_running_loop().call_later(
+            delay, self._refresh_in_background
+        )
+
+    def _refresh_in_background(self) -> None:
+        """Start a refresh without waiting for it."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        task = asyncio.get_running_loop().create_task(self._do_refresh())
+        self._refresh_task = task
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task[OAuthToken]) -> None:
+        """Retry a failed background refresh while the current token lasts."""
+        if task.cancelled() or task.exception() is None:
+            return
+        token = self._token
+        if token is not None and token.expires_in > self.refresh_margin / 4:
+            self._timer = asyncio.get_running_loop().call_later(
+                min(self.refresh_margin / 4, token.expires_in / 2),
+                self._refresh_in_background,
+            )
+
+
+class OAuthClientCredentials(TokenManager):
+    """Token manager for the OAuth 2.0 client-credentials grant."""
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scope: str | None = None,
+        extra_params: dict[str, str] | None = None,
+        timeout: float = 10.0,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            token_url: Token endpoint URL
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            scope: Optional scope to request
+            extra_params: Additional form parameters for the token request
+            timeout: Timeout of each token request in seconds
+            **kwargs: TokenManager options (name, refresh_margin, ...)
+        """
+        super().__init__(self._request_token, **kwargs)
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.scope = scope
+        self.extra_params = extra_params or {}
+        self.timeout = timeout
+
+    async def _request_token(self) -> OAuthToken:
+        """Request a token from the token endpoint.
+
+        Returns:
+            New token
+
+        Raises:
+            TransientAuthError: On network errors, 429 and 5xx responses
+            AuthenticationError: If the credentials were rejected
+        """
+        payload = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "client_credentials",
+            **self.extra_params,
+        }
+        if self.scope:
+            payload["scope"] = self.scope
+
+        session = await get_transport_manager().get_session(self.token_url)
+        try:
+            async with session.post(
+                self.token_url,
+                data=payload,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                if response.status == 429 or response.status >= 500:
+                    raise TransientAuthError(
+                        f"Token endpoint returned {response.status}",
+                        provider=self.name,
+                    )
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise AuthenticationError(
+                        f"Failed to authenticate with {self.name}: {error_text}",
+                        provider=self.name,
+                    )
+                return OAuthToken.from_response(await response.json())
+        except (aiohttp.ClientError, TimeoutError) as e:
+            raise TransientAuthError(
+                f"Token request to {self.token_url} failed: {e!r}", provider=self.name
+            ) from e
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a token fetch error is worth retrying."""
+    if isinstance(error, AuthenticationError):
+        return isinstance(error, TransientAuthError)
+    return True
+
+
+def _refresh_metric() -> Any:
+    """Counter of token refreshes by outcome."""
+    name = "oauth_token_refreshes_total"
+    return get_metric(name) or create_counter(name, "OAuth token refreshes")
@@ -35,6 +35,10 @@
 JsonDict = Dict[str, JsonValue]
 JsonType = Union[Dict[str, Any], List[Any]]
 
+# HTTP types
+HeadersType = Dict[str, str]
+QueryParamsType = Union[Dict[str, Any], str]
+
 # Component types
 ComponentType = str
 ComponentConfigType = Dict[str, Any]
@@ -244,6 +248,8 @@ def get_context_value(self, key: str, default: Any = None) -> Any:
     "JsonValue",
     "JsonDict",
     "JsonType",
+    "HeadersType",
+    "QueryParamsType",
     "ComponentType",
     "ComponentConfigType",
     "DocumentType",
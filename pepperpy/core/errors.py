@@ -388,6 +388,12 @@ def __init__(
         self.status_code = status_code
 
 
+class RequestError(NetworkError):
+    """Error raised when an HTTP request cannot be completed."""
+
+    pass
+
+
 class TimeoutError(NetworkError):
     """Error raised when an operation times out."""
 
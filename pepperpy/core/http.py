@@ -2,29 +2,146 @@
 
 This module provides a simple HTTP client for making requests to external services.
 It supports both synchronous and asynchronous operations, with automatic retries
-and error handling.
+and error handling. Connections are pooled per origin by the process-wide
+transport manager, so clients talking to the same service share keep-alive
+connections.
 """
 
 import asyncio
 import json
 import logging
+import os
+import time
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import aiohttp
 import requests
-
-from pepperpy.core.base import (
-    HeadersType,
-    JsonType,
-    QueryParamsType,
-    RequestError,
-    TimeoutError,
+from urllib3.exceptions import NewConnectionError
+
+from pepperpy.core.base import HeadersType, JsonType, QueryParamsType
+from pepperpy.core.errors import RequestError, TimeoutError
+from pepperpy.core.observability import create_counter, create_histogram, get_metric
+from pepperpy.core.retry import (
+    RetryBudget,
+    RetryStrategy,
+    calculate_delay,
+    get_retry_after,
+    get_retry_budget,
+)
+from pepperpy.core.streaming import SSEEvent, iter_lines, iter_ndjson, iter_sse_events
+from pepperpy.core.transport import (
+    TransportManager,
+    get_origin,
+    get_transport_manager,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Methods that may be repeated without changing the outcome (RFC 9110 9.2.2)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Request bodies: in-memory data, an async iterable of chunks (sent with
+# chunked transfer encoding), an open binary file or a path to a file
+BodyType = Union[str, bytes, AsyncIterable[bytes], IO[bytes], "os.PathLike[str]"]
+
+
+class ResponseTooLargeError(RequestError):
+    """Error raised when a response body exceeds the allowed size."""
+
+    pass
+
+
+async def iter_file(
+    path: Union[str, "os.PathLike[str]"], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop.
+
+    Args:
+        path: File to read
+        chunk_size: Bytes per chunk
+
+    Yields:
+        File chunks
+    """
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
+def _classify_error(error: BaseException) -> str:
+    """Classify a failed attempt.
+
+    Args:
+        error: aiohttp or timeout error
+
+    Returns:
+        "connect_timeout" or "connect_error" when no connection was made,
+        otherwise "timeout" or "read_error"
+    """
+    if isinstance(error, aiohttp.ConnectionTimeoutError):
+        return "connect_timeout"
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return "connect_error"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    return "read_error"
+
+
+def _classify_sync_error(error: requests.RequestException) -> str:
+    """Classify a failed synchronous attempt.
+
+    Args:
+        error: requests error
+
+    Returns:
+        "connect_timeout" or "connect_error" when no connection was made,
+        otherwise "timeout" or "read_error"
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return "connect_timeout"
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    if isinstance(error, requests.ConnectionError) and isinstance(
+        reason, NewConnectionError
+    ):
+        return "connect_error"
+    if isinstance(error, requests.Timeout):
+        return "timeout"
+    return "read_error"
+
+
+def _metric(name: str, description: str, factory: Callable[..., Any]) -> Any:
+    """Get or create a metric."""
+    return get_metric(name) or factory(name, description)
+
+
+def _record_attempt(host: str, method: str, outcome: str, duration: float) -> None:
+    """Record an HTTP attempt in the per-host metrics."""
+    labels = {"host": host, "method": method.upper(), "outcome": outcome}
+    _metric(
+        "http_client_attempts_total",
+        "HTTP client attempts by host and outcome",
+        create_counter,
+    ).increment(labels=labels)
+    _metric(
+        "http_client_attempt_duration_seconds",
+        "Duration of HTTP client attempts",
+        create_histogram,
+    ).observe(duration, labels=labels)
+
 
 @dataclass
 class HTTPResponse:
@@ -44,8 +161,158 @@ def __post_init__(self) -> None:
                 pass
 
 
+class HTTPStreamResponse:
+    """Response whose body is consumed incrementally.
+
+    Obtained from ``HTTPClient.stream``; the body is only readable inside the
+    ``async with`` block. Every iterator enforces ``max_size`` as data
+    arrives, so an oversized body is rejected without being buffered.
+    """
+
+    def __init__(
+        self, response: aiohttp.ClientResponse, max_size: Optional[int] = None
+    ) -> None:
+        """Initialize the stream response.
+
+        Args:
+            response: Underlying aiohttp response
+            max_size: Optional maximum body size in bytes
+        """
+        self._response = response
+        self.status = response.status
+        self.headers: Dict[str, str] = dict(response.headers)
+        self.url = str(response.url)
+        self.max_size = max_size
+        self.bytes_read = 0
+
+    def raise_for_status(self) -> None:
+        """Raise RequestError for 4xx/5xx responses.
+
+        Raises:
+            RequestError: If the status indicates an error
+        """
+        if self.status >= 400:
+            raise RequestError(
+                f"HTTP {self.status} for {self.url}",
+                host=self._response.url.host,
+                status_code=self.status,
+            )
+
+    async def iter_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the raw body.
+
+        Args:
+            chunk_size: Maximum bytes per chunk
+
+        Yields:
+            Body chunks as they arrive
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds ``max_size``
+            TimeoutError: If the server stops sending data
+            RequestError: If the connection fails
+        """
+        try:
+            async for chunk in self._iter_raw(chunk_size):
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Timed out reading response: {self.url}") from e
+        except aiohttp.ClientError as e:
+            raise RequestError(f"Failed reading response: {str(e)}") from e
+
+    async def iter_lines(self) -> AsyncIterator[str]:
+        """Iterate over the body line by line.
+
+        Yields:
+            Decoded lines without line terminators
+        """
+        async for line in iter_lines(self.iter_chunks()):
+            yield line
+
+    async def iter_sse(self) -> AsyncIterator[SSEEvent]:
+        """Iterate over a Server-Sent Events body.
+
+        Yields:
+            Parsed events
+        """
+        async for event in iter_sse_events(self.iter_lines()):
+            yield event
+
+    async def iter_ndjson(self) -> AsyncIterator[Any]:
+        """Iterate over a newline-delimited JSON body.
+
+        Yields:
+            Decoded JSON values
+        """
+        async for item in iter_ndjson(self.iter_lines()):
+            yield item
+
+    async def read(self) -> bytes:
+        """Read the rest of the body, still honoring ``max_size``.
+
+        Returns:
+            Body bytes
+        """
+        return b"".join([chunk async for chunk in self.iter_chunks()])
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Read the rest of the body as text.
+
+        Args:
+            encoding: Text encoding
+
+        Returns:
+            Decoded body
+        """
+        return (await self.read()).decode(encoding, errors="replace")
+
+    async def json(self) -> Any:
+        """Read the rest of the body as JSON.
+
+        Returns:
+            Decoded JSON value
+        """
+        return json.loads(await self.read())
+
+    async def _iter_raw(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the body enforcing ``max_size``; aiohttp errors pass through."""
+        self._check_size(self._response.content_length or 0)
+        async for chunk in self._response.content.iter_chunked(chunk_size):
+            self.bytes_read += len(chunk)
+            self._check_size(self.bytes_read)
+            yield chunk
+
+    def _check_size(self, size: int) -> None:
+        """Raise if a body size exceeds ``max_size``."""
+        if self.max_size is not None and size > self.max_size:
+            raise ResponseTooLargeError(
+                f"Response from {self.url} exceeds {self.max_size} bytes",
+                host=self._response.url.host,
+                status_code=self.status,
+            )
+
+
 class HTTPClient:
-    """HTTP client for making requests."""
+    """HTTP client for making requests.
+
+    Failed attempts are retried with backoff when doing so is safe:
+
+    - connection failures (the request never reached the server) are retried
+      for any method;
+    - read failures, timeouts and retryable statuses (``retry_statuses``) are
+      retried only for idempotent requests, i.e. idempotent methods or
+      requests carrying an ``Idempotency-Key`` header; 429 is always retried
+      since the server declined to process the request;
+    - one-shot bodies (async iterables, open files) are never replayed.
+
+    ``timeout`` bounds each attempt and ``deadline`` the whole call including
+    backoff. Retries draw from the process-wide retry budget, and a server
+    ``Retry-After`` longer than ``max_retry_delay`` ends the retries.
+    """
 
     def __init__(
         self,
@@ -55,23 +322,49 @@ def __init__(
         max_retries: int = 3,
         retry_delay: float = 1.0,
         verify_ssl: bool = True,
+        transport: Optional[TransportManager] = None,
+        pool_options: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+        max_retry_delay: float = 30.0,
+        retry_strategy: RetryStrategy = RetryStrategy.EXPONENTIAL_JITTER,
+        retry_statuses: Optional[frozenset] = None,
+        retry_budget: Optional[RetryBudget] = None,
     ) -> None:
         """Initialize HTTP client.
 
         Args:
             base_url: Base URL for all requests
             headers: Default headers to include
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (per attempt)
             max_retries: Maximum number of retries
             retry_delay: Delay between retries in seconds
             verify_ssl: Whether to verify SSL certificates
+            transport: Transport manager providing pooled sessions
+                (defaults to the process-wide manager)
+            pool_options: TransportSettings overrides for this client's pool,
+                e.g. ``{"limit_per_host": 50}``
+            deadline: Optional overall time limit per call in seconds,
+                including retries and backoff
+            max_retry_delay: Maximum delay between retries in seconds
+            retry_strategy: Backoff strategy between retries
+            retry_statuses: Response statuses worth retrying
+            retry_budget: Retry budget (defaults to the process-wide budget)
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {}
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.deadline = deadline
+        self.max_retry_delay = max_retry_delay
+        self.retry_strategy = retry_strategy
+        self.retry_statuses = (
+            RETRY_STATUSES if retry_statuses is None else frozenset(retry_statuses)
+        )
+        self.retry_budget = retry_budget or get_retry_budget()
         self.verify_ssl = verify_ssl
+        self.transport = transport or get_transport_manager()
+        self.pool_options = {"verify_ssl": verify_ssl, **(pool_options or {})}
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self) -> "HTTPClient":
@@ -85,17 +378,18 @@ async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
 
     async def initialize(self) -> None:
         """Initialize HTTP client."""
-        if not self._session:
-            self._session = aiohttp.ClientSession(
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
+        if not self._session or self._session.closed:
+            self._session = await self.transport.get_session(
+                self.base_url, **self.pool_options
             )
 
     async def cleanup(self) -> None:
-        """Clean up HTTP client resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Clean up HTTP client resources.
+
+        The pooled session is shared with other clients and stays open; it is
+        closed by the transport manager on shutdown.
+        """
+        self._session = None
 
     def _build_url(self, path: str, params: Optional[QueryParamsType] = None) -> str:
         """Build full URL from path and parameters.
@@ -138,8 +432,11 @@ async def request(
         params: Optional[QueryParamsType] = None,
         headers: Optional[HeadersType] = None,
         json_data: Optional[JsonType] = None,
-        data: Optional[Union[str, bytes]] = None,
+        data: Optional[BodyType] = None,
         timeout: Optional[float] = None,
+        max_size: Optional[int] = None,
+        deadline: Optional[float] = None,
+        idempotent: Optional[bool] = None,
     ) -> HTTPResponse:
         """Make an HTTP request.
 
@@ -149,15 +446,201 @@ async def request(
             params: Query parameters
             headers: Request headers
             json_data: JSON data to send
-            data: Raw data to send
-            timeout: Request timeout in seconds
+            data: Raw data to send; async iterables, binary files and paths
+                are streamed
+            timeout: Request timeout in seconds (per attempt)
+            max_size: Optional maximum response body size in bytes
+            deadline: Overall time limit in seconds (defaults to the client's)
+            idempotent: Whether the request may be repeated; by default
+                inferred from the method and the Idempotency-Key header
 
         Returns:
-            HTTP response
+            HTTP response (the last one if retries were exhausted)
 
         Raises:
             HTTPError: If request fails
         """
+        response, content = await self._send(
+            method,
+            path,
+            params=params,
+            headers=headers,
+            json_data=json_data,
+            data=data,
+            timeout=timeout,
+            deadline=deadline,
+            idempotent=idempotent,
+            max_size=max_size,
+        )
+        return HTTPResponse(
+            status=response.status,
+            headers=dict(response.headers),
+            content=content or b"",
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[QueryParamsType] = None,
+        headers: Optional[HeadersType] = None,
+        json_data: Optional[JsonType] = None,
+        data: Optional[BodyType] = None,
+        timeout: Optional[float] = None,
+        max_size: Optional[int] = None,
+        deadline: Optional[float] = None,
+        idempotent: Optional[bool] = None,
+    ) -> AsyncIterator[HTTPStreamResponse]:
+        """Make an HTTP request and consume the response body incrementally.
+
+        ``timeout`` bounds connecting and each read instead of the whole
+        exchange, so long-lived streams (SSE, large downloads) are not cut
+        off while data keeps arriving. Retries only happen until the response
+        headers arrive; once the body is being consumed errors propagate.
+
+        Example:
+            ```python
+            async with client.stream("POST", "/v1/chat", json_data=body) as response:
+                response.raise_for_status()
+                async for event in response.iter_sse():
+                    ...
+            ```
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: URL path
+            params: Query parameters
+            headers: Request headers
+            json_data: JSON data to send
+            data: Raw data to send; async iterables, binary files and paths
+                are streamed
+            timeout: Connect and per-read timeout in seconds
+            max_size: Optional maximum response body size in bytes
+            deadline: Time limit in seconds for getting the response headers
+            idempotent: Whether the request may be repeated; by default
+                inferred from the method and the Idempotency-Key header
+
+        Yields:
+            Streaming response
+
+        Raises:
+            ResponseTooLargeError: If Content-Length exceeds ``max_size``
+            TimeoutError: If the request times out
+            RequestError: If the request fails
+        """
+        response, _ = await self._send(
+            method,
+            path,
+            params=params,
+            headers=headers,
+            json_data=json_data,
+            data=data,
+            timeout=timeout,
+            deadline=deadline,
+            idempotent=idempotent,
+            stream=True,
+        )
+
+        try:
+            stream_response = HTTPStreamResponse(response, max_size)
+            stream_response._check_size(response.content_length or 0)
+            yield stream_response
+        finally:
+            # An unfinished body closes the connection instead of returning
+            # a half-read one to the pool
+            response.release()
+
+    async def download(
+        self,
+        path: str,
+        destination: Union[str, "os.PathLike[str]"],
+        params: Optional[QueryParamsType] = None,
+        headers: Optional[HeadersType] = None,
+        timeout: Optional[float] = None,
+        max_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Download a resource to a file with bounded memory.
+
+        The body is written chunk by chunk to ``<destination>.part``, which
+        replaces ``destination`` only once the download completed.
+
+        Args:
+            path: URL path
+            destination: File to write
+            params: Query parameters
+            headers: Request headers
+            timeout: Connect and per-read timeout in seconds
+            max_size: Optional maximum size in bytes
+            chunk_size: Bytes buffered per write
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            RequestError: If the server answers with an error status
+            ResponseTooLargeError: If the body exceeds ``max_size``
+        """
+        partial = f"{os.fspath(destination)}.part"
+        async with self.stream(
+            "GET",
+            path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            max_size=max_size,
+        ) as response:
+            response.raise_for_status()
+            f = await asyncio.to_thread(open, partial, "wb")
+            try:
+                async for chunk in response.iter_chunks(chunk_size):
+                    await asyncio.to_thread(f.write, chunk)
+            except BaseException:
+                await asyncio.to_thread(f.close)
+                await asyncio.to_thread(os.remove, partial)
+                raise
+            await asyncio.to_thread(f.close)
+
+        await asyncio.to_thread(os.replace, partial, destination)
+        return response.bytes_read
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[QueryParamsType] = None,
+        headers: Optional[HeadersType] = None,
+        json_data: Optional[JsonType] = None,
+        data: Optional[BodyType] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        idempotent: Optional[bool] = None,
+        max_size: Optional[int] = None,
+        stream: bool = False,
+    ) -> Tuple[aiohttp.ClientResponse, Optional[bytes]]:
+        """Send a request, retrying failed attempts when it is safe.
+
+        Args:
+            method: HTTP method
+            path: URL path
+            params: Query parameters
+            headers: Request headers
+            json_data: JSON data to send
+            data: Raw data to send
+            timeout: Per-attempt timeout in seconds
+            deadline: Overall time limit in seconds
+            idempotent: Whether the request may be repeated
+            max_size: Optional maximum response body size in bytes
+            stream: Return the response unread instead of reading the body
+
+        Returns:
+            Final response and its body (None when streaming)
+
+        Raises:
+            TimeoutError: If the last attempt timed out or the deadline passed
+            RequestError: If the last attempt failed
+        """
         if not self._session:
             await self.initialize()
 
@@ -166,32 +649,187 @@ async def request(
 
         url = self._build_url(path, params)
         headers = self._merge_headers(headers)
-        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        host = get_origin(url) or url
+        if idempotent is None:
+            idempotent = self._is_idempotent(method, headers)
+        # One-shot bodies cannot be sent again
+        replayable = data is None or isinstance(data, (str, bytes, os.PathLike))
+        timeout = timeout or self.timeout
+        deadline = deadline if deadline is not None else self.deadline
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        connect_timeout = self._session.timeout.sock_connect or timeout
+
+        self.retry_budget.record_request()
+        attempt = 0
+        delay: Optional[float] = None
+
+        while True:
+            attempt_timeout = timeout
+            if deadline_at is not None:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Deadline of {deadline}s exceeded: {url}",
+                        timeout_seconds=deadline,
+                    )
+                attempt_timeout = min(timeout, remaining)
+
+            if stream:
+                request_timeout = aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=min(connect_timeout, attempt_timeout),
+                    sock_read=attempt_timeout,
+                )
+            else:
+                request_timeout = aiohttp.ClientTimeout(
+                    total=attempt_timeout,
+                    sock_connect=min(connect_timeout, attempt_timeout),
+                )
 
-        try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-                data=data,
-                timeout=request_timeout,
-                ssl=self.verify_ssl,
-            ) as response:
-                content = await response.read()
-                return HTTPResponse(
-                    status=response.status,
-                    headers=dict(response.headers),
-                    content=content,
+            started = time.monotonic()
+            error: Optional[BaseException] = None
+            retry_after: Optional[float] = None
+            try:
+                response = await self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json_data,
+                    data=self._prepare_body(data),
+                    timeout=request_timeout,
+                    ssl=self.verify_ssl,
                 )
+                content = None
+                if not stream:
+                    try:
+                        if max_size is None:
+                            content = await response.read()
+                        else:
+                            body = HTTPStreamResponse(response, max_size)
+                            content = b"".join([c async for c in body._iter_raw()])
+                    finally:
+                        response.release()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                error = e
+                outcome = _classify_error(e)
+                # Nothing reached the server if the connection failed
+                retryable = outcome.startswith("connect") or idempotent
+            else:
+                status = response.status
+                outcome = "retryable_status" if status in self.retry_statuses else "ok"
+                retryable = outcome != "ok" and (idempotent or status == 429)
+                retry_after = get_retry_after(response) if retryable else None
+
+            _record_attempt(host, method, outcome, time.monotonic() - started)
+            if retryable and replayable and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, delay, retry_after, deadline_at)
+            else:
+                delay = None
+
+            if delay is None:
+                if error is None:
+                    return response, content
+                logger.error(f"Request failed: {method} {url} - {outcome}: {error!r}")
+                if isinstance(error, asyncio.TimeoutError):
+                    raise TimeoutError(
+                        f"Request timed out: {url}", timeout_seconds=attempt_timeout
+                    ) from error
+                raise RequestError(
+                    f"Request failed: {str(error)}", host=host, operation=method
+                ) from error
+
+            if error is None:
+                response.release()
+            self._record_retry(host, method, url, attempt, delay, outcome)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _is_idempotent(self, method: str, headers: Dict[str, str]) -> bool:
+        """Whether a request may be repeated without changing the outcome.
 
-        except asyncio.TimeoutError as e:
-            logger.error(f"Request timed out: {url}")
-            raise TimeoutError(f"Request timed out: {url}") from e
+        Args:
+            method: HTTP method
+            headers: Request headers
 
-        except aiohttp.ClientError as e:
-            logger.error(f"Request failed: {url} - {str(e)}")
-            raise RequestError(f"Request failed: {str(e)}") from e
+        Returns:
+            True for idempotent methods and requests with an idempotency key
+        """
+        return method.upper() in IDEMPOTENT_METHODS or any(
+            name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers
+        )
+
+    def _record_retry(
+        self,
+        host: str,
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        outcome: str,
+    ) -> None:
+        """Count and log a retry."""
+        _metric(
+            "http_client_retries_total",
+            "HTTP client retries by host and cause",
+            create_counter,
+        ).increment(labels={"host": host, "reason": outcome})
+        logger.warning(
+            f"Retry {attempt + 1}/{self.max_retries} in {delay:.2f}s: "
+            f"{method} {url} ({outcome})"
+        )
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        previous_delay: Optional[float],
+        retry_after: Optional[float],
+        deadline_at: Optional[float],
+    ) -> Optional[float]:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of the failed attempt (0-indexed)
+            previous_delay: Delay used before the failed attempt
+            retry_after: Delay requested by the server
+            deadline_at: Monotonic time at which the call must end
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        delay = calculate_delay(
+            attempt,
+            self.retry_strategy,
+            self.retry_delay,
+            2.0,
+            previous_delay,
+            self.max_retry_delay,
+        )
+        if retry_after is not None:
+            # The server knows better, but we will not wait arbitrarily long
+            if retry_after > self.max_retry_delay:
+                return None
+            delay = max(delay, retry_after)
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+        if not self.retry_budget.try_acquire():
+            return None
+        return delay
+
+    def _prepare_body(self, data: Optional[BodyType]) -> Any:
+        """Convert a request body into something aiohttp can send.
+
+        aiohttp streams async iterables and file objects natively; paths are
+        turned into a chunked file reader.
+
+        Args:
+            data: Request body
+
+        Returns:
+            Body accepted by aiohttp
+        """
+        if isinstance(data, os.PathLike):
+            return iter_file(data)
+        return data
 
     async def get(
         self,
@@ -318,9 +956,13 @@ def sync_request(
         json_data: Optional[JsonType] = None,
         data: Optional[Union[str, bytes]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        idempotent: Optional[bool] = None,
     ) -> HTTPResponse:
         """Make a synchronous HTTP request.
 
+        Failed attempts are retried under the same rules as ``request``.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: URL path
@@ -328,41 +970,95 @@ def sync_request(
             headers: Request headers
             json_data: JSON data to send
             data: Raw data to send
-            timeout: Request timeout in seconds
+            timeout: Per-attempt timeout in seconds
+            deadline: Overall time limit in seconds, including retries
+            idempotent: Whether the request may be repeated; by default
+                inferred from the method and an ``Idempotency-Key`` header
 
         Returns:
             HTTP response
 
         Raises:
-            HTTPError: If request fails
+            TimeoutError: If the last attempt timed out or the deadline passed
+            RequestError: If the last attempt failed
         """
         url = self._build_url(path, params)
         headers = self._merge_headers(headers)
+        host = get_origin(url) or url
+        if idempotent is None:
+            idempotent = self._is_idempotent(method, headers)
         timeout = timeout or self.timeout
-
-        try:
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-                data=data,
-                timeout=timeout,
-                verify=self.verify_ssl,
-            )
-            return HTTPResponse(
-                status=response.status_code,
-                headers=dict(response.headers),
-                content=response.content,
-            )
-
-        except requests.Timeout as e:
-            logger.error(f"Request timed out: {url}")
-            raise TimeoutError(f"Request timed out: {url}") from e
-
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {url} - {str(e)}")
-            raise RequestError(f"Request failed: {str(e)}") from e
+        deadline = deadline if deadline is not None else self.deadline
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        session = self.transport.get_sync_session(url, **self.pool_options)
+
+        self.retry_budget.record_request()
+        attempt = 0
+        delay: Optional[float] = None
+
+        while True:
+            attempt_timeout = timeout
+            if deadline_at is not None:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Deadline of {deadline}s exceeded: {url}",
+                        timeout_seconds=deadline,
+                    )
+                attempt_timeout = min(timeout, remaining)
+
+            started = time.monotonic()
+            error: Optional[requests.RequestException] = None
+            retry_after: Optional[float] = None
+            try:
+                response = session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json_data,
+                    data=data,
+                    timeout=attempt_timeout,
+                    verify=self.verify_ssl,
+                )
+            except requests.RequestException as e:
+                error = e
+                outcome = _classify_sync_error(e)
+                # Nothing reached the server if the connection failed
+                retryable = outcome.startswith("connect") or idempotent
+            else:
+                status = response.status_code
+                outcome = "retryable_status" if status in self.retry_statuses else "ok"
+                retryable = outcome != "ok" and (idempotent or status == 429)
+                retry_after = get_retry_after(response) if retryable else None
+
+            _record_attempt(host, method, outcome, time.monotonic() - started)
+            if retryable and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, delay, retry_after, deadline_at)
+            else:
+                delay = None
+
+            if delay is None:
+                if error is None:
+                    return HTTPResponse(
+                        status=response.status_code,
+                        headers=dict(response.headers),
+                        content=response.content,
+                    )
+                logger.error(f"Request failed: {method} {url} - {outcome}: {error!r}")
+                if isinstance(error, requests.Timeout):
+                    raise TimeoutError(
+                        f"Request timed out: {url}", timeout_seconds=attempt_timeout
+                    ) from error
+                raise RequestError(
+                    f"Request failed: {str(error)}", host=host, operation=method
+                ) from error
+
+            if error is None:
+                response.close()
+            self._record_retry(host, method, url, attempt, delay, outcome)
+            time.sleep(delay)
+            attempt += 1
 
     def sync_get(
         self,
@@ -5,11 +5,12 @@
 """
 
 import functools
+import inspect
 import time
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Any, TypeVar, cast
+from typing import Any, TypeVar
 
 from pepperpy.core.base import PepperpyError
 from pepperpy.core.context import execution_context, get_current_context
@@ -314,6 +315,9 @@ def instrument(name: str | None = None, labels: dict[str, str] | None = None):
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.isasyncgenfunction(func):
+            return _instrument_async_generator(func, name, labels)
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Use provided name or function name
@@ -336,6 +340,40 @@ async def wrapper(*args: Any, **kwargs: Any) -> Any:
     return decorator
 
 
+def _instrument_async_generator(
+    func: Callable[..., Any],
+    name: str | None,
+    labels: dict[str, str] | None,
+) -> Callable[..., Any]:
+    """Instrument an async generator function.
+
+    The timed operation spans the whole iteration, from the first pull to
+    exhaustion or early close, and chunks are passed through as they arrive.
+
+    Args:
+        func: Async generator function
+        name: Operation name (defaults to function name)
+        labels: Operation labels
+
+    Returns:
+        Wrapped async generator function
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        operation_name = name or func.__name__
+        agen = func(*args, **kwargs)
+        try:
+            async with timed_operation(operation_name, labels):
+                async for item in agen:
+                    yield item
+        finally:
+            # Propagate early close to the wrapped generator
+            await agen.aclose()
+
+    return wrapper
+
+
 # Built-in metrics
 request_counter = create_counter(
     "pepperpy_requests_total",
@@ -1,7 +1,12 @@
 import asyncio
+import email.utils
 import functools
 import random
-from collections.abc import Callable
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
 from enum import Enum
 from typing import Any, TypeVar, cast
 
@@ -16,10 +21,36 @@ class APIError(Exception):
 class RateLimitError(APIError):
     """Error raised when API rate limits are exceeded."""
 
-    pass
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        """Inicializa o erro.
+
+        Args:
+            message: Mensagem de erro
+            retry_after: Segundos sugeridos pelo servidor antes de tentar de novo
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """Error raised when a call is rejected by an open circuit breaker."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Inicializa o erro.
+
+        Args:
+            endpoint: Endpoint protegido pelo circuit breaker
+            retry_after: Segundos até o circuito aceitar uma nova tentativa
+        """
+        super().__init__(
+            f"Circuit breaker for '{endpoint}' is open; retry in {retry_after:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
 
 
 from pepperpy.core.logging import get_logger
+from pepperpy.core.observability import create_counter, create_gauge, get_metric
 
 logger = get_logger(__name__)
 
@@ -38,17 +69,21 @@ class RetryStrategy(Enum):
     EXPONENTIAL_JITTER = "exponential_jitter"
     # Tempo linear entre tentativas: tempo * tentativa
     LINEAR = "linear"
+    # Jitter descorrelacionado: aleatório entre o delay base e 3x o anterior
+    DECORRELATED_JITTER = "decorrelated_jitter"
 
 
 # Alias para estratégias como module-level constants
 retry_strategy = RetryStrategy
 
 
-def _calculate_delay(
+def calculate_delay(
     retry_number: int,
     strategy: RetryStrategy,
     base_delay: float,
     backoff_factor: float,
+    previous_delay: float | None = None,
+    max_delay: float | None = None,
 ) -> float:
     """Calcula o delay antes da próxima tentativa com base na estratégia.
 
@@ -57,10 +92,33 @@ def _calculate_delay(
         strategy: Estratégia a ser usada
         base_delay: Delay base em segundos
         backoff_factor: Fator de multiplicação para backoff
+        previous_delay: Delay usado na tentativa anterior (jitter descorrelacionado)
+        max_delay: Limite superior opcional para o delay
 
     Returns:
         Tempo de espera em segundos
     """
+    delay = _strategy_delay(
+        retry_number, strategy, base_delay, backoff_factor, previous_delay
+    )
+    if max_delay is not None:
+        delay = min(delay, max_delay)
+    return delay
+
+
+def _strategy_delay(
+    retry_number: int,
+    strategy: RetryStrategy,
+    base_delay: float,
+    backoff_factor: float,
+    previous_delay: float | None,
+) -> float:
+    """Calcula o delay sem limite superior (ver calculate_delay)."""
+    if strategy == RetryStrategy.DECORRELATED_JITTER:
+        # sleep = random(base, anterior * 3), ver "Exponential Backoff And Jitter"
+        upper = max(base_delay, (previous_delay or base_delay) * 3)
+        return random.uniform(base_delay, upper)
+
     if strategy == RetryStrategy.CONSTANT:
         return base_delay
 
@@ -81,6 +139,394 @@ def _calculate_delay(
     return base_delay
 
 
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_retry_value(value: Any) -> float | None:
+    """Converte um valor de Retry-After em segundos.
+
+    Aceita segundos ("2", "1.5"), datas HTTP e durações como "6m0s" ou
+    "20ms" (usadas nos headers x-ratelimit-reset-* da OpenAI).
+
+    Args:
+        value: Valor do header
+
+    Returns:
+        Segundos de espera ou None se o valor não for reconhecido
+    """
+    if value is None:
+        return None
+    if isinstance(value, int | float):
+        return max(0.0, float(value))
+
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(n + u for n, u in parts) == text.replace(" ", ""):
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        when = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """Extrai o tempo de espera sugerido pelo servidor a partir de um erro.
+
+    Procura um atributo ``retry_after`` e os headers ``Retry-After``,
+    ``retry-after-ms`` e ``x-ratelimit-reset-*`` em ``error.headers`` ou
+    ``error.response.headers``.
+
+    Args:
+        error: Exceção capturada
+
+    Returns:
+        Segundos de espera ou None se o servidor não indicou nenhum
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return _parse_retry_value(retry_after)
+
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not isinstance(headers, Mapping) and not hasattr(headers, "get"):
+        return None
+
+    def header(name: str) -> Any:
+        value = headers.get(name)
+        return value if value is not None else headers.get(name.title())
+
+    milliseconds = _parse_retry_value(header("retry-after-ms"))
+    if milliseconds is not None:
+        return milliseconds / 1000
+    seconds = _parse_retry_value(header("retry-after"))
+    if seconds is not None:
+        return seconds
+
+    resets = [
+        _parse_retry_value(header(name))
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+    ]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
+
+
+class CircuitState(Enum):
+    """Estados do circuit breaker."""
+
+    # Chamadas passam normalmente
+    CLOSED = "closed"
+    # Chamadas são rejeitadas até o fim do tempo de espera
+    OPEN = "open"
+    # Algumas chamadas de teste decidem se o circuito fecha ou reabre
+    HALF_OPEN = "half_open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """Circuit breaker com janela deslizante de taxa de falhas.
+
+    O circuito abre quando, dentro de ``window`` segundos e com pelo menos
+    ``min_calls`` chamadas, a taxa de falhas atinge ``failure_rate_threshold``.
+    Depois de ``open_timeout`` segundos ele fica meio-aberto e deixa passar
+    até ``half_open_max_calls`` chamadas de teste: se todas funcionarem o
+    circuito fecha, qualquer falha o reabre.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 10,
+        window: float = 60.0,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Inicializa o circuit breaker.
+
+        Args:
+            endpoint: Nome do endpoint protegido (usado em logs e métricas)
+            failure_rate_threshold: Taxa de falhas (0-1) que abre o circuito
+            min_calls: Chamadas mínimas na janela antes de avaliar a taxa
+            window: Tamanho da janela deslizante em segundos
+            open_timeout: Segundos no estado aberto antes do meio-aberto
+            half_open_max_calls: Chamadas de teste permitidas no meio-aberto
+        """
+        self.endpoint = endpoint
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window = window
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._state_metric().set(0, labels={"endpoint": endpoint})
+
+    @property
+    def state(self) -> CircuitState:
+        """Estado atual (o aberto vira meio-aberto após o tempo de espera)."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> None:
+        """Verifica se uma chamada pode ser feita.
+
+        Raises:
+            CircuitOpenError: Se o circuito está aberto ou sem vagas de teste
+        """
+        with self._lock:
+            self._refresh()
+            if self._state == CircuitState.OPEN:
+                raise CircuitOpenError(self.endpoint, self._remaining_open())
+            if self._state == CircuitState.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.endpoint, 0.0)
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Registra uma chamada bem-sucedida."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._transition(CircuitState.CLOSED)
+                return
+            self._add_outcome(True)
+
+    def record_failure(self) -> None:
+        """Registra uma chamada com falha."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN)
+                return
+            self._add_outcome(False)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if (
+                self._state == CircuitState.CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate_threshold
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Retorna estatísticas do circuit breaker.
+
+        Returns:
+            Dicionário com estado e contagens da janela
+        """
+        with self._lock:
+            self._refresh()
+            self._trim(time.monotonic())
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "endpoint": self.endpoint,
+                "state": self._state.value,
+                "calls": len(self._outcomes),
+                "failures": failures,
+                "failure_rate": (
+                    failures / len(self._outcomes) if self._outcomes else 0.0
+                ),
+                "retry_in": self._remaining_open(),
+            }
+
+    def _add_outcome(self, ok: bool) -> None:
+        """Adiciona um resultado à janela; o lock já está adquirido."""
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        """Remove resultados fora da janela; o lock já está adquirido."""
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def _refresh(self) -> None:
+        """Passa de aberto para meio-aberto; o lock já está adquirido."""
+        if self._state == CircuitState.OPEN and self._remaining_open() <= 0:
+            self._transition(CircuitState.HALF_OPEN)
+        elif (
+            self._state == CircuitState.HALF_OPEN
+            and time.monotonic() - self._opened_at > 2 * self.open_timeout
+        ):
+            # Chamadas de teste canceladas nunca reportam resultado; libera as vagas
+            self._opened_at = time.monotonic() - self.open_timeout
+            self._half_open_calls = self._half_open_successes
+
+    def _remaining_open(self) -> float:
+        """Segundos restantes no estado aberto."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_timeout - time.monotonic())
+
+    def _transition(self, state: CircuitState) -> None:
+        """Muda de estado; o lock já está adquirido."""
+        previous = self._state
+        self._state = state
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitState.CLOSED:
+            self._outcomes.clear()
+
+        self._state_metric().set(
+            _STATE_VALUES[state], labels={"endpoint": self.endpoint}
+        )
+        _metric(
+            "circuit_breaker_transitions_total",
+            "Circuit breaker state transitions",
+            create_counter,
+        ).increment(
+            labels={
+                "endpoint": self.endpoint,
+                "from": previous.value,
+                "to": state.value,
+            }
+        )
+        log = logger.info if state == CircuitState.CLOSED else logger.warning
+        log(f"Circuit breaker '{self.endpoint}': {previous.value} -> {state.value}")
+
+    def _state_metric(self) -> Any:
+        """Gauge com o estado do circuito (0 fechado, 1 meio-aberto, 2 aberto)."""
+        return _metric(
+            "circuit_breaker_state",
+            "State of circuit breakers by endpoint",
+            create_gauge,
+        )
+
+
+class RetryBudget:
+    """Orçamento global de retries.
+
+    Limita os retries a uma fração das requisições feitas nos últimos
+    ``window`` segundos (com um mínimo para serviços de pouco tráfego),
+    evitando que uma falha geral multiplique a carga sobre o serviço.
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, min_retries: int = 10, window: float = 10.0
+    ) -> None:
+        """Inicializa o orçamento.
+
+        Args:
+            ratio: Retries permitidos por requisição (0.1 = 10%)
+            min_retries: Retries sempre permitidos dentro da janela
+            window: Tamanho da janela deslizante em segundos
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._rejected = 0
+
+    def record_request(self) -> None:
+        """Registra uma requisição original (não um retry)."""
+        with self._lock:
+            now = time.monotonic()
+            self._requests.append(now)
+            self._trim(now)
+
+    def try_acquire(self) -> bool:
+        """Tenta consumir um retry do orçamento.
+
+        Returns:
+            True se o retry é permitido
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) < allowed:
+                self._retries.append(now)
+                return True
+            self._rejected += 1
+        _metric(
+            "retry_budget_exhausted_total",
+            "Retries skipped because the retry budget was exhausted",
+            create_counter,
+        ).increment()
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Retorna estatísticas do orçamento.
+
+        Returns:
+            Dicionário com requisições, retries e retries rejeitados na janela
+        """
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "rejected": self._rejected,
+            }
+
+    def _trim(self, now: float) -> None:
+        """Remove eventos fora da janela; o lock já está adquirido."""
+        for events in (self._requests, self._retries):
+            while events and events[0] < now - self.window:
+                events.popleft()
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+_retry_budget = RetryBudget()
+
+
+def get_circuit_breaker(endpoint: str, **settings: Any) -> CircuitBreaker:
+    """Retorna o circuit breaker compartilhado de um endpoint.
+
+    Args:
+        endpoint: Nome do endpoint (por exemplo "openai:chat")
+        **settings: Parâmetros do CircuitBreaker usados na primeira criação
+
+    Returns:
+        Circuit breaker do endpoint
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint, **settings)
+            _circuit_breakers[endpoint] = breaker
+        return breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    """Retorna o orçamento global de retries do processo.
+
+    Returns:
+        Orçamento global
+    """
+    return _retry_budget
+
+
+def _metric(name: str, description: str, factory: Callable[..., Any]) -> Any:
+    """Obtém ou cria uma métrica."""
+    return get_metric(name) or factory(name, description)
+
+
 def retry_async(
     max_retries: int = 3,
     retry_delay: float = 1.0,
@@ -88,16 +534,31 @@ def retry_async(
     strategy: RetryStrategy = RetryStrategy.EXPONENTIAL_JITTER,
     retry_on: list[type[Exception]] | None = None,
     should_retry_cb: Callable[[Exception], bool] | None = None,
+    max_delay: float = 60.0,
+    circuit_breaker: CircuitBreaker | str | None = None,
+    retry_budget: RetryBudget | bool = True,
 ) -> Callable[[F], F]:
     """Decorador para tentar novamente operações assíncronas com várias estratégias.
 
+    O tempo sugerido pelo servidor (``Retry-After`` ou headers de rate limit)
+    tem prioridade sobre o backoff calculado; se ele passar de ``max_delay``
+    o erro é propagado em vez de esperar. Com ``circuit_breaker``, chamadas
+    são rejeitadas com CircuitOpenError enquanto o endpoint estiver falhando.
+    Os retries consomem o orçamento global (ou o informado), então durante
+    uma queda geral a maior parte das chamadas falha rápido em vez de
+    multiplicar a carga.
+
     Args:
         max_retries: Número máximo de tentativas
         retry_delay: Tempo inicial de espera entre tentativas em segundos
         backoff_factor: Fator de multiplicação para cálculo do delay
-        strategy: Estratégia de retry (constant, linear, exponential)
+        strategy: Estratégia de retry (constant, linear, exponential, decorrelated)
         retry_on: Lista de exceções que acionam retry
         should_retry_cb: Função de callback para determinar se deve fazer retry
+        max_delay: Delay máximo entre tentativas em segundos
+        circuit_breaker: Circuit breaker ou nome do endpoint (usa o breaker
+            compartilhado de get_circuit_breaker)
+        retry_budget: Orçamento de retries; True usa o global, False desativa
 
     Returns:
         Decorador configurado
@@ -108,12 +569,29 @@ def retry_async(
     def decorator(func: F) -> F:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            breaker = (
+                get_circuit_breaker(circuit_breaker)
+                if isinstance(circuit_breaker, str)
+                else circuit_breaker
+            )
+            if retry_budget is True:
+                budget: RetryBudget | None = get_retry_budget()
+            else:
+                budget = retry_budget or None
+            if budget is not None:
+                budget.record_request()
+
             attempt = 0
             last_error = None
+            delay: float | None = None
 
             while attempt <= max_retries:
+                # Circuito aberto: falha rápido, sem retry
+                if breaker is not None:
+                    breaker.allow()
+
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
                 except Exception as e:
                     last_error = e
                     should_retry = False
@@ -122,6 +600,13 @@ async def wrapper(*args: Any, **kwargs: Any) -> Any:
                     if any(isinstance(e, exc_type) for exc_type in retry_on):
                         should_retry = True
 
+                    # Falhas transitórias contam contra o endpoint
+                    if breaker is not None:
+                        if should_retry:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
+
                     # Se temos um callback, ele pode sobrescrever a decisão
                     if should_retry_cb is not None:
                         should_retry = should_retry_cb(e)
@@ -130,10 +615,25 @@ async def wrapper(*args: Any, **kwargs: Any) -> Any:
                     if attempt >= max_retries or not should_retry:
                         raise
 
-                    # Log da exceção e tentativa de retry
-                    delay = _calculate_delay(
-                        attempt, strategy, retry_delay, backoff_factor
+                    delay = calculate_delay(
+                        attempt, strategy, retry_delay, backoff_factor, delay, max_delay
                     )
+
+                    # O servidor sabe melhor quando podemos tentar de novo
+                    retry_after = get_retry_after(e)
+                    if retry_after is not None:
+                        if retry_after > max_delay:
+                            raise
+                        delay = max(delay, retry_after)
+
+                    # Sem orçamento, não multiplicamos a carga de um serviço com falha
+                    if budget is not None and not budget.try_acquire():
+                        logger.warning(
+                            f"Retry budget exhausted, not retrying {func.__name__}: {e}"
+                        )
+                        raise
+
+                    # Log da exceção e tentativa de retry
                     logger.warning(
                         f"Retry {attempt + 1}/{max_retries} in {delay:.2f}s: {func.__name__} failed: {e}"
                     )
@@ -141,6 +641,10 @@ async def wrapper(*args: Any, **kwargs: Any) -> Any:
                     # Espera antes da próxima tentativa
                     await asyncio.sleep(delay)
                     attempt += 1
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
 
             # Normalmente não chegamos aqui, mas por segurança
             if last_error:
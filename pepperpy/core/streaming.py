@@ -0,0 +1,182 @@
+"""Streaming wire formats for PepperPy.
+
+Incremental parsers for byte streams received over HTTP: line splitting,
+Server-Sent Events and newline-delimited JSON. They work on any async
+iterator, so they can sit directly on top of an HTTP response body without
+buffering it.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from pepperpy.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SSE_DONE = "[DONE]"
+
+
+@dataclass
+class SSEEvent:
+    """A single Server-Sent Event.
+
+    Attributes:
+        data: Event payload (multiple data lines joined with newlines)
+        event: Event type, "message" when not specified
+        id: Optional event ID
+        retry: Optional reconnection time in milliseconds
+    """
+
+    data: str
+    event: str = "message"
+    id: str | None = None
+    retry: int | None = None
+
+
+def _decode_line(line: str | bytes) -> str:
+    """Decode a raw line and strip the line terminator.
+
+    Args:
+        line: Raw line as returned by an HTTP client
+
+    Returns:
+        Decoded line without trailing CR/LF
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    return line.rstrip("\r\n")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split an arbitrary byte-chunk stream into decoded lines.
+
+    Chunks may break anywhere, including inside a multi-byte UTF-8 sequence,
+    so partial data is buffered until a line terminator arrives.
+
+    Args:
+        chunks: Async iterator of raw byte chunks
+
+    Yields:
+        Decoded lines without line terminators
+    """
+    # Pieces of the current line, joined once its terminator arrives
+    pending: list[bytes] = []
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            pending.append(chunk)
+            continue
+        pending.append(lines[0])
+        yield _decode_line(b"".join(pending))
+        for line in lines[1:-1]:
+            yield _decode_line(line)
+        pending = [lines[-1]] if lines[-1] else []
+    if pending:
+        yield _decode_line(b"".join(pending))
+
+
+async def iter_sse_events(
+    lines: AsyncIterator[str] | AsyncIterator[bytes],
+) -> AsyncIterator[SSEEvent]:
+    """Parse Server-Sent Events from a line stream.
+
+    Implements the field rules of the SSE specification: ``data`` lines are
+    accumulated until a blank line dispatches the event, lines starting with
+    ``:`` are comments, and unknown fields are ignored.
+
+    Args:
+        lines: Async iterator of lines (str or bytes)
+
+    Yields:
+        Parsed SSE events
+    """
+    data_lines: list[str] = []
+    event_type = "message"
+    event_id: str | None = None
+    retry: int | None = None
+
+    async for raw_line in lines:
+        line = _decode_line(raw_line)
+
+        if not line:
+            if data_lines:
+                yield SSEEvent(
+                    data="\n".join(data_lines),
+                    event=event_type,
+                    id=event_id,
+                    retry=retry,
+                )
+            data_lines = []
+            event_type = "message"
+            retry = None
+            continue
+
+        if line.startswith(":"):
+            continue
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if name == "data":
+            data_lines.append(value)
+        elif name == "event":
+            event_type = value or "message"
+        elif name == "id":
+            event_id = value
+        elif name == "retry" and value.isdigit():
+            retry = int(value)
+
+    # Flush an event left without a trailing blank line
+    if data_lines:
+        yield SSEEvent(
+            data="\n".join(data_lines), event=event_type, id=event_id, retry=retry
+        )
+
+
+async def iter_sse_json(
+    lines: AsyncIterator[str] | AsyncIterator[bytes],
+) -> AsyncIterator[dict[str, Any]]:
+    """Parse an OpenAI-compatible SSE stream into JSON payloads.
+
+    Stops at the ``[DONE]`` sentinel. Events whose data is not valid JSON are
+    logged and skipped.
+
+    Args:
+        lines: Async iterator of lines (str or bytes)
+
+    Yields:
+        Decoded JSON payloads
+    """
+    async for event in iter_sse_events(lines):
+        if event.data.strip() == SSE_DONE:
+            return
+        try:
+            yield json.loads(event.data)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping non-JSON SSE event: {event.data[:100]}")
+
+
+async def iter_ndjson(
+    lines: AsyncIterator[str] | AsyncIterator[bytes],
+) -> AsyncIterator[dict[str, Any]]:
+    """Parse a newline-delimited JSON stream (Ollama format).
+
+    Args:
+        lines: Async iterator of lines (str or bytes)
+
+    Yields:
+        Decoded JSON objects
+    """
+    async for raw_line in lines:
+        line = _decode_line(raw_line).strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping invalid NDJSON line: {line[:100]}")
@@ -0,0 +1,300 @@
+"""HTTP transport manager for PepperPy.
+
+This module keeps process-wide pools of HTTP sessions so clients talking to
+the same service reuse TCP/TLS connections instead of paying connection setup
+on every call. It hands out:
+
+- aiohttp sessions per origin, with per-host connection limits, keep-alive
+  tuning and DNS caching,
+- httpx clients per base URL, optionally speaking HTTP/2,
+- requests sessions per origin for synchronous callers.
+
+Shared sessions are owned by the manager: clients must not close them.
+``close()`` (or ``close_transports()``) shuts everything down gracefully.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import threading
+from dataclasses import dataclass, replace
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from pepperpy.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP/2 support in httpx needs the optional h2 package
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """Connection pool settings.
+
+    Attributes:
+        limit: Maximum open connections per session
+        limit_per_host: Maximum open connections to a single host
+        keepalive_timeout: Seconds an idle connection is kept open
+        dns_cache_ttl: Seconds resolved addresses are cached
+        connect_timeout: Seconds allowed to establish a connection
+        verify_ssl: Whether to verify TLS certificates
+        http2: Use HTTP/2 for httpx clients (requires the ``h2`` package)
+    """
+
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    connect_timeout: float = 10.0
+    verify_ssl: bool = True
+    http2: bool = False
+
+
+def get_origin(url: str) -> str:
+    """Get the ``scheme://host:port`` origin of a URL.
+
+    Args:
+        url: Absolute URL (relative URLs map to an empty origin)
+
+    Returns:
+        Origin string
+    """
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return ""
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class TransportManager:
+    """Process-wide registry of pooled HTTP sessions.
+
+    aiohttp and httpx sessions are bound to the event loop they were created
+    on, so they are keyed by loop as well as by origin; sessions of loops that
+    have been closed are discarded on the next lookup.
+
+    Example:
+        ```python
+        session = await get_transport_manager().get_session("https://api.example.com")
+        async with session.get("https://api.example.com/v1/items") as response:
+            ...
+        ```
+    """
+
+    def __init__(self, settings: TransportSettings | None = None) -> None:
+        """Initialize the manager.
+
+        Args:
+            settings: Default pool settings
+        """
+        self.settings = settings or TransportSettings()
+        self._sessions: dict[tuple[Any, ...], aiohttp.ClientSession] = {}
+        self._httpx_clients: dict[tuple[Any, ...], httpx.AsyncClient] = {}
+        self._sync_sessions: dict[tuple[Any, ...], requests.Session] = {}
+        # Strong references keep loop ids from being reused while keyed
+        self._loops: dict[tuple[Any, ...], asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **overrides: Any) -> None:
+        """Change the default settings for sessions created from now on.
+
+        Args:
+            **overrides: TransportSettings fields to change
+        """
+        self.settings = replace(self.settings, **overrides)
+
+    async def get_session(
+        self, url: str = "", **overrides: Any
+    ) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session for a URL's origin.
+
+        Args:
+            url: Any URL of the target service
+            **overrides: TransportSettings fields for this pool
+
+        Returns:
+            Shared session (do not close it)
+        """
+        settings = replace(self.settings, **overrides) if overrides else self.settings
+        loop = asyncio.get_running_loop()
+        key = ("aiohttp", get_origin(url), id(loop), settings)
+
+        with self._lock:
+            self._discard_stale()
+            session = self._sessions.get(key)
+            if session is not None and not session.closed:
+                return session
+
+            connector = aiohttp.TCPConnector(
+                limit=settings.limit,
+                limit_per_host=settings.limit_per_host,
+                keepalive_timeout=settings.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=settings.dns_cache_ttl,
+                ssl=settings.verify_ssl,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=settings.connect_timeout
+                ),
+            )
+            self._sessions[key] = session
+            self._loops[key] = loop
+        logger.debug(f"Created pooled HTTP session for {key[1] or '<any>'}")
+        return session
+
+    def get_httpx_client(
+        self, base_url: str = "", **overrides: Any
+    ) -> httpx.AsyncClient:
+        """Get the shared httpx client for a base URL.
+
+        Args:
+            base_url: Base URL used for relative request paths
+            **overrides: TransportSettings fields for this pool
+
+        Returns:
+            Shared ``httpx.AsyncClient`` (do not close it)
+        """
+        settings = replace(self.settings, **overrides) if overrides else self.settings
+        loop = asyncio.get_running_loop()
+        key = ("httpx", base_url.rstrip("/"), id(loop), settings)
+
+        with self._lock:
+            self._discard_stale()
+            client = self._httpx_clients.get(key)
+            if client is not None and not client.is_closed:
+                return client
+
+            http2 = settings.http2
+            if http2 and not H2_AVAILABLE:
+                logger.warning(
+                    "h2 package not installed, using HTTP/1.1. "
+                    "Install with: pip install httpx[http2]"
+                )
+                http2 = False
+
+            client = httpx.AsyncClient(
+                base_url=key[1],
+                http2=http2,
+                verify=settings.verify_ssl,
+                timeout=httpx.Timeout(None, connect=settings.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=settings.limit,
+                    max_keepalive_connections=settings.limit_per_host,
+                    keepalive_expiry=settings.keepalive_timeout,
+                ),
+            )
+            self._httpx_clients[key] = client
+            self._loops[key] = loop
+        return client
+
+    def get_sync_session(self, url: str = "", **overrides: Any) -> requests.Session:
+        """Get the shared requests session for a URL's origin.
+
+        Args:
+            url: Any URL of the target service
+            **overrides: TransportSettings fields for this pool
+
+        Returns:
+            Shared session (do not close it)
+        """
+        settings = replace(self.settings, **overrides) if overrides else self.settings
+        key = (get_origin(url), settings)
+
+        with self._lock:
+            session = self._sync_sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=settings.limit_per_host,
+                    pool_maxsize=settings.limit_per_host,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.verify = settings.verify_ssl
+                self._sync_sessions[key] = session
+            return session
+
+    async def close(self) -> None:
+        """Close every session created on the running loop.
+
+        Sessions of other loops cannot be closed from here and are dropped.
+        """
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            sessions = {k: s for k, s in self._sessions.items() if k[2] == loop_id}
+            clients = [c for k, c in self._httpx_clients.items() if k[2] == loop_id]
+            self._sessions.clear()
+            self._httpx_clients.clear()
+            self._loops.clear()
+
+        await asyncio.gather(
+            *(session.close() for session in sessions.values()),
+            *(client.aclose() for client in clients),
+            return_exceptions=True,
+        )
+        if any(key[1].startswith("https") for key in sessions):
+            # Give SSL transports a moment to shut down cleanly
+            await asyncio.sleep(0.25)
+        self.close_sync()
+
+    def close_sync(self) -> None:
+        """Close the synchronous sessions."""
+        with self._lock:
+            sessions = list(self._sync_sessions.values())
+            self._sync_sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with the number of pooled sessions per kind
+        """
+        with self._lock:
+            origins = {key[1] for key in self._sessions}
+            origins.update(key[0] for key in self._sync_sessions)
+            return {
+                "aiohttp_sessions": len(self._sessions),
+                "httpx_clients": len(self._httpx_clients),
+                "sync_sessions": len(self._sync_sessions),
+                "origins": sorted(origins),
+            }
+
+    def _discard_stale(self) -> None:
+        """Drop sessions that were closed or whose loop is gone; lock held."""
+        for key, loop in list(self._loops.items()):
+            session = self._sessions.get(key) or self._httpx_clients.get(key)
+            closed = getattr(session, "closed", None)
+            if closed is None:
+                closed = getattr(session, "is_closed", True)
+            if closed or loop.is_closed():
+                self._sessions.pop(key, None)
+                self._httpx_clients.pop(key, None)
+                del self._loops[key]
+
+
+_manager = TransportManager()
+atexit.register(_manager.close_sync)
+
+
+def get_transport_manager() -> TransportManager:
+    """Get the process-wide transport manager.
+
+    Returns:
+        Transport manager
+    """
+    return _manager
+
+
+async def close_transports() -> None:
+    """Gracefully close the process-wide pooled sessions."""
+    await _manager.close()
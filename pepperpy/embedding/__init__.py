@@ -4,6 +4,9 @@
 Module for text embedding operations in the PepperPy framework.
 """
 
+# Batching
+from pepperpy.embedding.batching import EmbeddingBatcher
+
 # Results
 from pepperpy.embedding.result import EmbeddingResult, SimilarityResult
 
@@ -11,6 +14,8 @@
 from pepperpy.embedding.tasks import Embedding, Similarity
 
 __all__ = [
+    # Batching
+    "EmbeddingBatcher",
     # Results
     "EmbeddingResult",
     "SimilarityResult",
@@ -0,0 +1,206 @@
+"""
+PepperPy Embedding Batching.
+
+Async micro-batching for embedding requests: concurrent single-text calls are
+collected for a few milliseconds (or until a size/token limit is reached) and
+sent to the backend as one batched request.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pepperpy.core.errors import EmbeddingError
+from pepperpy.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+EmbedBatchFunction = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+@dataclass
+class _PendingEmbedding:
+    """A text waiting to be embedded."""
+
+    text: str
+    tokens: int
+    future: asyncio.Future[list[float]]
+
+
+class EmbeddingBatcher:
+    """Collects concurrent embedding requests into batched backend calls.
+
+    A batch is flushed when it reaches ``max_batch_size`` texts or
+    ``max_batch_tokens`` estimated tokens, or ``max_wait`` seconds after its
+    first text arrived, whichever comes first. Identical texts within a batch
+    are sent once. Results (or the batch error) are fanned back to each
+    waiting caller.
+
+    Example:
+        ```python
+        batcher = EmbeddingBatcher(provider.get_embeddings, max_batch_size=64)
+        vectors = await asyncio.gather(*(batcher.embed(t) for t in texts))
+        ```
+    """
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFunction,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        max_batch_tokens: int | None = None,
+        count_tokens: Callable[[str], int] | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embed_batch: Function embedding a list of texts in one call
+            max_batch_size: Maximum number of texts per batch
+            max_wait: Maximum seconds to wait for a batch to fill
+            max_batch_tokens: Optional maximum estimated tokens per batch
+            count_tokens: Optional token counter (defaults to len(text) // 4)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_batch_tokens = max_batch_tokens
+        self._count_tokens = count_tokens or (lambda text: max(1, len(text) // 4))
+
+        self._pending: list[_PendingEmbedding] = []
+        self._pending_tokens = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+        self._batches = 0
+        self._items = 0
+        self._deduplicated = 0
+        self._total_latency = 0.0
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text, sharing a backend call with concurrent callers.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            EmbeddingError: If the batched call fails
+        """
+        loop = asyncio.get_running_loop()
+        tokens = self._count_tokens(text)
+
+        # Flush first if this text would push the batch over its token limit
+        if (
+            self.max_batch_tokens is not None
+            and self._pending
+            and self._pending_tokens + tokens > self.max_batch_tokens
+        ):
+            self._flush()
+
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append(_PendingEmbedding(text, tokens, future))
+        self._pending_tokens += tokens
+
+        if len(self._pending) >= self.max_batch_size or (
+            self.max_batch_tokens is not None
+            and self._pending_tokens >= self.max_batch_tokens
+        ):
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts through the batcher.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        """Send the pending batch to the backend."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Callers that gave up before the flush are dropped from the batch
+        batch = [item for item in self._pending if not item.future.done()]
+        self._pending = []
+        self._pending_tokens = 0
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: list[_PendingEmbedding]) -> None:
+        """Execute one batched call and resolve the waiting futures.
+
+        Args:
+            batch: Pending embeddings to resolve
+        """
+        unique_texts = list(dict.fromkeys(item.text for item in batch))
+        start = time.monotonic()
+
+        try:
+            vectors = await self._embed_batch(unique_texts)
+            if len(vectors) != len(unique_texts):
+                raise EmbeddingError(
+                    f"Embedding backend returned {len(vectors)} vectors "
+                    f"for {len(unique_texts)} texts"
+                )
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(unique_texts)} texts failed: {e}")
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        self._batches += 1
+        self._items += len(batch)
+        self._deduplicated += len(batch) - len(unique_texts)
+        self._total_latency += time.monotonic() - start
+
+        by_text = dict(zip(unique_texts, vectors, strict=True))
+        for item in batch:
+            if not item.future.done():
+                item.future.set_result(by_text[item.text])
+
+    async def flush(self) -> None:
+        """Flush pending texts and wait for all in-flight batches."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush outstanding work; the batcher can still be reused after."""
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "batches": self._batches,
+            "items": self._items,
+            "deduplicated": self._deduplicated,
+            "average_batch_size": self._items / self._batches if self._batches else 0.0,
+            "average_batch_latency": (
+                self._total_latency / self._batches if self._batches else 0.0
+            ),
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,123 @@
+"""
+PepperPy Embedding Testing Utilities.
+
+A deterministic, in-process fake embedding endpoint for exercising batching,
+caching and retrieval code without network access or API spend.
+"""
+
+import asyncio
+import hashlib
+import math
+import struct
+
+from pepperpy.core.errors import EmbeddingError
+
+
+class FakeEmbeddingEndpoint:
+    """Deterministic fake embedding backend.
+
+    Vectors are derived from a SHA-256 stream of the text, so the same text
+    always maps to the same unit-length vector across runs and processes.
+    Every call is recorded, which makes it easy to assert how requests were
+    batched.
+
+    Example:
+        ```python
+        endpoint = FakeEmbeddingEndpoint(dimensions=8, latency=0.01)
+        batcher = EmbeddingBatcher(endpoint.embed_batch, max_batch_size=16)
+        await asyncio.gather(*(batcher.embed(t) for t in texts))
+        assert endpoint.batch_sizes == [16, 4]
+        ```
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 16,
+        latency: float = 0.0,
+        per_item_latency: float = 0.0,
+        max_batch_size: int | None = None,
+        fail_on: set[str] | None = None,
+    ) -> None:
+        """Initialize the fake endpoint.
+
+        Args:
+            dimensions: Size of the returned vectors
+            latency: Fixed seconds of simulated latency per call
+            per_item_latency: Additional simulated seconds per text
+            max_batch_size: Optional batch size limit enforced like a real API
+            fail_on: Texts that make the whole call fail
+        """
+        self.dimensions = dimensions
+        self.latency = latency
+        self.per_item_latency = per_item_latency
+        self.max_batch_size = max_batch_size
+        self.fail_on = fail_on or set()
+        self.calls: list[list[str]] = []
+
+    @property
+    def batch_sizes(self) -> list[int]:
+        """Sizes of the batches received so far."""
+        return [len(call) for call in self.calls]
+
+    def vector(self, text: str) -> list[float]:
+        """Compute the deterministic vector for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Unit-length embedding vector
+        """
+        values: list[float] = []
+        counter = 0
+        while len(values) < self.dimensions:
+            digest = hashlib.sha256(f"{counter}:{text}".encode()).digest()
+            for (raw,) in struct.iter_unpack(">I", digest):
+                values.append(raw / 0xFFFFFFFF * 2.0 - 1.0)
+            counter += 1
+        values = values[: self.dimensions]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per text
+
+        Raises:
+            EmbeddingError: If the batch is too large or contains a failing text
+        """
+        self.calls.append(list(texts))
+        if self.max_batch_size is not None and len(texts) > self.max_batch_size:
+            raise EmbeddingError(
+                f"Batch of {len(texts)} exceeds limit of {self.max_batch_size}"
+            )
+
+        delay = self.latency + self.per_item_latency * len(texts)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        failing = self.fail_on.intersection(texts)
+        if failing:
+            raise EmbeddingError(f"Simulated failure for: {sorted(failing)}")
+
+        return [self.vector(text) for text in texts]
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text as its own call.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        return (await self.embed_batch([text]))[0]
+
+    def reset(self) -> None:
+        """Forget recorded calls."""
+        self.calls.clear()
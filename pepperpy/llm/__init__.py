@@ -18,7 +18,43 @@
     create_llm_adapter,
 )
 from pepperpy.llm.base import LLMProvider, BaseLLMProvider
+from pepperpy.llm.batch import BatchResult, run_batch
+from pepperpy.llm.llamacpp import LlamaCppWorkerPool, LlamaPrefixCache
+from pepperpy.llm.prompts import (
+    PromptTemplate,
+    PromptTemplateError,
+    compile_template,
+    render_template,
+)
 from pepperpy.llm.provider import create_provider
+from pepperpy.llm.ratelimit import (
+    AdmissionController,
+    RateLimitExceededError,
+    TokenBucket,
+    get_admission_controller,
+)
+from pepperpy.llm.routing import RoutingPolicy, RoutingProvider
+from pepperpy.llm.streaming import (
+    SSEEvent,
+    StreamMetrics,
+    TokenStream,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+)
+from pepperpy.llm.tokenization import (
+    BPETokenizer,
+    HeuristicTokenizer,
+    HFTokenizer,
+    TokenCounter,
+    Tokenizer,
+    TokenizerError,
+    count_tokens,
+    count_tokens_many,
+    get_token_counter,
+    load_tokenizer,
+    register_tokenizer,
+)
 
 # Import provider implementations for registration
 try:
@@ -37,15 +73,46 @@
     pass
 
 __all__ = [
+    "AdmissionController",
     "AnthropicAdapter",
+    "BPETokenizer",
+    "BatchResult",
+    "HFTokenizer",
+    "HeuristicTokenizer",
     "LLMAdapter",
     "LLMAdapterError",
     "LLMProvider",
     "LLMProviderAdapter",
+    "LlamaCppWorkerPool",
+    "LlamaPrefixCache",
     "Message",
     "MessageRole",
     "OllamaAdapter",
     "OpenAIAdapter",
+    "PromptTemplate",
+    "PromptTemplateError",
+    "RateLimitExceededError",
+    "RoutingPolicy",
+    "RoutingProvider",
+    "SSEEvent",
+    "StreamMetrics",
+    "TokenBucket",
+    "TokenCounter",
+    "TokenStream",
+    "Tokenizer",
+    "TokenizerError",
+    "compile_template",
+    "count_tokens",
+    "count_tokens_many",
     "create_llm_adapter",
     "create_provider",
+    "get_admission_controller",
+    "get_token_counter",
+    "iter_ndjson",
+    "iter_sse_events",
+    "iter_sse_json",
+    "load_tokenizer",
+    "register_tokenizer",
+    "render_template",
+    "run_batch",
 ]
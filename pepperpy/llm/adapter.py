@@ -4,9 +4,10 @@
 Provides adapters for different LLM services.
 """
 
-import json
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from enum import Enum
 from typing import Any
 
@@ -15,12 +16,29 @@
 from pepperpy.core.context import get_current_context
 from pepperpy.core.logging import get_logger
 from pepperpy.core.observability import instrument, timed_operation
+from pepperpy.core.transport import get_transport_manager
 from pepperpy.llm.base import BaseLLMProvider
 from pepperpy.llm.base import Message as BaseMessage
+from pepperpy.llm.ratelimit import (
+    AdmissionTicket,
+    admission_limits_from_config,
+    get_admission_controller,
+)
+from pepperpy.llm.streaming import (
+    TokenStream,
+    iter_ndjson,
+    ollama_delta_content,
+)
+from pepperpy.llm.tokenization import count_tokens
 from pepperpy.plugin import PepperpyPlugin
 
 logger = get_logger(__name__)
 
+# Total tokens the vendor reported for the last adapter call in this context
+_reported_usage: ContextVar[int | None] = ContextVar(
+    "llm_adapter_reported_usage", default=None
+)
+
 
 class LLMAdapterError(PepperpyError):
     """Error raised by LLM adapters."""
@@ -319,6 +337,8 @@ async def generate_with_messages(
             # Make API call
             async with timed_operation("openai_api_call"):
                 completion = await self.client.chat.completions.create(**params)
+            usage = getattr(completion, "usage", None)
+            _reported_usage.set(getattr(usage, "total_tokens", None))
 
             # Extract and return response
             return completion.choices[0].message.content or ""
@@ -373,10 +393,14 @@ async def generate_stream(
             # Make API call
             stream = await self.client.chat.completions.create(**params)
 
-            # Yield chunks
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            # Yield chunks as they arrive; closing the stream on exit releases
+            # the HTTP response when the consumer stops early
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await _close_sdk_stream(stream)
 
         except Exception as e:
             logger.error(f"OpenAI stream generation failed: {e}")
@@ -478,6 +502,9 @@ async def generate_with_messages(
             # Make API call
             async with timed_operation("anthropic_api_call"):
                 completion = await self.client.messages.create(**params)
+            usage = getattr(completion, "usage", None)
+            if usage is not None:
+                _reported_usage.set(usage.input_tokens + usage.output_tokens)
 
             # Extract and return response
             return completion.content[0].text or ""
@@ -530,10 +557,13 @@ async def generate_stream(
             # Make API call
             stream = await self.client.messages.create(**params)
 
-            # Yield chunks
-            async for chunk in stream:
-                if chunk.type == "content_block_delta" and chunk.delta.text:
-                    yield chunk.delta.text
+            # Yield chunks as they arrive
+            try:
+                async for chunk in stream:
+                    if chunk.type == "content_block_delta" and chunk.delta.text:
+                        yield chunk.delta.text
+            finally:
+                await _close_sdk_stream(stream)
 
         except Exception as e:
             logger.error(f"Anthropic stream generation failed: {e}")
@@ -552,8 +582,9 @@ async def _initialize_client(self) -> None:
             # Get base URL from config
             self.base_url = self.config.get("base_url", "http://localhost:11434")
 
-            # Create client
-            self.client = httpx.AsyncClient(base_url=self.base_url, timeout=60.0)
+            # Pooled client shared by adapters talking to the same server
+            self.client = get_transport_manager().get_httpx_client(self.base_url)
+            self.timeout = httpx.Timeout(60.0, connect=10.0)
 
             # Set default model if not provided
             if not self.model:
@@ -569,9 +600,11 @@ async def _initialize_client(self) -> None:
             raise LLMAdapterError(f"Failed to initialize Ollama client: {e}") from e
 
     async def _cleanup_client(self) -> None:
-        """Clean up the Ollama client."""
-        if hasattr(self, "client"):
-            await self.client.aclose()
+        """Release the Ollama client.
+
+        The pooled client is owned by the transport manager and stays open.
+        """
+        self.client = None
 
     @instrument(name="ollama_generate_with_messages")
     async def generate_with_messages(
@@ -622,9 +655,15 @@ async def generate_with_messages(
 
             # Make API call
             async with timed_operation("ollama_api_call"):
-                response = await self.client.post("/api/generate", json=params)
+                response = await self.client.post(
+                    "/api/generate", json=params, timeout=self.timeout
+                )
                 response.raise_for_status()
                 result = response.json()
+            if "eval_count" in result:
+                _reported_usage.set(
+                    result.get("prompt_eval_count", 0) + result["eval_count"]
+                )
 
             # Extract and return response
             return result.get("response", "")
@@ -677,26 +716,69 @@ async def generate_stream(
                 context.add_metadata("streaming", True)
 
             # Make API call
+            # The response context closes the connection if the consumer
+            # stops iterating before the model finishes
             async with self.client.stream(
-                "POST", "/api/generate", json=params
+                "POST", "/api/generate", json=params, timeout=self.timeout
             ) as response:
                 response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if not line.strip():
-                        continue
-
-                    try:
-                        chunk = json.loads(line)
-                        if "response" in chunk:
-                            yield chunk["response"]
-                    except json.JSONDecodeError:
-                        continue
+                async for chunk in iter_ndjson(response.aiter_lines()):
+                    content = ollama_delta_content(chunk)
+                    if content:
+                        yield content
+                    if chunk.get("done"):
+                        break
 
         except Exception as e:
             logger.error(f"Ollama stream generation failed: {e}")
             raise LLMAdapterError(f"Ollama stream generation failed: {e}") from e
 
 
+def _request_tokens(prompt_tokens: int, response: str, config: dict[str, Any]) -> int:
+    """Total tokens of a request, preferring the usage the vendor reported.
+
+    Args:
+        prompt_tokens: Estimated prompt tokens
+        response: Generated text
+        config: Adapter configuration
+
+    Returns:
+        Reported total tokens, or the prompt estimate plus the counted response
+    """
+    return _reported_usage.get() or prompt_tokens + _estimate_tokens(response, config)
+
+
+def _estimate_tokens(text: str, config: dict[str, Any]) -> int:
+    """Count the tokens in a text with the tokenizer configured for a model.
+
+    Args:
+        text: Text to analyze
+        config: Adapter configuration (``tokenizer`` or ``model`` selects the
+            tokenizer)
+
+    Returns:
+        Token count
+    """
+    return count_tokens(text, config.get("tokenizer") or config.get("model"))
+
+
+async def _close_sdk_stream(stream: Any) -> None:
+    """Close a vendor SDK stream, releasing its HTTP response.
+
+    Args:
+        stream: Stream object returned by an SDK client
+    """
+    close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if hasattr(result, "__await__"):
+            await result
+    except Exception as e:
+        logger.debug(f"Error closing SDK stream: {e}")
+
+
 def create_llm_adapter(
     provider: str, model: str | None = None, **config: Any
 ) -> LLMAdapter:
@@ -770,6 +852,77 @@ async def _cleanup_resources(self) -> None:
         if self.adapter:
             await self.adapter.cleanup()
 
+    @asynccontextmanager
+    async def _admit(
+        self, text: str, max_tokens: int | None, caller: str | None
+    ) -> AsyncIterator[AdmissionTicket | None]:
+        """Hold an admission slot for a request, if limits are configured.
+
+        Args:
+            text: Prompt text used to estimate token usage
+            max_tokens: Maximum number of tokens to generate
+            caller: Optional caller key for fair queuing
+
+        Yields:
+            Admission ticket, or None if no limits are configured
+        """
+        limits = admission_limits_from_config(self.config)
+        if limits is None:
+            yield None
+            return
+
+        controller = get_admission_controller(
+            self.config.get("provider", "openai"), self.config.get("model"), **limits
+        )
+        prompt_tokens = _estimate_tokens(text, self.config)
+        async with controller.admit(
+            prompt_tokens + (max_tokens or self.config.get("max_tokens") or 0),
+            caller=caller,
+            prompt_tokens=prompt_tokens,
+        ) as ticket:
+            yield ticket
+
+    async def _generate_admitted(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+        caller: str | None = None,
+    ) -> str:
+        """Generate text through the adapter within admission limits.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Optional temperature
+            max_tokens: Optional maximum number of tokens
+            stop_sequences: Optional stop sequences
+            caller: Optional caller key for fair queuing
+
+        Returns:
+            Generated text
+        """
+        if not self.adapter:
+            raise LLMAdapterError("LLM adapter not initialized")
+
+        text = f"{system_prompt or ''}\n{prompt}"
+        async with self._admit(text, max_tokens, caller) as ticket:
+            _reported_usage.set(None)
+            response = await self.adapter.generate(
+                prompt,
+                system_prompt,
+                temperature,
+                max_tokens,
+                stop_sequences,
+            )
+            if ticket is not None:
+                ticket.reconcile(
+                    _request_tokens(ticket.prompt_tokens, response, self.config)
+                )
+            return response
+
     async def complete(self, prompt: str, **kwargs: Any) -> str:
         """Complete a text prompt.
 
@@ -792,12 +945,13 @@ async def complete(self, prompt: str, **kwargs: Any) -> str:
         max_tokens = kwargs.pop("max_tokens", None)
         stop_sequences = kwargs.pop("stop_sequences", None)
 
-        return await self.adapter.generate(
+        return await self._generate_admitted(
             prompt,
             system_prompt,
             temperature,
             max_tokens,
             stop_sequences,
+            caller=kwargs.pop("caller", None),
         )
 
     async def chat(
@@ -844,13 +998,21 @@ async def chat(
         stop_sequences = kwargs.pop("stop_sequences", None)
         tools = kwargs.pop("tools", None)
 
-        return await self.adapter.generate_with_messages(
-            adapter_messages,
-            temperature,
-            max_tokens,
-            stop_sequences,
-            tools,
-        )
+        text = "\n".join(message.content for message in adapter_messages)
+        async with self._admit(text, max_tokens, kwargs.pop("caller", None)) as ticket:
+            _reported_usage.set(None)
+            response = await self.adapter.generate_with_messages(
+                adapter_messages,
+                temperature,
+                max_tokens,
+                stop_sequences,
+                tools,
+            )
+            if ticket is not None:
+                ticket.reconcile(
+                    _request_tokens(ticket.prompt_tokens, response, self.config)
+                )
+            return response
 
     async def embed(self, text: str, **kwargs: Any) -> list[float]:
         """Generate embeddings for text.
@@ -890,10 +1052,7 @@ async def generate(
         if not self.initialized:
             await self.initialize()
 
-        if not self.adapter:
-            raise LLMAdapterError("LLM adapter not initialized")
-
-        return await self.adapter.generate(
+        return await self._generate_admitted(
             prompt,
             system_prompt,
             temperature,
@@ -928,11 +1087,21 @@ async def generate_stream(
         if not self.adapter:
             raise LLMAdapterError("LLM adapter not initialized")
 
-        async for chunk in self.adapter.generate_stream(
-            prompt,
-            system_prompt,
-            temperature,
-            max_tokens,
-            stop_sequences,
-        ):
-            yield chunk
+        text = f"{system_prompt or ''}\n{prompt}"
+        async with self._admit(text, max_tokens, None) as ticket:
+            stream = TokenStream(
+                self.adapter.generate_stream(
+                    prompt,
+                    system_prompt,
+                    temperature,
+                    max_tokens,
+                    stop_sequences,
+                ),
+                name=f"{self.config.get('provider', 'llm')}_generate_stream",
+                count_tokens=lambda chunk: _estimate_tokens(chunk, self.config),
+            )
+            async with stream:
+                async for chunk in stream:
+                    yield chunk
+            if ticket is not None:
+                ticket.reconcile(ticket.prompt_tokens + stream.metrics.tokens)
@@ -0,0 +1,329 @@
+"""
+PepperPy LLM Batch Execution.
+
+Runs many LLM requests with bounded concurrency and per-item failure
+handling, for evaluations and bulk jobs. ``run_batch`` is the engine behind
+``LLMProvider.generate_many`` and ``LLMProvider.chat_many``:
+
+- requests are pulled lazily from an iterable or async iterable, so inputs
+  larger than memory are fine;
+- at most ``concurrency`` requests run at once, and in ordered mode at most
+  ``window`` results wait for a slow predecessor;
+- every item has its own timeout and retries with backoff; a rate-limit
+  error pauses the whole batch for the server's Retry-After instead of
+  letting every worker hit the limit;
+- failures are reported per item instead of aborting the batch;
+- with ``checkpoint`` set, finished items are appended to a JSONL file and
+  skipped when the batch is run again.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pepperpy.core.logging import get_logger
+from pepperpy.core.retry import (
+    RateLimitError,
+    RetryStrategy,
+    calculate_delay,
+    get_retry_after,
+)
+
+logger = get_logger(__name__)
+
+# Programming errors are not worth retrying
+_PERMANENT_ERRORS = (
+    TypeError,
+    ValueError,
+    KeyError,
+    AttributeError,
+    NotImplementedError,
+)
+
+
+@dataclass
+class BatchResult[T, R]:
+    """Outcome of one batch item.
+
+    Attributes:
+        index: Position of the request in the input
+        request: The request
+        result: Result if the item succeeded
+        error: Last error if the item failed
+        attempts: Number of attempts made
+        latency: Seconds spent on the item, including retries
+        from_checkpoint: Whether the result was restored from a checkpoint
+    """
+
+    index: int
+    request: T
+    result: R | None = None
+    error: BaseException | None = None
+    attempts: int = 0
+    latency: float = 0.0
+    from_checkpoint: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+def _request_key(index: int, request: Any) -> str:
+    """Checkpoint key of a request: its position and a digest of its content."""
+    payload = json.dumps(request, sort_keys=True, default=_json_default)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{index}:{digest}"
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for dataclasses, enums and other objects."""
+    if hasattr(value, "__dataclass_fields__"):
+        return {name: getattr(value, name) for name in value.__dataclass_fields__}
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def _is_rate_limit(error: BaseException) -> bool:
+    """Whether an error means the server is rate limiting us."""
+    if isinstance(error, RateLimitError):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return status == 429
+
+
+def _should_retry(error: BaseException) -> bool:
+    """Default retry policy: everything except programming errors."""
+    return not isinstance(error, _PERMANENT_ERRORS)
+
+
+class _Checkpoint:
+    """Append-only JSONL record of finished items."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        serialize: Callable[[Any], Any],
+        deserialize: Callable[[Any], Any],
+    ) -> None:
+        self.path = os.fspath(path)
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.done: dict[str, Any] = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line from an interrupted run
+                        continue
+                    self.done[entry["key"]] = entry["result"]
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Restore a finished item."""
+        if key not in self.done:
+            return False, None
+        return True, self.deserialize(self.done[key])
+
+    def record(self, key: str, result: Any) -> None:
+        """Record a finished item."""
+        entry = {"key": key, "result": self.serialize(result)}
+        self._file.write(json.dumps(entry, default=_json_default) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+async def run_batch[T, R](
+    func: Callable[[T], Awaitable[R]],
+    requests: Iterable[T] | AsyncIterable[T],
+    concurrency: int = 8,
+    timeout: float | None = None,
+    max_retries: int = 2,
+    retry_delay: float = 1.0,
+    max_retry_delay: float = 60.0,
+    ordered: bool = True,
+    window: int | None = None,
+    should_retry: Callable[[BaseException], bool] | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    serialize: Callable[[R], Any] | None = None,
+    deserialize: Callable[[Any], R] | None = None,
+) -> AsyncIterator[BatchResult[T, R]]:
+    """Run ``func`` over many requests.
+
+    Closing the returned iterator early cancels the items in flight.
+
+    Args:
+        func: Coroutine function processing one request
+        requests: Requests (iterable or async iterable)
+        concurrency: Maximum requests in flight
+        timeout: Per-attempt timeout in seconds
+        max_retries: Retries per item
+        retry_delay: Initial delay between retries in seconds
+        max_retry_delay: Maximum delay between retries in seconds
+        ordered: Yield results in input order instead of as completed
+        window: Ordered mode only: maximum results buffered behind a slow
+            item (defaults to ``4 * concurrency``)
+        should_retry: Decides whether an error is retried (default: all
+            but programming errors)
+        checkpoint: JSONL file recording finished items for resumption
+        serialize: Converts a result to JSON for the checkpoint
+        deserialize: Restores a result from the checkpoint
+
+    Yields:
+        One BatchResult per request
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    should_retry = should_retry or _should_retry
+    window = window or 4 * concurrency
+    store = (
+        _Checkpoint(
+            checkpoint, serialize or (lambda r: r), deserialize or (lambda r: r)
+        )
+        if checkpoint is not None
+        else None
+    )
+
+    source = _aiter(requests)
+    source_lock = asyncio.Lock()
+    results: asyncio.Queue[BatchResult[T, R] | None] = asyncio.Queue()
+    next_index = 0
+    next_to_yield = 0
+    yielded = asyncio.Condition()
+    # Monotonic time until which a rate limit pauses every worker
+    paused_until = 0.0
+
+    async def pull() -> tuple[int, T] | None:
+        nonlocal next_index
+        async with source_lock:
+            if ordered:
+                # Do not run too far ahead of the consumer
+                async with yielded:
+                    await yielded.wait_for(lambda: next_index < next_to_yield + window)
+            try:
+                request = await source.__anext__()
+            except StopAsyncIteration:
+                return None
+            index = next_index
+            next_index += 1
+            return index, request
+
+    async def process(index: int, request: T) -> BatchResult[T, R]:
+        nonlocal paused_until
+        item: BatchResult[T, R] = BatchResult(index, request)
+        key = _request_key(index, request) if store is not None else ""
+        if store is not None:
+            found, value = store.get(key)
+            if found:
+                item.result = value
+                item.from_checkpoint = True
+                return item
+
+        started = time.monotonic()
+        delay: float | None = None
+        while True:
+            wait = paused_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            item.attempts += 1
+            try:
+                item.result = await asyncio.wait_for(func(request), timeout)
+                item.error = None
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                item.error = e
+                if item.attempts > max_retries or not should_retry(e):
+                    break
+                delay = calculate_delay(
+                    item.attempts - 1,
+                    RetryStrategy.EXPONENTIAL_JITTER,
+                    retry_delay,
+                    2.0,
+                    delay,
+                    max_retry_delay,
+                )
+                retry_after = get_retry_after(e)
+                if retry_after is not None:
+                    delay = max(delay, min(retry_after, max_retry_delay))
+                if _is_rate_limit(e):
+                    # Back off the whole batch, not just this worker
+                    paused_until = max(paused_until, time.monotonic() + delay)
+                logger.debug(
+                    f"Batch item {index} failed ({e!r}), retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+        item.latency = time.monotonic() - started
+        if store is not None and item.ok:
+            store.record(key, item.result)
+        return item
+
+    async def worker() -> None:
+        while True:
+            pulled = await pull()
+            if pulled is None:
+                return
+            await results.put(await process(*pulled))
+
+    async def run_workers() -> None:
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        finally:
+            results.put_nowait(None)
+
+    runner = asyncio.create_task(run_workers())
+    pending: dict[int, BatchResult[T, R]] = {}
+    try:
+        while True:
+            item = await results.get()
+            if item is None:
+                break
+            if not ordered:
+                yield item
+                continue
+            pending[item.index] = item
+            while next_to_yield in pending:
+                ready = pending.pop(next_to_yield)
+                async with yielded:
+                    next_to_yield += 1
+                    yielded.notify_all()
+                yield ready
+        # Surface errors from the request source
+        await runner
+    finally:
+        if not runner.done():
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+        if store is not None:
+            store.close()
+
+
+async def _aiter[T](requests: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Iterate over a sync or async iterable asynchronously."""
+    if isinstance(requests, AsyncIterable):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
@@ -0,0 +1,768 @@
+"""
+PepperPy llama.cpp Worker Module.
+
+Runs llama.cpp inference on dedicated worker threads so generation never
+blocks the event loop. Each worker thread owns one model instance (llama.cpp
+contexts are not thread-safe) and pulls requests from a shared queue. Tokens
+are streamed back to the loop as they are sampled, and a cancelled or closed
+stream stops generation at the next token.
+
+Repeated prompt prefixes (system prompts, tool schemas) can be served from a
+prefix state cache, so only the new suffix of a prompt is evaluated.
+"""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import queue
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pepperpy.core.logging import get_logger
+from pepperpy.llm.base import LLMError
+
+logger = get_logger(__name__)
+
+ModelFactory = Callable[[], Any]
+
+_STOP = object()
+
+
+@dataclass
+class _InferenceRequest:
+    """A completion request handed to a worker thread."""
+
+    prompt: str
+    params: dict[str, Any]
+    loop: asyncio.AbstractEventLoop
+    output: asyncio.Queue[tuple[str, Any]]
+    slots: asyncio.Semaphore
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _PrefixEntry:
+    """A saved model state and the prompt tokens it was built from."""
+
+    key: str
+    tokens: tuple[int, ...]
+    boundaries: list[str]
+    size: int
+    state: Any = None
+
+
+def _common_prefix(a: Sequence[int], b: Sequence[int]) -> int:
+    """Length of the common prefix of two token sequences."""
+    limit = min(len(a), len(b))
+    for index in range(limit):
+        if a[index] != b[index]:
+            return index
+    return limit
+
+
+class LlamaPrefixCache:
+    """Bounded LRU of llama.cpp states keyed by prompt-prefix hashes.
+
+    After a prompt has been evaluated, the model state is saved and indexed
+    under a chained hash of every ``block_size``-token prefix of the prompt.
+    Before the next prompt is evaluated, the state with the longest matching
+    prefix is restored, and llama.cpp only evaluates the remaining suffix.
+    States are kept in RAM up to ``capacity_bytes``; when ``disk_dir`` is set,
+    states evicted from RAM spill to disk up to ``disk_capacity_bytes`` and
+    are reloaded on demand. Disk entries are pickled, so ``disk_dir`` must be
+    a trusted location.
+
+    The cache can be shared by identical model instances; it is thread-safe.
+    """
+
+    def __init__(
+        self,
+        capacity_bytes: int = 1 << 30,
+        max_entries: int = 16,
+        block_size: int = 64,
+        min_prefix_tokens: int | None = None,
+        disk_dir: str | None = None,
+        disk_capacity_bytes: int = 8 << 30,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity_bytes: Maximum total size of states kept in RAM
+            max_entries: Maximum number of states kept in RAM
+            block_size: Prefix granularity in tokens
+            min_prefix_tokens: Shortest prompt worth caching (defaults to
+                ``block_size``)
+            disk_dir: Optional directory for states evicted from RAM
+            disk_capacity_bytes: Maximum total size of states kept on disk
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.capacity_bytes = capacity_bytes
+        self.max_entries = max_entries
+        self.block_size = block_size
+        self.min_prefix_tokens = min_prefix_tokens or block_size
+        self.disk_dir = disk_dir
+        self.disk_capacity_bytes = disk_capacity_bytes
+
+        self._lock = threading.Lock()
+        self._ram: OrderedDict[str, _PrefixEntry] = OrderedDict()
+        self._disk: OrderedDict[str, _PrefixEntry] = OrderedDict()
+        self._index: dict[str, str] = {}
+        self._ram_bytes = 0
+        self._disk_bytes = 0
+
+        self._hits = 0
+        self._context_hits = 0
+        self._misses = 0
+        self._prompt_tokens = 0
+        self._reused_tokens = 0
+        self._restore_seconds = 0.0
+        self._seconds_saved = 0.0
+        self._seconds_per_token: float | None = None
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    def boundary_hashes(self, tokens: Sequence[int]) -> list[tuple[int, str]]:
+        """Hash every block-aligned prefix of a token sequence.
+
+        Args:
+            tokens: Prompt tokens
+
+        Returns:
+            ``(prefix_length, hash)`` pairs, shortest first
+        """
+        hashes: list[tuple[int, str]] = []
+        digest = b""
+        for end in range(self.block_size, len(tokens) + 1, self.block_size):
+            block = array("i", tokens[end - self.block_size : end]).tobytes()
+            digest = hashlib.blake2b(digest + block, digest_size=16).digest()
+            hashes.append((end, digest.hex()))
+        return hashes
+
+    def restore(self, model: Any, tokens: Sequence[int]) -> int:
+        """Restore the state with the longest prefix shared with a prompt.
+
+        Args:
+            model: llama.cpp model instance about to evaluate ``tokens``
+            tokens: Prompt tokens
+
+        Returns:
+            Number of prompt tokens that will not need evaluation
+        """
+        # Whatever is already in the model context is reused by llama.cpp
+        in_context = _common_prefix(list(getattr(model, "input_ids", ())), tokens)
+
+        entry = None
+        with self._lock:
+            for _, digest in reversed(self.boundary_hashes(tokens)):
+                key = self._index.get(digest)
+                if key is None:
+                    continue
+                candidate = self._ram.get(key) or self._disk.get(key)
+                if candidate is not None:
+                    entry = candidate
+                    break
+
+        matched = _common_prefix(entry.tokens, tokens) if entry else 0
+        if entry is None or matched <= in_context:
+            reused = in_context
+            with self._lock:
+                if reused:
+                    self._context_hits += 1
+                else:
+                    self._misses += 1
+        else:
+            start = time.monotonic()
+            try:
+                model.load_state(self._load_state(entry))
+            except Exception as e:
+                # A state evicted from disk meanwhile is just a miss
+                logger.warning(f"Failed to restore llama.cpp state: {e}")
+                with self._lock:
+                    self._misses += 1
+                return min(in_context, max(len(tokens) - 1, 0))
+            elapsed = time.monotonic() - start
+            reused = matched
+            with self._lock:
+                self._hits += 1
+                self._restore_seconds += elapsed
+            logger.debug(
+                f"Restored llama.cpp state for {matched}/{len(tokens)} prompt tokens"
+            )
+
+        # llama.cpp always evaluates at least one token to produce logits
+        return min(reused, max(len(tokens) - 1, 0))
+
+    def store(self, model: Any, tokens: Sequence[int]) -> None:
+        """Save the model state after it has evaluated a prompt.
+
+        Args:
+            model: llama.cpp model instance whose context starts with ``tokens``
+            tokens: Prompt tokens
+        """
+        if len(tokens) < self.min_prefix_tokens:
+            return
+        boundaries = self.boundary_hashes(tokens)
+        if not boundaries:
+            return
+        key = boundaries[-1][1]
+
+        with self._lock:
+            if key in self._ram:
+                self._ram.move_to_end(key)
+                return
+            if key in self._disk:
+                return
+
+        state = model.save_state()
+        size = int(getattr(state, "llama_state_size", 0)) or len(
+            getattr(state, "llama_state", b"")
+        )
+        entry = _PrefixEntry(
+            key=key,
+            tokens=tuple(tokens),
+            boundaries=[digest for _, digest in boundaries],
+            size=size,
+            state=state,
+        )
+
+        with self._lock:
+            self._ram[key] = entry
+            self._ram_bytes += size
+            for digest in entry.boundaries:
+                self._index[digest] = key
+            self._evict()
+
+    def record_prompt_eval(
+        self, evaluated_tokens: int, reused_tokens: int, seconds: float
+    ) -> None:
+        """Record how long a prompt took to evaluate.
+
+        The per-token evaluation cost is tracked as a moving average and used
+        to estimate the time saved by reused tokens.
+
+        Args:
+            evaluated_tokens: Prompt tokens actually evaluated
+            reused_tokens: Prompt tokens served from the cache or context
+            seconds: Time until the first generated token
+        """
+        with self._lock:
+            self._prompt_tokens += evaluated_tokens + reused_tokens
+            self._reused_tokens += reused_tokens
+            if evaluated_tokens >= self.block_size:
+                per_token = seconds / evaluated_tokens
+                self._seconds_per_token = (
+                    per_token
+                    if self._seconds_per_token is None
+                    else 0.8 * self._seconds_per_token + 0.2 * per_token
+                )
+            if self._seconds_per_token is not None:
+                self._seconds_saved += reused_tokens * self._seconds_per_token
+
+    def clear(self) -> None:
+        """Drop every cached state, including disk entries."""
+        with self._lock:
+            for key in list(self._disk):
+                self._remove_disk_files(key)
+            self._ram.clear()
+            self._disk.clear()
+            self._index.clear()
+            self._ram_bytes = 0
+            self._disk_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of statistics, including the estimated prompt
+            evaluation time saved
+        """
+        with self._lock:
+            return {
+                "entries": len(self._ram),
+                "bytes": self._ram_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "hits": self._hits,
+                "context_hits": self._context_hits,
+                "misses": self._misses,
+                "prompt_tokens": self._prompt_tokens,
+                "reused_tokens": self._reused_tokens,
+                "reuse_ratio": (
+                    self._reused_tokens / self._prompt_tokens
+                    if self._prompt_tokens
+                    else 0.0
+                ),
+                "restore_seconds": self._restore_seconds,
+                "estimated_seconds_saved": self._seconds_saved,
+            }
+
+    def _evict(self) -> None:
+        """Evict least recently used RAM entries; caller holds the lock."""
+        while self._ram and (
+            self._ram_bytes > self.capacity_bytes or len(self._ram) > self.max_entries
+        ):
+            _, entry = self._ram.popitem(last=False)
+            self._ram_bytes -= entry.size
+            if self.disk_dir and entry.size <= self.disk_capacity_bytes:
+                self._spill(entry)
+            else:
+                self._unindex(entry)
+
+        while self._disk and self._disk_bytes > self.disk_capacity_bytes:
+            _, entry = self._disk.popitem(last=False)
+            self._disk_bytes -= entry.size
+            self._remove_disk_files(entry.key)
+            self._unindex(entry)
+
+    def _spill(self, entry: _PrefixEntry) -> None:
+        """Write an evicted entry to disk; caller holds the lock."""
+        path = self._disk_path(entry.key)
+        try:
+            with open(f"{path}.state", "wb") as f:
+                pickle.dump(entry.state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(f"{path}.tokens", "wb") as f:
+                f.write(array("i", entry.tokens).tobytes())
+        except Exception as e:
+            logger.warning(f"Failed to spill llama.cpp state to disk: {e}")
+            self._remove_disk_files(entry.key)
+            self._unindex(entry)
+            return
+        entry.state = None
+        self._disk[entry.key] = entry
+        self._disk_bytes += entry.size
+
+    def _load_state(self, entry: _PrefixEntry) -> Any:
+        """Get an entry's state, reading it from disk if needed."""
+        with self._lock:
+            if entry.state is not None:
+                self._ram.move_to_end(entry.key)
+                return entry.state
+            self._disk.move_to_end(entry.key)
+        with open(f"{self._disk_path(entry.key)}.state", "rb") as f:
+            return pickle.load(f)
+
+    def _load_disk_index(self) -> None:
+        """Index states left on disk by a previous process."""
+        assert self.disk_dir is not None
+        for name in sorted(os.listdir(self.disk_dir)):
+            if not name.endswith(".tokens"):
+                continue
+            key = name[: -len(".tokens")]
+            path = self._disk_path(key)
+            try:
+                with open(f"{path}.tokens", "rb") as f:
+                    tokens = array("i")
+                    tokens.frombytes(f.read())
+                size = os.path.getsize(f"{path}.state")
+            except OSError:
+                continue
+            boundaries = [digest for _, digest in self.boundary_hashes(tokens)]
+            if not boundaries or boundaries[-1] != key:
+                # Written with a different block size
+                continue
+            entry = _PrefixEntry(key, tuple(tokens), boundaries, size)
+            self._disk[key] = entry
+            self._disk_bytes += size
+            for digest in boundaries:
+                self._index[digest] = key
+
+    def _unindex(self, entry: _PrefixEntry) -> None:
+        """Remove index entries pointing at an entry; caller holds the lock."""
+        for digest in entry.boundaries:
+            if self._index.get(digest) == entry.key:
+                del self._index[digest]
+
+    def _disk_path(self, key: str) -> str:
+        """Base path (without extension) of an entry on disk."""
+        assert self.disk_dir is not None
+        return os.path.join(self.disk_dir, key)
+
+    def _remove_disk_files(self, key: str) -> None:
+        """Delete the files of a disk entry."""
+        for extension in (".state", ".tokens"):
+            try:
+                os.remove(f"{self._disk_path(key)}{extension}")
+            except OSError:
+                pass
+
+
+class LlamaCppWorkerPool:
+    """Pool of llama.cpp model instances served by worker threads.
+
+    Concurrency equals the number of model instances: each instance generates
+    one completion at a time on its own thread. Up to ``max_queue`` further
+    requests may wait for a free instance; beyond that, submitters wait for
+    room (or fail after ``queue_timeout`` seconds).
+
+    Example:
+        ```python
+        pool = LlamaCppWorkerPool(
+            lambda: llama_cpp.Llama(model_path="model.gguf"), instances=2
+        )
+        await pool.start()
+        async for chunk in pool.stream("Hello", max_tokens=32):
+            print(chunk["choices"][0]["text"], end="")
+        await pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        model_factory: ModelFactory,
+        instances: int = 1,
+        max_queue: int = 32,
+        queue_timeout: float | None = None,
+        prefix_cache: LlamaPrefixCache | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            model_factory: Callable creating one model instance; it is called
+                on the worker thread so loading does not block the loop
+            instances: Number of model instances (and worker threads)
+            max_queue: Maximum number of requests waiting for an instance
+            queue_timeout: Optional seconds to wait for queue room
+            prefix_cache: Optional prompt-prefix state cache shared by the
+                model instances
+        """
+        if instances < 1:
+            raise ValueError("instances must be at least 1")
+        self.model_factory = model_factory
+        self.instances = instances
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.prefix_cache = prefix_cache
+
+        self._requests: queue.Queue[Any] = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._started = False
+
+        # Counters are updated from the worker threads
+        self._stats_lock = threading.Lock()
+        self._active = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._failed = 0
+
+    @property
+    def started(self) -> bool:
+        """Whether the worker threads are running."""
+        return self._started
+
+    async def start(self) -> None:
+        """Start the worker threads and wait for every model to load.
+
+        Raises:
+            LLMError: If a model instance fails to load
+        """
+        if self._started:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.instances + self.max_queue)
+        loaded: list[asyncio.Future[None]] = []
+
+        for index in range(self.instances):
+            ready: asyncio.Future[None] = loop.create_future()
+            thread = threading.Thread(
+                target=self._worker,
+                args=(loop, ready),
+                name=f"llama-cpp-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+            loaded.append(ready)
+
+        self._started = True
+        try:
+            await asyncio.gather(*loaded)
+        except Exception as e:
+            await self.close()
+            raise LLMError(f"Failed to load llama.cpp model: {e}") from e
+
+        logger.debug(f"Started {self.instances} llama.cpp worker(s)")
+
+    async def close(self) -> None:
+        """Cancel queued requests and stop the worker threads."""
+        if not self._started:
+            return
+        self._started = False
+
+        # Drain requests that never reached a worker
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _InferenceRequest):
+                item.cancelled.set()
+                item.output.put_nowait(("error", LLMError("Worker pool closed")))
+                item.slots.release()
+
+        for _ in self._threads:
+            self._requests.put(_STOP)
+        await asyncio.gather(
+            *(asyncio.to_thread(thread.join) for thread in self._threads)
+        )
+        self._threads.clear()
+
+    async def stream(
+        self, prompt: str, **params: Any
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream completion chunks for a prompt.
+
+        Closing the iterator (or cancelling the consuming task) stops the
+        generation on the worker at the next token.
+
+        Args:
+            prompt: Prompt text
+            **params: Parameters for ``Llama.create_completion``
+
+        Yields:
+            Raw llama.cpp completion chunks
+
+        Raises:
+            LLMError: If the pool is not started, the queue stays full past
+                ``queue_timeout``, or inference fails
+        """
+        slots = self._slots
+        if not self._started or slots is None:
+            raise LLMError("llama.cpp worker pool is not started")
+
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except TimeoutError as e:
+            raise LLMError(
+                f"llama.cpp queue full ({self.max_queue} waiting requests)"
+            ) from e
+
+        request = _InferenceRequest(
+            prompt=prompt,
+            params=params,
+            loop=asyncio.get_running_loop(),
+            output=asyncio.Queue(),
+            slots=slots,
+        )
+        # From here on the slot is released by whoever drops the request: the
+        # worker once it is done with it, or close() if it is still queued
+        self._requests.put(request)
+        try:
+            while True:
+                kind, payload = await request.output.get()
+                if kind == "chunk":
+                    yield payload
+                elif kind == "error":
+                    raise payload
+                else:
+                    return
+        finally:
+            request.cancelled.set()
+
+    async def complete(self, prompt: str, **params: Any) -> dict[str, Any]:
+        """Generate a full completion for a prompt.
+
+        Args:
+            prompt: Prompt text
+            **params: Parameters for ``Llama.create_completion``
+
+        Returns:
+            Dictionary with ``text``, ``finish_reason`` and ``completion_tokens``
+        """
+        parts: list[str] = []
+        finish_reason = None
+        tokens = 0
+        stream = self.stream(prompt, **params)
+        try:
+            async for chunk in stream:
+                choice = chunk["choices"][0]
+                parts.append(choice.get("text", ""))
+                finish_reason = choice.get("finish_reason") or finish_reason
+                tokens += 1
+        finally:
+            await stream.aclose()
+        return {
+            "text": "".join(parts),
+            "finish_reason": finish_reason,
+            "completion_tokens": tokens,
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get worker pool statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        with self._stats_lock:
+            stats: dict[str, Any] = {
+                "instances": self.instances,
+                "active": self._active,
+                "queued": self._requests.qsize(),
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "failed": self._failed,
+            }
+        if self.prefix_cache is not None:
+            stats["prefix_cache"] = self.prefix_cache.get_stats()
+        return stats
+
+    def _worker(
+        self, loop: asyncio.AbstractEventLoop, ready: asyncio.Future[None]
+    ) -> None:
+        """Worker thread body: load a model and serve requests until stopped.
+
+        Args:
+            loop: Event loop that owns the requests
+            ready: Future resolved once the model is loaded
+        """
+        try:
+            model = self.model_factory()
+        except Exception as e:
+            loop.call_soon_threadsafe(_resolve, ready, e)
+            return
+        loop.call_soon_threadsafe(_resolve, ready, None)
+
+        while True:
+            item = self._requests.get()
+            if item is _STOP:
+                break
+            self._serve(model, item)
+
+    def _serve(self, model: Any, request: _InferenceRequest) -> None:
+        """Run one request on a worker thread, then free its queue slot.
+
+        Args:
+            model: Model instance owned by this thread
+            request: Request to serve
+        """
+        try:
+            self._generate(model, request)
+        finally:
+            # The slot frees up only once this thread is done with the model
+            try:
+                request.loop.call_soon_threadsafe(request.slots.release)
+            except RuntimeError:
+                pass
+
+    def _generate(self, model: Any, request: _InferenceRequest) -> None:
+        """Generate a completion, streaming tokens to the request's loop.
+
+        Args:
+            model: Model instance owned by this thread
+            request: Request to serve
+        """
+        if request.cancelled.is_set():
+            with self._stats_lock:
+                self._cancelled += 1
+            return
+
+        def emit(kind: str, payload: Any = None) -> None:
+            try:
+                request.loop.call_soon_threadsafe(
+                    request.output.put_nowait, (kind, payload)
+                )
+            except RuntimeError:
+                # The owning loop is closed; nobody is listening any more
+                request.cancelled.set()
+
+        with self._stats_lock:
+            self._active += 1
+        try:
+            completion = self._create_completion(model, request)
+            try:
+                for chunk in completion:
+                    if request.cancelled.is_set():
+                        break
+                    emit("chunk", chunk)
+            finally:
+                close = getattr(completion, "close", None)
+                if close is not None:
+                    close()
+        except Exception as e:
+            with self._stats_lock:
+                self._failed += 1
+            emit("error", LLMError(f"llama.cpp inference failed: {e}"))
+            return
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+
+        with self._stats_lock:
+            if request.cancelled.is_set():
+                self._cancelled += 1
+            else:
+                self._completed += 1
+        emit("done")
+
+    def _create_completion(self, model: Any, request: _InferenceRequest) -> Any:
+        """Start a streaming completion on a model instance.
+
+        Args:
+            model: Model instance owned by the calling thread
+            request: Request being served
+
+        Returns:
+            Iterator of completion chunks
+        """
+        if self.prefix_cache is None:
+            return model.create_completion(
+                prompt=request.prompt, stream=True, **request.params
+            )
+        return self._cached_completion(model, request, self.prefix_cache)
+
+    def _cached_completion(
+        self, model: Any, request: _InferenceRequest, cache: LlamaPrefixCache
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a completion, reusing and saving prompt-prefix states.
+
+        Args:
+            model: Model instance owned by the calling thread
+            request: Request being served
+            cache: Prefix cache to consult
+
+        Yields:
+            Completion chunks
+        """
+        # Tokenized the same way create_completion does, so prefixes line up
+        tokens = model.tokenize(request.prompt.encode("utf-8"), special=True)
+        reused = cache.restore(model, tokens)
+
+        start = time.monotonic()
+        completion = model.create_completion(
+            prompt=tokens, stream=True, **request.params
+        )
+        first = True
+        try:
+            for chunk in completion:
+                if first:
+                    first = False
+                    cache.record_prompt_eval(
+                        len(tokens) - reused, reused, time.monotonic() - start
+                    )
+                yield chunk
+        finally:
+            completion.close()
+
+        if not request.cancelled.is_set():
+            cache.store(model, tokens)
+
+
+def _resolve(future: asyncio.Future[None], error: BaseException | None) -> None:
+    """Resolve a readiness future from the loop thread."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
@@ -0,0 +1,250 @@
+"""
+PepperPy LLM Load Testing.
+
+Open-loop load generator for ``LLMProvider`` implementations. Requests are
+issued on a fixed (or Poisson) arrival schedule regardless of how fast
+earlier requests complete, and latency is measured from each request's
+scheduled start. This avoids coordinated omission: a slow server cannot
+make the test send less load or hide queueing delay.
+
+Example:
+    ```python
+    async with MockLLMServer(MockServerConfig(tokens_per_second=100)) as server:
+        provider = OpenAIProvider(base_url=server.openai_base_url, api_key="mock")
+        await provider.initialize()
+        report = await run_load(provider, ["Hello"], rps=50, duration=30, stream=True)
+        print(report.format())
+    ```
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pepperpy.core.logging import get_logger
+from pepperpy.llm.provider import LLMProvider, Message
+
+logger = get_logger(__name__)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile.
+
+    Args:
+        values: Sorted values
+        q: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for no values)
+    """
+    if not values:
+        return 0.0
+    rank = max(1, min(len(values), round(q / 100 * len(values) + 0.5)))
+    return values[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    """Result of a load test.
+
+    Attributes:
+        target_rps: Requested arrival rate
+        duration: Seconds from the first request to the last completion
+        scheduled: Requests scheduled
+        completed: Requests that succeeded
+        dropped: Requests not sent because ``max_in_flight`` was reached
+        errors: Failed requests by exception type
+        latencies: Sorted end-to-end latencies of successful requests
+        first_token_latencies: Sorted time-to-first-token (streaming only)
+        output_tokens: Completion tokens reported by the provider
+    """
+
+    target_rps: float
+    duration: float
+    scheduled: int
+    completed: int
+    dropped: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    latencies: list[float] = field(default_factory=list)
+    first_token_latencies: list[float] = field(default_factory=list)
+    output_tokens: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        return self.completed / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Completion tokens per second."""
+        return self.output_tokens / self.duration if self.duration > 0 else 0.0
+
+    def latency_percentiles(self, first_token: bool = False) -> dict[str, float]:
+        """Latency summary in seconds.
+
+        Args:
+            first_token: Summarize time-to-first-token instead of total latency
+
+        Returns:
+            Mean, p50, p90, p95, p99 and max
+        """
+        values = self.first_token_latencies if first_token else self.latencies
+        return {
+            "mean": sum(values) / len(values) if values else 0.0,
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1] if values else 0.0,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Report as a JSON-serializable dictionary."""
+        result = {
+            "target_rps": self.target_rps,
+            "duration": self.duration,
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "errors": dict(self.errors),
+            "throughput": self.throughput,
+            "tokens_per_second": self.tokens_per_second,
+            "latency": self.latency_percentiles(),
+        }
+        if self.first_token_latencies:
+            result["first_token_latency"] = self.latency_percentiles(first_token=True)
+        return result
+
+    def format(self) -> str:
+        """Human-readable summary."""
+        lines = [
+            f"Requests: {self.scheduled} scheduled, {self.completed} ok, "
+            f"{sum(self.errors.values())} failed, {self.dropped} dropped",
+            f"Throughput: {self.throughput:.1f} req/s (target {self.target_rps:g}), "
+            f"{self.tokens_per_second:.1f} tokens/s",
+        ]
+        summaries = [("Latency", self.latency_percentiles())]
+        if self.first_token_latencies:
+            summaries.append(("TTFT", self.latency_percentiles(first_token=True)))
+        for label, stats in summaries:
+            lines.append(
+                f"{label} (ms): "
+                + ", ".join(f"{k}={v * 1000:.1f}" for k, v in stats.items())
+            )
+        for name, count in self.errors.most_common():
+            lines.append(f"  {name}: {count}")
+        return "\n".join(lines)
+
+
+async def run_load(
+    provider: LLMProvider,
+    prompts: Iterable[str | list[Message]],
+    rps: float,
+    duration: float,
+    stream: bool = False,
+    arrival: str = "constant",
+    max_in_flight: int = 1000,
+    timeout: float | None = None,
+    seed: int = 0,
+    **kwargs: Any,
+) -> LoadReport:
+    """Drive a provider at a target request rate.
+
+    Args:
+        provider: Initialized provider
+        prompts: Prompts to send, cycled
+        rps: Target requests per second
+        duration: Seconds during which requests are issued
+        stream: Use ``provider.stream`` and record time-to-first-token
+        arrival: "constant" spacing or "poisson" arrivals
+        max_in_flight: Requests in flight before new arrivals are dropped
+        timeout: Optional per-request timeout in seconds
+        seed: Seed for Poisson arrivals
+        **kwargs: Generation options passed to the provider
+
+    Returns:
+        Load report
+    """
+    if rps <= 0:
+        raise ValueError("rps must be positive")
+    prompt_cycle = itertools.cycle(list(prompts))
+    rng = random.Random(seed)
+    report = LoadReport(target_rps=rps, duration=0.0, scheduled=0, completed=0)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def one(prompt: str | list[Message], scheduled_at: float) -> None:
+        try:
+            tokens, first_token = await asyncio.wait_for(
+                _call(provider, prompt, stream, scheduled_at, kwargs), timeout
+            )
+        except Exception as e:
+            report.errors[type(e).__name__] += 1
+            return
+        report.completed += 1
+        report.latencies.append(time.monotonic() - scheduled_at)
+        report.output_tokens += tokens
+        if first_token is not None:
+            report.first_token_latencies.append(first_token)
+
+    start = time.monotonic()
+    next_at = start
+    while next_at < start + duration:
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        report.scheduled += 1
+        if len(tasks) >= max_in_flight:
+            report.dropped += 1
+        else:
+            task = asyncio.create_task(one(next(prompt_cycle), next_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        gap = rng.expovariate(rps) if arrival == "poisson" else 1 / rps
+        next_at += gap
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    report.duration = time.monotonic() - start
+    report.latencies.sort()
+    report.first_token_latencies.sort()
+    logger.info(f"Load test finished: {report.to_dict()}")
+    return report
+
+
+async def _call(
+    provider: LLMProvider,
+    prompt: str | list[Message],
+    stream: bool,
+    scheduled_at: float,
+    kwargs: dict[str, Any],
+) -> tuple[int, float | None]:
+    """Send one request.
+
+    Returns:
+        Completion tokens and time-to-first-token (streaming only)
+    """
+    if not stream:
+        result = await provider.generate(prompt, **kwargs)
+        usage = result.usage or {}
+        return int(usage.get("completion_tokens", 0)), None
+
+    first_token: float | None = None
+    chunks = 0
+    source = provider.stream(prompt, **kwargs)
+    try:
+        async for chunk in source:
+            if chunk.content:
+                if first_token is None:
+                    first_token = time.monotonic() - scheduled_at
+                chunks += 1
+    finally:
+        # Stop the provider stream promptly when the request times out
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return chunks, first_token
@@ -8,7 +8,19 @@
 import argparse
 import asyncio
 import enum
-from collections.abc import AsyncIterator
+import functools
+import inspect
+import os
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any
 
@@ -17,13 +29,29 @@
 
 from pepperpy.core.errors import PepperpyError
 from pepperpy.core.logging import get_logger
+from pepperpy.embedding.batching import EmbeddingBatcher
 from pepperpy.llm.adapter import LLMProviderAdapter
 from pepperpy.llm.base import BaseLLMProvider
+from pepperpy.llm.batch import BatchResult, run_batch
+from pepperpy.llm.ratelimit import (
+    AdmissionController,
+    AdmissionTicket,
+    admission_limits_from_config,
+    get_admission_controller,
+)
+from pepperpy.llm.streaming import TokenStream, chat_completion_chunk
+from pepperpy.llm.tokenization import TokenCounter, get_token_counter
 from pepperpy.plugin.provider import BasePluginProvider
 from pepperpy.workflow.base import WorkflowComponent
 
 logger = get_logger(__name__)
 
+# Provider whose admission slot covers the code currently running, so nested
+# generate/stream calls on the same provider are not charged twice
+_admission_holder: ContextVar[Any] = ContextVar(
+    "llm_admission_holder", default=None
+)
+
 
 class MessageRole(str, enum.Enum):
     """Role of a message in a conversation."""
@@ -137,15 +165,143 @@ def __str__(self) -> str:
         return f"LLM process error: {self.message}"
 
 
+def _admission_messages(messages: Any) -> list[dict[str, str]]:
+    """Reduce ``generate``/``stream`` input to the chat dicts ``admit`` reads."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return [
+        {
+            "content": str(
+                msg.get("content") if isinstance(msg, dict) else msg.content or ""
+            )
+        }
+        for msg in messages
+    ]
+
+
+def _admitted_generate(
+    method: Callable[..., Awaitable["GenerationResult"]],
+) -> Callable[..., Awaitable["GenerationResult"]]:
+    """Run a provider's ``generate`` inside its admission limits."""
+
+    @functools.wraps(method)
+    async def generate(
+        self: "LLMProvider", messages: Any, **kwargs: Any
+    ) -> GenerationResult:
+        caller = kwargs.pop("caller", None)
+        if _admission_holder.get() is self:
+            return await method(self, messages, **kwargs)
+        async with self.admit(
+            _admission_messages(messages),
+            kwargs.get("model"),
+            kwargs.get("max_tokens"),
+            caller,
+        ) as ticket:
+            token = _admission_holder.set(self)
+            try:
+                result = await method(self, messages, **kwargs)
+            finally:
+                _admission_holder.reset(token)
+            if ticket is not None:
+                usage = result.usage or {}
+                if usage.get("total_tokens"):
+                    ticket.reconcile(usage["total_tokens"])
+                else:
+                    ticket.reconcile(
+                        ticket.prompt_tokens
+                        + self.get_token_counter().count(result.content or "")
+                    )
+        return result
+
+    generate.__admitted__ = True  # type: ignore[attr-defined]
+    return generate
+
+
+def _admitted_stream(
+    method: Callable[..., AsyncGenerator["GenerationChunk", None]],
+) -> Callable[..., AsyncIterator["GenerationChunk"]]:
+    """Run a provider's ``stream`` inside its admission limits."""
+
+    async def admitted(
+        self: "LLMProvider",
+        source: AsyncGenerator[GenerationChunk, None],
+        messages: Any,
+        kwargs: dict[str, Any],
+        caller: str | None,
+    ) -> AsyncIterator[GenerationChunk]:
+        async with self.admit(
+            _admission_messages(messages),
+            kwargs.get("model"),
+            kwargs.get("max_tokens"),
+            caller,
+        ) as ticket:
+            counter = self.get_token_counter()
+            tokens = 0
+            usage: dict[str, int] | None = None
+            try:
+                while True:
+                    # Hold the slot only while the provider code runs, never
+                    # across our own yield to the consumer
+                    token = _admission_holder.set(self)
+                    try:
+                        chunk = await source.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        _admission_holder.reset(token)
+                    tokens += counter.count(chunk.content or "")
+                    usage = (chunk.metadata or {}).get("usage") or usage
+                    yield chunk
+            finally:
+                await source.aclose()
+                if ticket is not None:
+                    if usage and usage.get("total_tokens"):
+                        ticket.reconcile(usage["total_tokens"])
+                    else:
+                        ticket.reconcile(ticket.prompt_tokens + tokens)
+
+    @functools.wraps(method)
+    def stream(
+        self: "LLMProvider", messages: Any, **kwargs: Any
+    ) -> AsyncIterator[GenerationChunk]:
+        caller = kwargs.pop("caller", None)
+        source = method(self, messages, **kwargs)
+        if _admission_holder.get() is self:
+            return source
+        return admitted(self, source, messages, kwargs, caller)
+
+    stream.__admitted__ = True  # type: ignore[attr-defined]
+    return stream
+
+
 class LLMProvider(BasePluginProvider, abc.ABC):
     """Base class for LLM providers.
 
     This class defines the interface that all LLM providers must implement.
     It includes methods for text generation, streaming, and embeddings.
+    Concrete ``generate`` and ``stream`` implementations are wrapped so every
+    call runs inside the provider's admission limits.
     """
 
     name: str = "base"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        generate = cls.__dict__.get("generate")
+        if (
+            inspect.iscoroutinefunction(generate)
+            and not getattr(generate, "__isabstractmethod__", False)
+            and not getattr(generate, "__admitted__", False)
+        ):
+            cls.generate = _admitted_generate(generate)  # type: ignore[method-assign,assignment]
+        stream = cls.__dict__.get("stream")
+        if (
+            inspect.isasyncgenfunction(stream)
+            and not getattr(stream, "__isabstractmethod__", False)
+            and not getattr(stream, "__admitted__", False)
+        ):
+            cls.stream = _admitted_stream(stream)  # type: ignore[method-assign]
+
     def __init__(
         self,
         name: str = "base",
@@ -162,6 +318,7 @@ def __init__(
         super().__init__(**(config or {}), **kwargs)
         self.name = name
         self.last_used = None
+        self._embedding_batcher: EmbeddingBatcher | None = None
 
     @property
     def api_key(self) -> str | None:
@@ -193,13 +350,15 @@ async def generate(
         raise NotImplementedError("generate must be implemented by provider")
 
     @abc.abstractmethod
-    async def stream(
+    def stream(
         self,
         messages: str | list[Message],
         **kwargs: Any,
     ) -> AsyncIterator[GenerationChunk]:
         """Generate text in a streaming fashion.
 
+        Implementations are async generators (``async def`` with ``yield``).
+
         Args:
             messages: String prompt or list of messages
             **kwargs: Additional generation options
@@ -231,6 +390,94 @@ async def get_embeddings(
         """
         raise NotImplementedError("get_embeddings must be implemented by provider")
 
+    async def get_embedding(self, text: str) -> list[float]:
+        """Generate the embedding for a single text.
+
+        Concurrent calls are micro-batched into shared ``get_embeddings``
+        requests. Batching is tuned with the ``embedding_batch_size``,
+        ``embedding_batch_wait`` (seconds) and ``embedding_batch_tokens``
+        configuration keys.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            LLMError: If embedding generation fails
+        """
+        if self._embedding_batcher is None:
+            self._embedding_batcher = EmbeddingBatcher(
+                self.get_embeddings,
+                max_batch_size=self.get_config("embedding_batch_size", 64),
+                max_wait=self.get_config("embedding_batch_wait", 0.005),
+                max_batch_tokens=self.get_config("embedding_batch_tokens"),
+                count_tokens=self.get_token_counter().count,
+            )
+        return await self._embedding_batcher.embed(text)
+
+    def get_admission_controller(
+        self, model: str | None = None
+    ) -> AdmissionController | None:
+        """Get the admission controller for this provider and model.
+
+        Limits are read from the ``max_concurrency``, ``requests_per_minute``,
+        ``tokens_per_minute`` and ``max_queue_wait`` configuration keys. The
+        controller is shared by every provider instance with the same name
+        and model.
+
+        Args:
+            model: Optional model name (defaults to the configured model)
+
+        Returns:
+            Admission controller, or None if no limits are configured
+        """
+        limits = admission_limits_from_config(self.config)
+        if limits is None:
+            return None
+        return get_admission_controller(
+            self.name, model or self.get_config("model"), **limits
+        )
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        max_tokens: int | None = None,
+        caller: str | None = None,
+    ) -> AsyncIterator[AdmissionTicket | None]:
+        """Hold an admission slot for a request to this provider.
+
+        The request is charged with its estimated prompt tokens plus
+        ``max_tokens``; callers should reconcile the ticket with the actual
+        usage once it is known.
+
+        Args:
+            messages: Chat messages of the request
+            model: Optional model name
+            max_tokens: Maximum number of tokens to generate
+            caller: Optional caller key for fair queuing
+
+        Yields:
+            Admission ticket, or None if no limits are configured
+        """
+        controller = self.get_admission_controller(model)
+        if controller is None:
+            yield None
+            return
+
+        prompt = "\n".join(str(msg.get("content") or "") for msg in messages)
+        prompt_tokens = await self.estimate_tokens(prompt)
+        completion_budget = max_tokens or self.get_config("max_tokens") or 0
+        async with controller.admit(
+            prompt_tokens + completion_budget,
+            caller=caller,
+            prompt_tokens=prompt_tokens,
+        ) as ticket:
+            yield ticket
+
     def get_capabilities(self) -> dict[str, Any]:
         """Get provider capabilities.
 
@@ -251,7 +498,8 @@ async def initialize(self) -> None:
 
     async def cleanup(self) -> None:
         """Clean up provider resources."""
-        pass
+        if self._embedding_batcher is not None:
+            await self._embedding_batcher.close()
 
     async def summarize(
         self,
@@ -336,7 +584,40 @@ async def get_chat_completion(
         Returns:
             Dictionary containing the response and other metadata
         """
-        # Convert dictionaries to Message objects
+        msg_objects = self._convert_chat_messages(messages)
+        caller = kwargs.pop("caller", None)
+
+        # Generate response within the provider's admission limits
+        async with self.admit(messages, model, max_tokens, caller) as ticket:
+            token = _admission_holder.set(self)
+            try:
+                result = await self.generate(msg_objects, **kwargs)
+            finally:
+                _admission_holder.reset(token)
+            if ticket is not None and result.usage:
+                ticket.reconcile(result.usage.get("total_tokens"))
+
+        # Format response in OpenAI-like format
+        return {
+            "choices": [
+                {
+                    "message": {"role": "assistant", "content": result.content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": result.usage or {},
+            "model": model or "default",
+        }
+
+    def _convert_chat_messages(self, messages: list[dict[str, str]]) -> list[Message]:
+        """Convert chat message dictionaries to Message objects.
+
+        Args:
+            messages: List of message dictionaries with role and content
+
+        Returns:
+            List of Message objects
+        """
         msg_objects = []
         for msg in messages:
             # Handle function_call safely
@@ -359,20 +640,7 @@ async def get_chat_completion(
             )
             msg_objects.append(msg_obj)
 
-        # Generate response
-        result = await self.generate(msg_objects, **kwargs)
-
-        # Format response in OpenAI-like format
-        return {
-            "choices": [
-                {
-                    "message": {"role": "assistant", "content": result.content},
-                    "finish_reason": "stop",
-                }
-            ],
-            "usage": result.usage or {},
-            "model": model or "default",
-        }
+        return msg_objects
 
     async def stream_chat_completion(
         self,
@@ -387,7 +655,9 @@ async def stream_chat_completion(
         """Stream a chat completion for a list of messages.
 
         This method streams the response token by token instead of waiting for
-        the complete response.
+        the complete response. Chunks are pulled from ``stream`` only as the
+        caller consumes them, and closing this generator (for example by
+        breaking out of the loop) closes the upstream provider stream.
 
         Args:
             messages: List of message dictionaries with role and content
@@ -399,20 +669,65 @@ async def stream_chat_completion(
             **kwargs: Additional provider-specific parameters
 
         Yields:
-            Dictionaries containing partial responses and other metadata
+            OpenAI-style ``chat.completion.chunk`` dictionaries whose
+            ``choices[0].delta.content`` holds the text delta
         """
-        # Default implementation is to call get_chat_completion and yield once
-        response = await self.get_chat_completion(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-            stream=False,
-            stop=stop,
-            max_tokens=max_tokens,
+        msg_objects = self._convert_chat_messages(messages)
+        caller = kwargs.pop("caller", None)
+        options: dict[str, Any] = {
+            "temperature": temperature,
+            "top_p": top_p,
             **kwargs,
-        )
-        yield response
+        }
+        if model:
+            options["model"] = model
+        if stop:
+            options["stop"] = stop
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+
+        first = True
+        try:
+            # ``stream`` holds the admission slot and reconciles it with usage
+            source = self.stream(msg_objects, caller=caller, **options)
+            counter = self.get_token_counter()
+            stream = TokenStream(
+                source,
+                name=f"{self.name}_chat_stream",
+                count_tokens=lambda chunk: counter.count(chunk.content or ""),
+                labels={"provider": self.name},
+            )
+            async with stream:
+                async for chunk in stream:
+                    yield chat_completion_chunk(
+                        chunk.content,
+                        finish_reason=chunk.finish_reason,
+                        model=model,
+                        role="assistant" if first else None,
+                    )
+                    first = False
+        except NotImplementedError:
+            if not first:
+                raise
+            # Provider has no native streaming, fall back to a single chunk
+            response = await self.get_chat_completion(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                stream=False,
+                stop=stop,
+                max_tokens=max_tokens,
+                caller=caller,
+                **kwargs,
+            )
+            choice = response["choices"][0]
+            yield chat_completion_chunk(
+                choice["message"]["content"],
+                finish_reason=choice.get("finish_reason", "stop"),
+                model=response.get("model"),
+                role="assistant",
+            )
 
     # Simple helper methods (these have default implementations)
 
@@ -453,8 +768,131 @@ async def chat(
 
         return response["choices"][0]["message"]["content"]
 
+    # Batch methods
+
+    def generate_many(
+        self,
+        requests: Iterable[str | list[Message]] | AsyncIterable[str | list[Message]],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        max_retries: int = 2,
+        ordered: bool = True,
+        checkpoint: str | os.PathLike[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[BatchResult[str | list[Message], GenerationResult]]:
+        """Generate responses for many prompts.
+
+        Failures are reported per item; rate-limit errors pause the whole
+        batch for the server's Retry-After. Each item goes through the
+        admitted ``generate``, so the batch stays within the provider's
+        RPM/TPM limits; pass ``caller`` to queue it fairly against other
+        callers.
+
+        Example:
+            ```python
+            async for item in provider.generate_many(prompts, concurrency=16):
+                if item.ok:
+                    print(item.index, item.result.content)
+            ```
+
+        Args:
+            requests: Prompts or message lists (iterable or async iterable)
+            concurrency: Maximum requests in flight (defaults to the
+                ``max_concurrency`` config key, or 8)
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries per item
+            ordered: Yield results in input order instead of as completed
+            checkpoint: JSONL file recording finished items; rerunning the
+                batch with the same file skips them
+            **kwargs: Generation options passed to ``generate``
+
+        Returns:
+            Async iterator of BatchResult objects
+        """
+
+        async def generate_one(request: str | list[Message]) -> GenerationResult:
+            return await self.generate(request, **kwargs)
+
+        return run_batch(
+            generate_one,
+            requests,
+            concurrency=concurrency or self.get_config("max_concurrency") or 8,
+            timeout=timeout,
+            max_retries=max_retries,
+            ordered=ordered,
+            checkpoint=checkpoint,
+            serialize=lambda result: {
+                "content": result.content,
+                "usage": result.usage,
+                "metadata": result.metadata,
+            },
+            deserialize=lambda data: GenerationResult(
+                content=data["content"],
+                messages=[],
+                usage=data.get("usage"),
+                metadata=data.get("metadata"),
+            ),
+        )
+
+    def chat_many(
+        self,
+        prompts: Iterable[str] | AsyncIterable[str],
+        system_prompt: str | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        max_retries: int = 2,
+        ordered: bool = True,
+        checkpoint: str | os.PathLike[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[BatchResult[str, str]]:
+        """Run ``chat`` for many prompts.
+
+        See ``generate_many`` for the batch semantics; each item is admitted
+        through ``get_chat_completion``.
+
+        Args:
+            prompts: User prompts (iterable or async iterable)
+            system_prompt: Optional system prompt shared by every request
+            concurrency: Maximum requests in flight
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries per item
+            ordered: Yield results in input order instead of as completed
+            checkpoint: JSONL file recording finished items
+            **kwargs: Options passed to ``chat``
+
+        Returns:
+            Async iterator of BatchResult objects with response texts
+        """
+
+        async def chat_one(prompt: str) -> str:
+            return await self.chat(prompt, system_prompt=system_prompt, **kwargs)
+
+        return run_batch(
+            chat_one,
+            prompts,
+            concurrency=concurrency or self.get_config("max_concurrency") or 8,
+            timeout=timeout,
+            max_retries=max_retries,
+            ordered=ordered,
+            checkpoint=checkpoint,
+        )
+
     # Analysis methods
 
+    def get_token_counter(self) -> TokenCounter:
+        """Get the token counter for this provider's model.
+
+        The ``tokenizer`` config key (a registered name or a local tokenizer
+        path) takes precedence over the model name. Without a matching
+        tokenizer, counts fall back to a heuristic.
+
+        Returns:
+            Cached token counter
+        """
+        return get_token_counter(
+            self.get_config("tokenizer") or self.get_config("model")
+        )
+
     async def estimate_tokens(self, text: str) -> int:
         """Estimate the number of tokens in a text.
 
@@ -464,9 +902,18 @@ async def estimate_tokens(self, text: str) -> int:
         Returns:
             Estimated token count
         """
-        # Naive implementation that can be overridden by providers
-        # with more accurate token counting
-        return len(text.split()) + len(text) // 4
+        return self.get_token_counter().count(text)
+
+    async def count_tokens_many(self, texts: list[str]) -> list[int]:
+        """Count the tokens in several texts in one batch.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Token counts in input order
+        """
+        return self.get_token_counter().count_many(texts)
 
     # Metadata methods
 
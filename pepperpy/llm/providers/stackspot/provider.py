@@ -8,7 +8,9 @@
 
 from pepperpy.llm import LLMProvider
 from pepperpy.plugin import ProviderPlugin
+from pepperpy.core.auth import OAuthClientCredentials
 from pepperpy.core.errors import LLMError, AuthenticationError
+from pepperpy.core.transport import get_transport_manager
 
 class StackSpotAIProvider(LLMProvider, ProviderPlugin):
     """StackSpot AI LLM provider implementation using Knowledge Sources.
@@ -27,6 +29,7 @@ class StackSpotAIProvider(LLMProvider, ProviderPlugin):
     
     # Internal state
     _token: Optional[str] = None
+    _tokens: Optional[OAuthClientCredentials] = None
     _session: Optional[aiohttp.ClientSession] = None
     _initialized: bool = False
     _knowledge_source_slug: Optional[str] = None
@@ -56,7 +59,8 @@ async def initialize(self) -> None:
             
         self.logger.debug("Initializing StackSpot AI provider")
         
-        self._session = aiohttp.ClientSession()
+        # Pooled session shared with other clients of the StackSpot API
+        self._session = await get_transport_manager().get_session(self.api_url)
         
         # Authenticate to get token
         await self._authenticate()
@@ -68,54 +72,46 @@ async def initialize(self) -> None:
     
     async def cleanup(self) -> None:
         """Clean up resources."""
+        # The pooled session is owned by the transport manager
         if self._session:
-            await self._session.close()
             self._session = None
             self._token = None
+        if self._tokens:
+            await self._tokens.close()
+            self._tokens = None
         self._initialized = False
     
     async def _authenticate(self) -> None:
-        """Authenticate with StackSpot AI and get an access token."""
+        """Authenticate with StackSpot AI and get an access token.
+
+        The token manager refreshes the token in the background before it
+        expires and single-flights concurrent refreshes.
+        """
         if not self._session:
-            self._session = aiohttp.ClientSession()
-            
-        auth_endpoint = f"{self.auth_url}/{self.realm}/oidc/oauth/token"
-        payload = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'grant_type': 'client_credentials'
-        }
-        
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        
-        self.logger.info(f"Authenticating with StackSpot AI at {auth_endpoint}")
-        
+            self._session = await get_transport_manager().get_session(self.api_url)
+
+        if self._tokens is None:
+            self._tokens = OAuthClientCredentials(
+                f"{self.auth_url}/{self.realm}/oidc/oauth/token",
+                self.client_id,
+                self.client_secret,
+                name="stackspot",
+            )
+
+        self.logger.info(f"Authenticating with StackSpot AI at {self._tokens.token_url}")
         try:
-            async with self._session.post(auth_endpoint, data=payload, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    self.logger.error(f"Authentication failed with status {response.status}: {error_text}")
-                    raise AuthenticationError(f"Failed to authenticate with StackSpot AI: {error_text}")
-                
-                result = await response.json()
-                self._token = result.get('access_token')
-                
-                if not self._token:
-                    self.logger.error("No access token found in authentication response")
-                    raise AuthenticationError("No access token found in authentication response")
-                    
-                self.logger.info("Successfully authenticated with StackSpot AI")
-                self.logger.debug(f"Token: {self._token[:10]}...")
-        except Exception as e:
+            self._token = await self._tokens.get_token()
+        except AuthenticationError as e:
             self.logger.error(f"Error during authentication: {str(e)}")
             raise AuthenticationError(f"Error during StackSpot AI authentication: {str(e)}")
-    
+        self.logger.info("Successfully authenticated with StackSpot AI")
+
     async def _ensure_authenticated(self) -> None:
         """Ensure that we have a valid authentication token."""
-        if not self._token:
+        if self._tokens is None:
             await self._authenticate()
+        else:
+            self._token = await self._tokens.get_token()
     
     async def _setup_knowledge_source(self) -> None:
         """Set up a knowledge source for storing and retrieving information."""
@@ -0,0 +1,488 @@
+"""
+PepperPy LLM Rate Limiting Module.
+
+Admission control for LLM providers: a concurrency limit, token buckets for
+request and token quotas (RPM/TPM), and round-robin fair queuing across
+callers so one bursty caller cannot monopolize a provider.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from pepperpy.core.errors import PepperpyError
+from pepperpy.core.logging import get_logger
+from pepperpy.core.observability import create_histogram, get_metric
+
+logger = get_logger(__name__)
+
+DEFAULT_CALLER = "default"
+
+
+class RateLimitExceededError(PepperpyError):
+    """Raised when a request cannot be admitted within its wait budget."""
+
+    pass
+
+
+class TokenBucket:
+    """Asynchronous token bucket.
+
+    The bucket holds up to ``capacity`` units and refills continuously at
+    ``refill_rate`` units per second. Waiters are served in FIFO order. A
+    request larger than the capacity is admitted once the bucket is full and
+    leaves it in debt, so oversized requests are slowed down rather than
+    blocked forever.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        """Initialize a token bucket.
+
+        Args:
+            capacity: Maximum number of units the bucket can hold
+            refill_rate: Units added per second
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._level = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, amount: float) -> "TokenBucket":
+        """Create a bucket for a per-minute quota.
+
+        Args:
+            amount: Units allowed per minute
+
+        Returns:
+            Token bucket with a one-minute burst capacity
+        """
+        return cls(capacity=amount, refill_rate=amount / 60.0)
+
+    @property
+    def level(self) -> float:
+        """Current number of available units (negative when in debt)."""
+        self._refill()
+        return self._level
+
+    def _refill(self) -> None:
+        """Add the units accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._level = min(self.capacity, self._level + elapsed * self.refill_rate)
+            self._updated = now
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take units without waiting.
+
+        Args:
+            amount: Units to take
+
+        Returns:
+            True if the units were taken
+        """
+        if self._lock.locked():
+            # Respect queued waiters
+            return False
+        self._refill()
+        needed = min(amount, self.capacity)
+        if self._level >= needed:
+            self._level -= amount
+            return True
+        return False
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take units, waiting until enough are available.
+
+        Args:
+            amount: Units to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        async with self._lock:
+            needed = min(amount, self.capacity)
+            while True:
+                self._refill()
+                if self._level >= needed:
+                    self._level -= amount
+                    return time.monotonic() - start
+                await asyncio.sleep((needed - self._level) / self.refill_rate)
+
+    def adjust(self, delta: float) -> None:
+        """Return (positive) or charge (negative) units after the fact.
+
+        Used to reconcile an estimate with actual usage.
+
+        Args:
+            delta: Units to add back to the bucket
+        """
+        self._refill()
+        self._level = min(self.capacity, self._level + delta)
+
+
+@dataclass
+class AdmissionTicket:
+    """Handle for an admitted request.
+
+    Attributes:
+        caller: Caller the request was admitted for
+        estimated_tokens: Tokens charged at admission time
+        prompt_tokens: Estimated prompt part of ``estimated_tokens``
+        queue_wait: Seconds spent waiting for admission
+        actual_tokens: Tokens reported after the call, if reconciled
+    """
+
+    caller: str
+    estimated_tokens: int
+    prompt_tokens: int = 0
+    queue_wait: float = 0.0
+    actual_tokens: int | None = None
+    _controller: "AdmissionController | None" = field(default=None, repr=False)
+
+    def reconcile(self, actual_tokens: int | None) -> None:
+        """Correct the token charge with the actual usage.
+
+        Args:
+            actual_tokens: Tokens actually consumed (prompt plus completion)
+        """
+        if actual_tokens is None or self.actual_tokens is not None:
+            return
+        self.actual_tokens = actual_tokens
+        if self._controller is not None:
+            self._controller._reconcile(self.estimated_tokens, actual_tokens)
+
+
+class AdmissionController:
+    """Per-provider/per-model admission controller.
+
+    Combines three limits, each optional:
+
+    - ``max_concurrency``: requests in flight at once
+    - ``requests_per_minute``: request quota (token bucket)
+    - ``tokens_per_minute``: token quota (token bucket), charged with the
+      estimated prompt tokens plus ``max_tokens`` and reconciled with the
+      usage reported by the provider
+
+    Waiting callers are served round-robin by caller key, FIFO within a
+    caller.
+
+    Example:
+        ```python
+        controller = AdmissionController("openai", "gpt-4", max_concurrency=8,
+                                         requests_per_minute=500,
+                                         tokens_per_minute=90_000)
+        async with controller.admit(estimated_tokens=1200, caller="tenant-a") as t:
+            result = await provider.generate(messages)
+            t.reconcile(result.usage["total_tokens"])
+        ```
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str | None = None,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_queue_wait: float | None = None,
+    ) -> None:
+        """Initialize the admission controller.
+
+        Args:
+            provider: Provider name
+            model: Optional model name
+            max_concurrency: Maximum requests in flight
+            requests_per_minute: Request quota per minute
+            tokens_per_minute: Token quota per minute
+            max_queue_wait: Optional maximum seconds to wait for admission
+        """
+        self.provider = provider
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_queue_wait = max_queue_wait
+        self.request_bucket = (
+            TokenBucket.per_minute(requests_per_minute)
+            if requests_per_minute
+            else None
+        )
+        self.token_bucket = (
+            TokenBucket.per_minute(tokens_per_minute) if tokens_per_minute else None
+        )
+
+        self._in_flight = 0
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._rotation: deque[str] = deque()
+
+        self._admitted = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self.labels = {"provider": provider, "model": model or "default"}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted requests that have not finished."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a concurrency slot."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        estimated_tokens: int = 0,
+        caller: str | None = None,
+        prompt_tokens: int = 0,
+    ) -> AsyncIterator[AdmissionTicket]:
+        """Wait for admission and hold it for the duration of the block.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens plus max_tokens
+            caller: Caller key used for fair queuing
+            prompt_tokens: Estimated prompt tokens, kept on the ticket
+
+        Yields:
+            Admission ticket, used to reconcile actual token usage
+
+        Raises:
+            RateLimitExceededError: If ``max_queue_wait`` elapses first
+        """
+        caller = caller or DEFAULT_CALLER
+        start = time.monotonic()
+
+        try:
+            if self.max_queue_wait is not None:
+                await asyncio.wait_for(
+                    self._acquire(caller, estimated_tokens), self.max_queue_wait
+                )
+            else:
+                await self._acquire(caller, estimated_tokens)
+        except TimeoutError as e:
+            self._rejected += 1
+            raise RateLimitExceededError(
+                f"Admission to {self.provider}/{self.model or 'default'} timed out "
+                f"after {self.max_queue_wait}s",
+                code="rate_limited",
+            ) from e
+
+        wait = time.monotonic() - start
+        self._admitted += 1
+        self._total_wait += wait
+        _queue_wait_metric().observe(wait, {**self.labels, "caller": caller})
+
+        ticket = AdmissionTicket(
+            caller=caller,
+            estimated_tokens=estimated_tokens,
+            prompt_tokens=prompt_tokens,
+            queue_wait=wait,
+            _controller=self,
+        )
+        try:
+            yield ticket
+        finally:
+            self._release()
+
+    async def _acquire(self, caller: str, estimated_tokens: int) -> None:
+        """Acquire a concurrency slot and quota.
+
+        Args:
+            caller: Caller key
+            estimated_tokens: Tokens to charge
+        """
+        await self._acquire_slot(caller)
+        try:
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None and estimated_tokens > 0:
+                await self.token_bucket.acquire(estimated_tokens)
+        except BaseException:
+            self._release()
+            raise
+
+    async def _acquire_slot(self, caller: str) -> None:
+        """Wait for a concurrency slot in fair order.
+
+        Args:
+            caller: Caller key
+        """
+        if self.max_concurrency is None:
+            self._in_flight += 1
+            return
+
+        if self._in_flight < self.max_concurrency and not self.queued:
+            self._in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if caller not in self._waiters:
+            self._waiters[caller] = deque()
+            self._rotation.append(caller)
+        self._waiters[caller].append(future)
+
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Slot was granted while we were being cancelled; give it back
+                self._release()
+            else:
+                self._discard_waiter(caller, future)
+            raise
+
+    def _discard_waiter(self, caller: str, future: asyncio.Future[None]) -> None:
+        """Remove a cancelled waiter from the queues.
+
+        Args:
+            caller: Caller key
+            future: Waiter future
+        """
+        waiters = self._waiters.get(caller)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            pass
+        if not waiters:
+            del self._waiters[caller]
+            try:
+                self._rotation.remove(caller)
+            except ValueError:
+                pass
+
+    def _release(self) -> None:
+        """Release a concurrency slot and wake the next caller in rotation."""
+        self._in_flight -= 1
+        if self.max_concurrency is None:
+            return
+
+        while self._rotation and self._in_flight < self.max_concurrency:
+            caller = self._rotation.popleft()
+            waiters = self._waiters[caller]
+            future = waiters.popleft()
+            if waiters:
+                # Caller still has work queued; move it to the back
+                self._rotation.append(caller)
+            else:
+                del self._waiters[caller]
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def _reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Adjust the token bucket by the estimation error.
+
+        Args:
+            estimated_tokens: Tokens charged at admission
+            actual_tokens: Tokens actually used
+        """
+        if self.token_bucket is not None:
+            self.token_bucket.adjust(estimated_tokens - actual_tokens)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get admission statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "average_queue_wait": (
+                self._total_wait / self._admitted if self._admitted else 0.0
+            ),
+            "request_tokens_available": (
+                self.request_bucket.level if self.request_bucket else None
+            ),
+            "tokens_available": (
+                self.token_bucket.level if self.token_bucket else None
+            ),
+        }
+
+
+def _queue_wait_metric() -> Any:
+    """Get or create the queue wait histogram.
+
+    Returns:
+        Histogram metric
+    """
+    name = "llm_admission_queue_wait_seconds"
+    return get_metric(name) or create_histogram(
+        name, "Seconds LLM requests waited for admission"
+    )
+
+
+ADMISSION_CONFIG_KEYS = (
+    "max_concurrency",
+    "requests_per_minute",
+    "tokens_per_minute",
+    "max_queue_wait",
+)
+
+
+def admission_limits_from_config(config: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract admission limits from a provider configuration.
+
+    Args:
+        config: Provider configuration
+
+    Returns:
+        Keyword arguments for AdmissionController, or None if the
+        configuration sets no limit
+    """
+    limits = {
+        key: config[key] for key in ADMISSION_CONFIG_KEYS if config.get(key) is not None
+    }
+    if not any(key != "max_queue_wait" for key in limits):
+        return None
+    return limits
+
+
+_controllers: dict[tuple[str, str | None], AdmissionController] = {}
+
+
+def get_admission_controller(
+    provider: str,
+    model: str | None = None,
+    **limits: Any,
+) -> AdmissionController:
+    """Get the process-wide admission controller for a provider and model.
+
+    The first call for a provider/model pair creates the controller with the
+    given limits; later calls return the same instance so that all provider
+    objects talking to the same backend share one quota.
+
+    Args:
+        provider: Provider name
+        model: Optional model name
+        **limits: Limits passed to AdmissionController on creation
+
+    Returns:
+        Admission controller
+    """
+    key = (provider, model)
+    controller = _controllers.get(key)
+    if controller is None:
+        controller = AdmissionController(provider, model, **limits)
+        _controllers[key] = controller
+    return controller
+
+
+def reset_admission_controllers() -> None:
+    """Forget all process-wide admission controllers."""
+    _controllers.clear()
@@ -0,0 +1,536 @@
+"""
+PepperPy LLM Routing Module.
+
+A provider that spreads requests over several backend providers:
+
+- ordered fallback: a failed request moves on to the next healthy backend,
+- hedging: if the primary has not answered by its latency percentile (p95 by
+  default), a backup request is sent to the next backend and whichever
+  answers first wins; the loser is cancelled,
+- EWMA latency and error tracking per backend,
+- outlier ejection: backends with consecutive failures or latency far above
+  their peers are taken out of rotation for a growing cool-down period.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from pepperpy.core.logging import get_logger
+from pepperpy.core.observability import create_counter, create_histogram, get_metric
+from pepperpy.llm.provider import (
+    GenerationChunk,
+    GenerationResult,
+    LLMError,
+    LLMProvider,
+    Message,
+)
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class RoutingPolicy:
+    """Tuning knobs for a RoutingProvider.
+
+    Attributes:
+        strategy: ``"ordered"`` keeps the configured backend order,
+            ``"latency"`` prefers the backend with the lowest EWMA latency
+        hedge: Whether to send backup requests for slow primaries
+        hedge_percentile: Latency percentile after which a backup is sent
+        hedge_min_delay: Lower bound for the hedge delay in seconds
+        hedge_default_delay: Hedge delay used until enough samples exist
+            (None disables hedging for a backend until then)
+        max_hedges: Maximum number of backup requests per call
+        min_samples: Samples needed before the percentile is trusted
+        window: Number of recent latencies kept per backend
+        ewma_alpha: Smoothing factor for latency and error averages
+        eject_consecutive_failures: Failures in a row that eject a backend
+        eject_latency_factor: Eject a backend whose EWMA latency exceeds this
+            multiple of the median of its peers
+        ejection_time: Base ejection time in seconds (doubles per repeat)
+        max_ejection_time: Upper bound for the ejection time
+        max_ejected_fraction: Maximum fraction of backends ejected at once
+    """
+
+    strategy: str = "ordered"
+    hedge: bool = True
+    hedge_percentile: float = 0.95
+    hedge_min_delay: float = 0.05
+    hedge_default_delay: float | None = None
+    max_hedges: int = 1
+    min_samples: int = 20
+    window: int = 200
+    ewma_alpha: float = 0.2
+    eject_consecutive_failures: int = 5
+    eject_latency_factor: float = 3.0
+    ejection_time: float = 30.0
+    max_ejection_time: float = 300.0
+    max_ejected_fraction: float = 0.5
+
+
+@dataclass
+class BackendStats:
+    """Health and latency statistics of one backend."""
+
+    name: str
+    window: int = 200
+    latencies: deque[float] = field(default_factory=deque)
+    ewma_latency: float | None = None
+    ewma_error_rate: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    in_flight: int = 0
+    hedges_won: int = 0
+    ejections: int = 0
+    ejected_until: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Bound the latency window."""
+        self.latencies = deque(self.latencies, maxlen=self.window)
+
+    @property
+    def ejected(self) -> bool:
+        """Whether the backend is currently out of rotation."""
+        return time.monotonic() < self.ejected_until
+
+    def percentile(self, q: float) -> float | None:
+        """Latency percentile over the recent window.
+
+        Args:
+            q: Percentile between 0 and 1
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def record_success(self, latency: float, alpha: float) -> None:
+        """Record a successful request.
+
+        Args:
+            latency: Request latency in seconds
+            alpha: EWMA smoothing factor
+        """
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latencies.append(latency)
+        self.ewma_latency = (
+            latency
+            if self.ewma_latency is None
+            else alpha * latency + (1 - alpha) * self.ewma_latency
+        )
+        self.ewma_error_rate *= 1 - alpha
+
+    def record_failure(self, alpha: float) -> None:
+        """Record a failed request.
+
+        Args:
+            alpha: EWMA smoothing factor
+        """
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.ewma_error_rate = alpha + (1 - alpha) * self.ewma_error_rate
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the statistics to a dictionary.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "ewma_latency": self.ewma_latency,
+            "ewma_error_rate": self.ewma_error_rate,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "hedges_won": self.hedges_won,
+            "ejections": self.ejections,
+            "ejected": self.ejected,
+        }
+
+
+class RoutingProvider(LLMProvider):
+    """LLM provider routing requests across several backend providers.
+
+    Example:
+        ```python
+        router = RoutingProvider([primary, secondary], policy=RoutingPolicy())
+        result = await router.generate("Hello")
+        print(router.get_stats())
+        ```
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        backends: list[LLMProvider],
+        policy: RoutingPolicy | None = None,
+        name: str = "router",
+        config: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the routing provider.
+
+        Args:
+            backends: Backend providers in fallback order
+            policy: Routing policy (defaults to RoutingPolicy())
+            name: Provider name
+            config: Optional configuration dictionary
+            **kwargs: Additional configuration
+        """
+        if not backends:
+            raise ValueError("RoutingProvider needs at least one backend")
+        super().__init__(name=name, config=config, **kwargs)
+        self.backends = list(backends)
+        self.policy = policy or RoutingPolicy()
+
+        self._stats: list[BackendStats] = []
+        seen: set[str] = set()
+        for index, backend in enumerate(self.backends):
+            backend_name = getattr(backend, "name", None) or f"backend{index}"
+            if backend_name in seen:
+                backend_name = f"{backend_name}#{index}"
+            seen.add(backend_name)
+            self._stats.append(BackendStats(backend_name, window=self.policy.window))
+
+    async def initialize(self) -> None:
+        """Initialize every backend."""
+        if self.initialized:
+            return
+        await asyncio.gather(*(backend.initialize() for backend in self.backends))
+        self.initialized = True
+
+    async def cleanup(self) -> None:
+        """Clean up every backend."""
+        await asyncio.gather(
+            *(backend.cleanup() for backend in self.backends), return_exceptions=True
+        )
+        await super().cleanup()
+
+    async def generate(
+        self,
+        messages: str | list[Message],
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate text on the best available backend.
+
+        Args:
+            messages: String prompt or list of messages
+            **kwargs: Additional generation options
+
+        Returns:
+            GenerationResult from the backend that answered first
+
+        Raises:
+            LLMError: If every backend failed
+        """
+        return await self._route(
+            "generate", lambda backend: backend.generate(messages, **kwargs)
+        )
+
+    async def stream(
+        self,
+        messages: str | list[Message],
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationChunk]:
+        """Stream text from the best available backend.
+
+        Streams fall back to the next backend only if a backend fails before
+        producing its first chunk; once output has been yielded it is not
+        replayed from another backend. Streams are not hedged.
+
+        Args:
+            messages: String prompt or list of messages
+            **kwargs: Additional generation options
+
+        Yields:
+            GenerationChunk objects
+
+        Raises:
+            LLMError: If every backend failed before streaming
+        """
+        errors: list[str] = []
+        for index in self._candidates():
+            backend, stats = self.backends[index], self._stats[index]
+            start = time.monotonic()
+            stats.in_flight += 1
+            started = False
+            try:
+                source = backend.stream(messages, **kwargs)
+                try:
+                    async for chunk in source:
+                        if not started:
+                            started = True
+                            # Time to first chunk is the latency that matters
+                            self._record_success(index, time.monotonic() - start)
+                        yield chunk
+                finally:
+                    aclose = getattr(source, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+                if not started:
+                    self._record_success(index, time.monotonic() - start)
+                return
+            except Exception as e:
+                if started:
+                    self._record_failure(index)
+                    raise
+                self._record_failure(index)
+                errors.append(f"{stats.name}: {e}")
+                logger.warning(f"Backend {stats.name} failed to stream: {e}")
+            finally:
+                stats.in_flight -= 1
+
+        raise LLMError(f"All backends failed: {'; '.join(errors)}")
+
+    async def get_embeddings(
+        self,
+        texts: str | list[str],
+        **kwargs: Any,
+    ) -> list[list[float]]:
+        """Generate embeddings on the best available backend.
+
+        Args:
+            texts: String or list of strings to embed
+            **kwargs: Additional embedding options
+
+        Returns:
+            List of embedding vectors
+
+        Raises:
+            LLMError: If every backend failed
+        """
+        return await self._route(
+            "get_embeddings",
+            lambda backend: backend.get_embeddings(texts, **kwargs),
+            hedge=False,
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-backend routing statistics.
+
+        Returns:
+            Dictionary mapping backend names to their statistics
+        """
+        return {stats.name: stats.to_dict() for stats in self._stats}
+
+    async def _route(
+        self,
+        operation: str,
+        call: Callable[[LLMProvider], Awaitable[T]],
+        hedge: bool = True,
+    ) -> T:
+        """Run a call with fallback and hedging across backends.
+
+        Args:
+            operation: Operation name for logs and metrics
+            call: Function starting the call on a backend
+            hedge: Whether backup requests may be sent
+
+        Returns:
+            Result of the first successful call
+
+        Raises:
+            LLMError: If every backend failed
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        remaining = deque(self._candidates())
+        running: dict[asyncio.Task[T], tuple[int, float, bool]] = {}
+        errors: list[str] = []
+        hedges = 0
+
+        def launch(is_hedge: bool) -> None:
+            index = remaining.popleft()
+            task = asyncio.ensure_future(call(self.backends[index]))
+            running[task] = (index, time.monotonic(), is_hedge)
+            self._stats[index].in_flight += 1
+
+        launch(False)
+        try:
+            while running:
+                timeout = None
+                if hedge and self.policy.hedge and remaining:
+                    if hedges < self.policy.max_hedges:
+                        timeout = self._hedge_timeout(running)
+
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # The primary is slower than its percentile: send a backup
+                    hedges += 1
+                    launch(True)
+                    _routing_counter().increment(
+                        labels={"operation": operation, "event": "hedge"}
+                    )
+                    continue
+
+                for task in done:
+                    index, started, is_hedge = running.pop(task)
+                    self._stats[index].in_flight -= 1
+                    latency = time.monotonic() - started
+                    error = task.exception()
+                    if error is None:
+                        self._record_success(index, latency)
+                        if is_hedge:
+                            self._stats[index].hedges_won += 1
+                        _latency_histogram().observe(
+                            latency,
+                            {
+                                "operation": operation,
+                                "backend": self._stats[index].name,
+                            },
+                        )
+                        return task.result()
+
+                    self._record_failure(index)
+                    errors.append(f"{self._stats[index].name}: {error}")
+                    logger.warning(
+                        f"Backend {self._stats[index].name} failed {operation}: {error}"
+                    )
+
+                # Fall back to the next backend if nothing else is running
+                if not running and remaining:
+                    _routing_counter().increment(
+                        labels={"operation": operation, "event": "fallback"}
+                    )
+                    launch(False)
+        finally:
+            # Cancel the losers
+            for task, (index, _, _) in running.items():
+                task.cancel()
+                self._stats[index].in_flight -= 1
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        raise LLMError(f"All backends failed {operation}: {'; '.join(errors)}")
+
+    def _candidates(self) -> list[int]:
+        """Backend indexes in the order they should be tried.
+
+        Ejected backends are skipped; if every backend is ejected, all of
+        them are tried anyway rather than failing outright.
+
+        Returns:
+            Ordered backend indexes
+        """
+        order = list(range(len(self.backends)))
+        if self.policy.strategy == "latency":
+            order.sort(
+                key=lambda i: (
+                    self._stats[i].ewma_latency is None,
+                    self._stats[i].ewma_latency or 0.0,
+                )
+            )
+        healthy = [i for i in order if not self._stats[i].ejected]
+        return healthy or order
+
+    def _hedge_timeout(
+        self, running: dict[asyncio.Task[Any], tuple[int, float, bool]]
+    ) -> float | None:
+        """Seconds until the next backup request should be sent.
+
+        Args:
+            running: In-flight tasks with their backend index and start time
+
+        Returns:
+            Timeout, or None if the newest request should not be hedged
+        """
+        index, started, _ = max(running.values(), key=lambda item: item[1])
+        stats = self._stats[index]
+        if len(stats.latencies) >= self.policy.min_samples:
+            delay = stats.percentile(self.policy.hedge_percentile)
+        else:
+            delay = self.policy.hedge_default_delay
+        if delay is None:
+            return None
+        delay = max(delay, self.policy.hedge_min_delay)
+        return max(0.0, started + delay - time.monotonic())
+
+    def _record_success(self, index: int, latency: float) -> None:
+        """Record a success and check the backend for latency outliers."""
+        stats = self._stats[index]
+        stats.record_success(latency, self.policy.ewma_alpha)
+
+        peers = [
+            s.ewma_latency
+            for i, s in enumerate(self._stats)
+            if i != index and s.ewma_latency is not None and not s.ejected
+        ]
+        if (
+            peers
+            and stats.ewma_latency is not None
+            and len(stats.latencies) >= self.policy.min_samples
+        ):
+            median = sorted(peers)[len(peers) // 2]
+            if stats.ewma_latency > self.policy.eject_latency_factor * median:
+                self._eject(index, f"latency {stats.ewma_latency:.3f}s")
+
+    def _record_failure(self, index: int) -> None:
+        """Record a failure and eject the backend after too many in a row."""
+        stats = self._stats[index]
+        stats.record_failure(self.policy.ewma_alpha)
+        if stats.consecutive_failures >= self.policy.eject_consecutive_failures:
+            self._eject(index, f"{stats.consecutive_failures} consecutive failures")
+
+    def _eject(self, index: int, reason: str) -> None:
+        """Take a backend out of rotation for a while.
+
+        Args:
+            index: Backend index
+            reason: Reason for logs
+        """
+        stats = self._stats[index]
+        if stats.ejected:
+            return
+        ejected = sum(1 for s in self._stats if s.ejected)
+        if ejected + 1 > self.policy.max_ejected_fraction * len(self._stats):
+            return
+
+        duration = min(
+            self.policy.ejection_time * 2**stats.ejections,
+            self.policy.max_ejection_time,
+        )
+        stats.ejections += 1
+        stats.ejected_until = time.monotonic() + duration
+        # Start fresh when it returns, so old samples do not re-eject it
+        stats.consecutive_failures = 0
+        stats.latencies.clear()
+        stats.ewma_latency = None
+        _routing_counter().increment(labels={"backend": stats.name, "event": "eject"})
+        logger.warning(f"Ejected backend {stats.name} for {duration:.0f}s: {reason}")
+
+
+def _latency_histogram() -> Any:
+    """Get or create the routed request latency histogram."""
+    name = "llm_routing_latency_seconds"
+    return get_metric(name) or create_histogram(
+        name, "Latency of routed LLM requests by winning backend"
+    )
+
+
+def _routing_counter() -> Any:
+    """Get or create the routing event counter."""
+    name = "llm_routing_events_total"
+    return get_metric(name) or create_counter(
+        name, "Hedges, fallbacks and ejections performed by LLM routing"
+    )
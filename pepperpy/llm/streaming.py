@@ -0,0 +1,358 @@
+"""
+PepperPy LLM Streaming Module.
+
+Shared primitives for incremental token streaming: payload extractors for
+OpenAI-compatible SSE and Ollama NDJSON responses (the wire-format parsers
+live in ``pepperpy.core.streaming`` and are re-exported here), and a
+pull-based token stream that tracks time-to-first-token and throughput.
+"""
+
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pepperpy.core.logging import get_logger
+from pepperpy.core.observability import create_histogram, get_metric
+from pepperpy.core.streaming import (
+    SSE_DONE,
+    SSEEvent,
+    iter_lines,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+)
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "SSE_DONE",
+    "SSEEvent",
+    "StreamMetrics",
+    "TokenStream",
+    "chat_completion_chunk",
+    "iter_lines",
+    "iter_ndjson",
+    "iter_sse_events",
+    "iter_sse_json",
+    "ollama_delta_content",
+    "ollama_finish_reason",
+    "openai_delta_content",
+    "openai_finish_reason",
+]
+
+
+def openai_delta_content(payload: dict[str, Any]) -> str:
+    """Extract the text delta from an OpenAI-compatible stream chunk.
+
+    Args:
+        payload: Decoded chunk payload
+
+    Returns:
+        Text delta, or an empty string if the chunk carries none
+    """
+    choices = payload.get("choices") or []
+    if not choices:
+        return ""
+    choice = choices[0]
+    delta = choice.get("delta") or {}
+    # Legacy completion endpoints stream "text" instead of a delta
+    return delta.get("content") or choice.get("text") or ""
+
+
+def openai_finish_reason(payload: dict[str, Any]) -> str | None:
+    """Extract the finish reason from an OpenAI-compatible stream chunk.
+
+    Args:
+        payload: Decoded chunk payload
+
+    Returns:
+        Finish reason if present
+    """
+    choices = payload.get("choices") or []
+    if not choices:
+        return None
+    return choices[0].get("finish_reason")
+
+
+def ollama_delta_content(payload: dict[str, Any]) -> str:
+    """Extract the text delta from an Ollama stream object.
+
+    Handles both ``/api/generate`` (``response``) and ``/api/chat``
+    (``message.content``) payloads.
+
+    Args:
+        payload: Decoded NDJSON object
+
+    Returns:
+        Text delta, or an empty string if the object carries none
+    """
+    if "response" in payload:
+        return payload.get("response") or ""
+    message = payload.get("message") or {}
+    return message.get("content") or ""
+
+
+def ollama_finish_reason(payload: dict[str, Any]) -> str | None:
+    """Extract the finish reason from an Ollama stream object.
+
+    Args:
+        payload: Decoded NDJSON object
+
+    Returns:
+        Finish reason if the object marks the end of the stream
+    """
+    if not payload.get("done"):
+        return None
+    return payload.get("done_reason") or "stop"
+
+
+def chat_completion_chunk(
+    content: str,
+    finish_reason: str | None = None,
+    model: str | None = None,
+    role: str | None = None,
+) -> dict[str, Any]:
+    """Build an OpenAI-style ``chat.completion.chunk`` dictionary.
+
+    Args:
+        content: Text delta
+        finish_reason: Optional finish reason
+        model: Optional model name
+        role: Optional role, usually only set on the first chunk
+
+    Returns:
+        Chunk dictionary
+    """
+    delta: dict[str, Any] = {"content": content}
+    if role:
+        delta["role"] = role
+    return {
+        "object": "chat.completion.chunk",
+        "model": model or "default",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+@dataclass
+class StreamMetrics:
+    """Latency and throughput measurements for a single stream.
+
+    Attributes:
+        started_at: Monotonic time the stream was opened
+        first_token_at: Monotonic time the first non-empty chunk arrived
+        finished_at: Monotonic time the stream ended or was closed
+        chunks: Number of chunks received
+        tokens: Number of tokens received
+        cancelled: Whether the consumer closed the stream early
+    """
+
+    started_at: float = field(default_factory=time.monotonic)
+    first_token_at: float | None = None
+    finished_at: float | None = None
+    chunks: int = 0
+    tokens: int = 0
+    cancelled: bool = False
+
+    @property
+    def time_to_first_token(self) -> float | None:
+        """Seconds from opening the stream to the first token."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def duration(self) -> float:
+        """Seconds the stream has been (or was) open."""
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Decode throughput measured after the first token."""
+        if self.first_token_at is None or self.tokens < 2:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        elapsed = end - self.first_token_at
+        if elapsed <= 0:
+            return None
+        # The first token is accounted for by TTFT
+        return (self.tokens - 1) / elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a dictionary.
+
+        Returns:
+            Dictionary representation of the metrics
+        """
+        return {
+            "time_to_first_token": self.time_to_first_token,
+            "tokens_per_second": self.tokens_per_second,
+            "duration": self.duration,
+            "chunks": self.chunks,
+            "tokens": self.tokens,
+            "cancelled": self.cancelled,
+        }
+
+
+def _histogram(name: str, description: str) -> Any:
+    """Get or create a histogram metric.
+
+    Args:
+        name: Metric name
+        description: Metric description
+
+    Returns:
+        Histogram metric
+    """
+    return get_metric(name) or create_histogram(name, description)
+
+
+class TokenStream[T]:
+    """Pull-based async iterator over streamed LLM output.
+
+    The upstream iterator is only advanced when the consumer asks for the
+    next item, so a slow consumer naturally applies backpressure to the
+    network read instead of letting chunks pile up in memory. Closing the
+    stream (explicitly, via ``async with`` or by breaking out of an
+    ``async for`` inside one) closes the upstream generator, which in turn
+    releases the underlying HTTP response.
+
+    Example:
+        ```python
+        async with TokenStream(adapter.generate_stream(prompt)) as stream:
+            async for text in stream:
+                print(text, end="")
+        print(stream.metrics.time_to_first_token)
+        ```
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[T],
+        name: str = "llm_stream",
+        count_tokens: Callable[[T], int] | None = None,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize a token stream.
+
+        Args:
+            source: Upstream async iterator of chunks
+            name: Name used for metrics and logging
+            count_tokens: Optional function returning the token count of a chunk
+                (defaults to one token per non-empty chunk)
+            labels: Optional metric labels
+        """
+        self._source = source
+        self.name = name
+        self._count_tokens = count_tokens or _default_token_count
+        self.labels = {"stream": name, **(labels or {})}
+        self.metrics = StreamMetrics()
+        self._closed = False
+
+    def __aiter__(self) -> "TokenStream[T]":
+        """Return the stream itself."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Pull the next chunk from upstream.
+
+        Returns:
+            Next chunk
+
+        Raises:
+            StopAsyncIteration: When the stream is exhausted or closed
+        """
+        if self._closed:
+            raise StopAsyncIteration
+
+        try:
+            item = await self._source.__anext__()
+        except StopAsyncIteration:
+            self._finish(cancelled=False)
+            raise
+        except BaseException:
+            # Errors and task cancellation both release the upstream stream
+            await self.aclose()
+            raise
+
+        tokens = self._count_tokens(item)
+        self.metrics.chunks += 1
+        if tokens > 0:
+            if self.metrics.first_token_at is None:
+                self.metrics.first_token_at = time.monotonic()
+            self.metrics.tokens += tokens
+        return item
+
+    async def aclose(self) -> None:
+        """Close the stream and the upstream iterator."""
+        if self._closed:
+            return
+        self._finish(cancelled=True)
+        aclose = getattr(self._source, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                logger.debug(f"Error closing upstream stream {self.name}: {e}")
+
+    async def __aenter__(self) -> "TokenStream[T]":
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the async context, closing the stream."""
+        await self.aclose()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has finished or been closed."""
+        return self._closed
+
+    def _finish(self, cancelled: bool) -> None:
+        """Mark the stream as finished and record metrics.
+
+        Args:
+            cancelled: Whether the stream was closed before exhaustion
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.metrics.finished_at = time.monotonic()
+        self.metrics.cancelled = cancelled
+
+        ttft = self.metrics.time_to_first_token
+        if ttft is not None:
+            _histogram(
+                "llm_stream_time_to_first_token",
+                "Seconds from request to first streamed token",
+            ).observe(ttft, self.labels)
+
+        tps = self.metrics.tokens_per_second
+        if tps is not None:
+            _histogram(
+                "llm_stream_tokens_per_second",
+                "Streamed decode throughput in tokens per second",
+            ).observe(tps, self.labels)
+
+        logger.debug(
+            f"Stream {self.name} finished: chunks={self.metrics.chunks}, "
+            f"tokens={self.metrics.tokens}, ttft={ttft}, tps={tps}, "
+            f"cancelled={cancelled}"
+        )
+
+
+def _default_token_count(chunk: Any) -> int:
+    """Count one token per non-empty chunk.
+
+    Args:
+        chunk: Streamed chunk (str, GenerationChunk-like or dict)
+
+    Returns:
+        1 if the chunk carries text, 0 otherwise
+    """
+    if isinstance(chunk, str):
+        return 1 if chunk else 0
+    if isinstance(chunk, dict):
+        return 1 if openai_delta_content(chunk) else 0
+    return 1 if getattr(chunk, "content", None) else 0
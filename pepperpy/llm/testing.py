@@ -0,0 +1,571 @@
+"""
+PepperPy LLM Testing Utilities.
+
+A local mock LLM server speaking the OpenAI and Ollama HTTP APIs, for load
+and latency testing without network access or API spend. Outputs are
+deterministic: the completion for a prompt depends only on the prompt and the
+seed, and latency samples and injected failures depend only on the seed and
+the request order.
+
+Supported endpoints:
+
+- OpenAI: ``POST /v1/chat/completions``, ``POST /v1/completions`` (both with
+  SSE streaming), ``POST /v1/embeddings``, ``GET /v1/models``
+- Ollama: ``POST /api/chat``, ``POST /api/generate`` (NDJSON streaming),
+  ``POST /api/embed``, ``POST /api/embeddings``, ``GET /api/tags``
+
+Example:
+    ```python
+    config = MockServerConfig(
+        latency=LatencyModel("lognormal", mean=0.2, stddev=0.05),
+        tokens_per_second=50,
+        rate_limit_rate=0.05,
+    )
+    async with MockLLMServer(config) as server:
+        client = AsyncOpenAI(base_url=server.openai_base_url, api_key="mock")
+        ...
+    ```
+
+Run standalone with ``python -m pepperpy.llm.testing --port 8080``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+from pepperpy.core.logging import get_logger
+from pepperpy.embedding.testing import FakeEmbeddingEndpoint
+from pepperpy.llm.tokenization import count_tokens
+
+logger = get_logger(__name__)
+
+_VOCABULARY = (
+    "the of and to in is that for it as with was on be by this are from at or "
+    "an which have not has but were can all their more one its also been would "
+    "model data system pepper token request latency stream cache provider agent "
+    "workflow result value context answer question test mock server load"
+).split()
+
+
+@dataclass
+class LatencyModel:
+    """Distribution of the delay before a response starts.
+
+    Attributes:
+        distribution: "constant", "uniform", "normal", "lognormal" or
+            "exponential"
+        mean: Mean delay in seconds
+        stddev: Standard deviation in seconds (half-width for "uniform")
+        minimum: Lower bound of samples
+        maximum: Optional upper bound of samples
+    """
+
+    distribution: str = "constant"
+    mean: float = 0.0
+    stddev: float = 0.0
+    minimum: float = 0.0
+    maximum: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a delay.
+
+        Args:
+            rng: Random generator
+
+        Returns:
+            Delay in seconds
+        """
+        if self.distribution == "constant" or self.mean <= 0:
+            value = self.mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.stddev, self.mean + self.stddev)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.stddev)
+        elif self.distribution == "lognormal":
+            # Parameters of the underlying normal for the requested mean/stddev
+            sigma2 = math.log(1 + (self.stddev / self.mean) ** 2)
+            value = rng.lognormvariate(math.log(self.mean) - sigma2 / 2, sigma2**0.5)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / self.mean)
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+        value = max(self.minimum, value)
+        if self.maximum is not None:
+            value = min(self.maximum, value)
+        return value
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of the mock server.
+
+    Attributes:
+        latency: Delay before the first token (or the whole response)
+        tokens_per_second: Generation speed; 0 returns every token at once
+        completion_tokens: Tokens generated when the request sets no limit
+        error_rate: Fraction of requests failing with HTTP 500
+        rate_limit_rate: Fraction of requests rejected with HTTP 429
+        retry_after: Retry-After seconds sent with 429 responses
+        embedding_dimensions: Size of the returned embeddings
+        model: Model name reported by the server
+        seed: Seed for outputs, latency samples and injected failures
+    """
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    tokens_per_second: float = 0.0
+    completion_tokens: int = 32
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    embedding_dimensions: int = 16
+    model: str = "mock-model"
+    seed: int = 0
+
+
+class _InjectedError(Exception):
+    """Failure chosen by the error injection."""
+
+    def __init__(self, status: int, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class MockLLMServer:
+    """OpenAI/Ollama-compatible mock server running on the current loop."""
+
+    def __init__(
+        self,
+        config: MockServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            config: Server behaviour
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or MockServerConfig()
+        self.host = host
+        self.port = port
+        self.stats: Counter[str] = Counter()
+        self._requests = 0
+        self._embedder = FakeEmbeddingEndpoint(self.config.embedding_dimensions)
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (Ollama API root)."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        """Base URL for OpenAI-compatible clients."""
+        return f"{self.url}/v1"
+
+    async def start(self) -> str:
+        """Start serving.
+
+        Returns:
+            Base URL of the server
+        """
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._openai_chat)
+        app.router.add_post("/v1/completions", self._openai_completion)
+        app.router.add_post("/v1/embeddings", self._openai_embeddings)
+        app.router.add_get("/v1/models", self._openai_models)
+        app.router.add_post("/api/chat", self._ollama_chat)
+        app.router.add_post("/api/generate", self._ollama_generate)
+        app.router.add_post("/api/embed", self._ollama_embed)
+        app.router.add_post("/api/embeddings", self._ollama_embed)
+        app.router.add_get("/api/tags", self._ollama_tags)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        logger.info(f"Mock LLM server listening on {self.url}")
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockLLMServer":
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    def completion(self, prompt: str, max_tokens: int | None = None) -> list[str]:
+        """Deterministic completion tokens for a prompt.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Token limit
+
+        Returns:
+            Completion split into tokens
+        """
+        count = self.config.completion_tokens
+        if max_tokens is not None:
+            count = min(count, max_tokens)
+        tokens: list[str] = []
+        counter = 0
+        while len(tokens) < count:
+            digest = hashlib.sha256(
+                f"{self.config.seed}:{counter}:{prompt}".encode()
+            ).digest()
+            tokens.extend(" " + _VOCABULARY[b % len(_VOCABULARY)] for b in digest)
+            counter += 1
+        tokens = tokens[:count]
+        if tokens:
+            tokens[0] = tokens[0].lstrip().capitalize()
+        return tokens
+
+    def _admit(self, route: str) -> float:
+        """Count a request and draw its latency and injected failure.
+
+        Returns:
+            Latency before the response starts
+
+        Raises:
+            _InjectedError: If the request should fail
+        """
+        self._requests += 1
+        self.stats[route] += 1
+        rng = random.Random(f"{self.config.seed}:{self._requests}")
+        latency = self.config.latency.sample(rng)
+        roll = rng.random()
+        if roll < self.config.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            raise _InjectedError(429, "Rate limit exceeded", self.config.retry_after)
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            self.stats["errors"] += 1
+            raise _InjectedError(500, "Injected server error")
+        return latency
+
+    async def _tokens(self, tokens: list[str], latency: float) -> AsyncIterator[str]:
+        """Yield tokens paced at the configured generation speed."""
+        await asyncio.sleep(latency)
+        start = time.monotonic()
+        tps = self.config.tokens_per_second
+        for index, token in enumerate(tokens):
+            if tps > 0:
+                # Absolute schedule so per-token sleeps do not accumulate drift
+                delay = start + (index + 1) / tps - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield token
+
+    # OpenAI API
+
+    def _openai_error(self, error: _InjectedError) -> web.Response:
+        """OpenAI-style error response."""
+        kind = "rate_limit_error" if error.status == 429 else "server_error"
+        headers = {}
+        if error.retry_after is not None:
+            headers["Retry-After"] = f"{error.retry_after:g}"
+        return web.json_response(
+            {"error": {"message": str(error), "type": kind, "code": None}},
+            status=error.status,
+            headers=headers,
+        )
+
+    async def _openai_chat(self, request: web.Request) -> web.StreamResponse:
+        """Handle /v1/chat/completions."""
+        body = await request.json()
+        prompt = "\n".join(
+            _content_text(m.get("content")) for m in body.get("messages", [])
+        )
+        return await self._openai_generate(request, body, prompt, chat=True)
+
+    async def _openai_completion(self, request: web.Request) -> web.StreamResponse:
+        """Handle /v1/completions."""
+        body = await request.json()
+        prompt = body.get("prompt", "")
+        if isinstance(prompt, list):
+            prompt = "\n".join(str(p) for p in prompt)
+        return await self._openai_generate(request, body, prompt, chat=False)
+
+    async def _openai_generate(
+        self, request: web.Request, body: dict[str, Any], prompt: str, chat: bool
+    ) -> web.StreamResponse:
+        """Shared chat/completion generation."""
+        try:
+            latency = self._admit("openai.chat" if chat else "openai.completion")
+        except _InjectedError as e:
+            return self._openai_error(e)
+
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        tokens = self.completion(prompt, max_tokens)
+        finish = (
+            "length" if max_tokens is not None and len(tokens) >= max_tokens else "stop"
+        )
+        model = body.get("model") or self.config.model
+        request_id = f"{'chatcmpl' if chat else 'cmpl'}-mock-{self._requests}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": count_tokens(prompt),
+            "completion_tokens": len(tokens),
+            "total_tokens": count_tokens(prompt) + len(tokens),
+        }
+        kind = "chat.completion" if chat else "text_completion"
+
+        def choice(text: str, finish_reason: str | None, delta: bool) -> dict[str, Any]:
+            if not chat:
+                return {"index": 0, "text": text, "finish_reason": finish_reason}
+            key = "delta" if delta else "message"
+            message = (
+                {"content": text} if delta else {"role": "assistant", "content": text}
+            )
+            return {"index": 0, key: message, "finish_reason": finish_reason}
+
+        if not body.get("stream"):
+            text = "".join([token async for token in self._tokens(tokens, latency)])
+            return web.json_response(
+                {
+                    "id": request_id,
+                    "object": kind,
+                    "created": created,
+                    "model": model,
+                    "choices": [choice(text, finish, delta=False)],
+                    "usage": usage,
+                }
+            )
+
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        chunk_kind = "chat.completion.chunk" if chat else "text_completion"
+
+        async def send(payload: dict[str, Any]) -> None:
+            await response.write(f"data: {json.dumps(payload)}\n\n".encode())
+
+        base = {
+            "id": request_id,
+            "object": chunk_kind,
+            "created": created,
+            "model": model,
+        }
+        async for token in self._tokens(tokens, latency):
+            await send({**base, "choices": [choice(token, None, delta=True)]})
+        await send({**base, "choices": [choice("", finish, delta=True)]})
+        if (body.get("stream_options") or {}).get("include_usage"):
+            await send({**base, "choices": [], "usage": usage})
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def _openai_embeddings(self, request: web.Request) -> web.Response:
+        """Handle /v1/embeddings."""
+        body = await request.json()
+        try:
+            latency = self._admit("openai.embeddings")
+        except _InjectedError as e:
+            return self._openai_error(e)
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        await asyncio.sleep(latency)
+        tokens = sum(count_tokens(str(t)) for t in texts)
+        return web.json_response(
+            {
+                "object": "list",
+                "data": [
+                    {
+                        "object": "embedding",
+                        "index": i,
+                        "embedding": self._embedder.vector(str(t)),
+                    }
+                    for i, t in enumerate(texts)
+                ],
+                "model": body.get("model") or self.config.model,
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            }
+        )
+
+    async def _openai_models(self, request: web.Request) -> web.Response:
+        """Handle /v1/models."""
+        return web.json_response(
+            {
+                "object": "list",
+                "data": [
+                    {"id": self.config.model, "object": "model", "owned_by": "pepperpy"}
+                ],
+            }
+        )
+
+    # Ollama API
+
+    def _ollama_error(self, error: _InjectedError) -> web.Response:
+        """Ollama-style error response."""
+        headers = {}
+        if error.retry_after is not None:
+            headers["Retry-After"] = f"{error.retry_after:g}"
+        return web.json_response(
+            {"error": str(error)}, status=error.status, headers=headers
+        )
+
+    async def _ollama_chat(self, request: web.Request) -> web.StreamResponse:
+        """Handle /api/chat."""
+        body = await request.json()
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        return await self._ollama_generate_response(request, body, prompt, chat=True)
+
+    async def _ollama_generate(self, request: web.Request) -> web.StreamResponse:
+        """Handle /api/generate."""
+        body = await request.json()
+        return await self._ollama_generate_response(
+            request, body, str(body.get("prompt", "")), chat=False
+        )
+
+    async def _ollama_generate_response(
+        self, request: web.Request, body: dict[str, Any], prompt: str, chat: bool
+    ) -> web.StreamResponse:
+        """Shared chat/generate handling; Ollama streams unless told not to."""
+        try:
+            latency = self._admit("ollama.chat" if chat else "ollama.generate")
+        except _InjectedError as e:
+            return self._ollama_error(e)
+
+        started = time.monotonic_ns()
+        max_tokens = (body.get("options") or {}).get("num_predict")
+        if max_tokens is not None and max_tokens < 0:
+            max_tokens = None
+        tokens = self.completion(prompt, max_tokens)
+        model = body.get("model") or self.config.model
+
+        def payload(text: str, done: bool) -> dict[str, Any]:
+            item: dict[str, Any] = {
+                "model": model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "done": done,
+            }
+            if chat:
+                item["message"] = {"role": "assistant", "content": text}
+            else:
+                item["response"] = text
+            if done:
+                item.update(
+                    done_reason=(
+                        "length" if max_tokens and len(tokens) >= max_tokens else "stop"
+                    ),
+                    total_duration=time.monotonic_ns() - started,
+                    prompt_eval_count=count_tokens(prompt),
+                    eval_count=len(tokens),
+                )
+            return item
+
+        if body.get("stream") is False:
+            text = "".join([token async for token in self._tokens(tokens, latency)])
+            return web.json_response(payload(text, done=True))
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        async for token in self._tokens(tokens, latency):
+            await response.write(
+                json.dumps(payload(token, done=False)).encode() + b"\n"
+            )
+        await response.write(json.dumps(payload("", done=True)).encode() + b"\n")
+        await response.write_eof()
+        return response
+
+    async def _ollama_embed(self, request: web.Request) -> web.Response:
+        """Handle /api/embed and the legacy /api/embeddings."""
+        body = await request.json()
+        try:
+            latency = self._admit("ollama.embed")
+        except _InjectedError as e:
+            return self._ollama_error(e)
+        await asyncio.sleep(latency)
+        model = body.get("model") or self.config.model
+        if request.path.endswith("/embeddings"):
+            vector = self._embedder.vector(str(body.get("prompt", "")))
+            return web.json_response({"embedding": vector})
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        return web.json_response(
+            {
+                "model": model,
+                "embeddings": [self._embedder.vector(str(t)) for t in texts],
+            }
+        )
+
+    async def _ollama_tags(self, request: web.Request) -> web.Response:
+        """Handle /api/tags."""
+        return web.json_response(
+            {"models": [{"name": self.config.model, "model": self.config.model}]}
+        )
+
+
+def _content_text(content: Any) -> str:
+    """Text of an OpenAI message content (string or content parts)."""
+    if isinstance(content, list):
+        return "".join(
+            part.get("text", "") for part in content if isinstance(part, dict)
+        )
+    return str(content or "")
+
+
+def main() -> None:
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(description="PepperPy mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--distribution", default="constant")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean latency (s)")
+    parser.add_argument("--latency-stddev", type=float, default=0.0)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--completion-tokens", type=int, default=32)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--model", default="mock-model")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = MockServerConfig(
+        latency=LatencyModel(args.distribution, args.latency, args.latency_stddev),
+        tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        model=args.model,
+        seed=args.seed,
+    )
+
+    async def serve() -> None:
+        async with MockLLMServer(config, args.host, args.port) as server:
+            print(f"Mock LLM server on {server.url} (OpenAI: {server.openai_base_url})")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
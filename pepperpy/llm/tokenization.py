@@ -0,0 +1,552 @@
+"""
+PepperPy LLM Tokenization Module.
+
+Token counting for context packing, rate limiting and truncation. Tokenizers
+are looked up per model in a registry: a byte-level BPE implementation that
+loads local ``vocab.json``/``merges.txt`` files, an adapter for Hugging Face
+``tokenizers`` when that package is installed, and a word/character heuristic
+as the fallback. Counts are memoized per string in a bounded LRU cache.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from pepperpy.core.errors import PepperpyError
+from pepperpy.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import regex as _regex
+
+    # GPT-2 pre-tokenization pattern
+    _PRETOKENIZE = _regex.compile(
+        r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+"""
+        r"""|\s+(?!\S)|\s+"""
+    )
+except ImportError:
+    # Close approximation with the standard library: [^\W\d_] matches letters
+    _PRETOKENIZE = re.compile(
+        r"""'s|'t|'re|'ve|'m|'ll|'d| ?[^\W\d_]+| ?\d+| ?[^\s\w]+|\s+(?!\S)|\s+|_+"""
+    )
+
+
+class TokenizerError(PepperpyError):
+    """Raised when a tokenizer cannot be created or loaded."""
+
+    pass
+
+
+class Tokenizer(ABC):
+    """Base class for tokenizers used for token counting."""
+
+    name: str = "tokenizer"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Token count
+        """
+        pass
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in several texts.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Token counts in input order
+        """
+        return [self.count(text) for text in texts]
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Approximate token counts from words and characters.
+
+    Used when no real tokenizer is available for a model.
+    """
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        """Estimate the tokens in a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Estimated token count
+        """
+        return len(text.split()) + len(text) // 4
+
+
+@lru_cache(maxsize=1)
+def _bytes_to_unicode() -> dict[int, str]:
+    """Byte to printable character mapping used by byte-level BPE vocabularies."""
+    printable = (
+        list(range(ord("!"), ord("~") + 1))
+        + list(range(ord("¡"), ord("¬") + 1))
+        + list(range(ord("®"), ord("ÿ") + 1))
+    )
+    chars = printable[:]
+    offset = 0
+    for byte in range(256):
+        if byte not in printable:
+            printable.append(byte)
+            chars.append(256 + offset)
+            offset += 1
+    return dict(zip(printable, map(chr, chars), strict=True))
+
+
+class BPETokenizer(Tokenizer):
+    """Byte-level BPE tokenizer (GPT-2 family vocabulary format).
+
+    Example:
+        ```python
+        tokenizer = BPETokenizer.from_files("vocab.json", "merges.txt")
+        tokenizer.count("def main(): pass")
+        ```
+    """
+
+    def __init__(
+        self,
+        vocab: dict[str, int],
+        merges: list[tuple[str, str]],
+        name: str = "bpe",
+        word_cache_size: int = 65536,
+    ) -> None:
+        """Initialize the tokenizer.
+
+        Args:
+            vocab: Mapping of token strings to ids
+            merges: Merge rules in priority order
+            name: Tokenizer name
+            word_cache_size: Number of pre-tokenized words whose merges are
+                memoized
+        """
+        self.vocab = vocab
+        self.name = name
+        self._ranks = {pair: rank for rank, pair in enumerate(merges)}
+        self._byte_encoder = _bytes_to_unicode()
+        self._bpe = lru_cache(maxsize=word_cache_size)(self._merge_word)
+
+    @classmethod
+    def from_files(
+        cls, vocab_path: str, merges_path: str, name: str | None = None
+    ) -> "BPETokenizer":
+        """Load a tokenizer from local ``vocab.json`` and ``merges.txt`` files.
+
+        Args:
+            vocab_path: Path to the JSON vocabulary
+            merges_path: Path to the merges file
+            name: Optional tokenizer name (defaults to the vocab directory)
+
+        Returns:
+            Loaded tokenizer
+
+        Raises:
+            TokenizerError: If the files cannot be read
+        """
+        try:
+            with open(vocab_path, encoding="utf-8") as f:
+                vocab = json.load(f)
+            with open(merges_path, encoding="utf-8") as f:
+                merges = [
+                    tuple(line.split())
+                    for line in f.read().splitlines()
+                    if line and not line.startswith("#version")
+                ]
+        except (OSError, ValueError) as e:
+            raise TokenizerError(f"Failed to load BPE files: {e}") from e
+
+        return cls(
+            vocab,
+            [pair for pair in merges if len(pair) == 2],
+            name=name or os.path.basename(os.path.dirname(os.path.abspath(vocab_path))),
+        )
+
+    def encode(self, text: str) -> list[int]:
+        """Encode a text to token ids.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Token ids (unknown pieces are skipped)
+        """
+        ids: list[int] = []
+        for word in _PRETOKENIZE.findall(text):
+            for piece in self._bpe(self._to_symbols(word)):
+                token_id = self.vocab.get(piece)
+                if token_id is not None:
+                    ids.append(token_id)
+        return ids
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Token count
+        """
+        return sum(
+            len(self._bpe(self._to_symbols(word)))
+            for word in _PRETOKENIZE.findall(text)
+        )
+
+    def _to_symbols(self, word: str) -> str:
+        """Map a word's UTF-8 bytes to vocabulary symbols."""
+        return "".join(self._byte_encoder[b] for b in word.encode("utf-8"))
+
+    def _merge_word(self, word: str) -> tuple[str, ...]:
+        """Apply merge rules to one pre-tokenized word.
+
+        Args:
+            word: Word as vocabulary symbols
+
+        Returns:
+            BPE pieces
+        """
+        parts = list(word)
+        while len(parts) > 1:
+            best_rank = None
+            best_index = -1
+            for index in range(len(parts) - 1):
+                rank = self._ranks.get((parts[index], parts[index + 1]))
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+                    best_index = index
+            if best_rank is None:
+                break
+
+            first, second = parts[best_index], parts[best_index + 1]
+            merged: list[str] = []
+            index = 0
+            while index < len(parts):
+                if (
+                    index < len(parts) - 1
+                    and parts[index] == first
+                    and parts[index + 1] == second
+                ):
+                    merged.append(first + second)
+                    index += 2
+                else:
+                    merged.append(parts[index])
+                    index += 1
+            parts = merged
+        return tuple(parts)
+
+
+class HFTokenizer(Tokenizer):
+    """Adapter for Hugging Face ``tokenizers.Tokenizer`` objects.
+
+    Batched counts use the library's parallel ``encode_batch``.
+    """
+
+    def __init__(self, tokenizer: Any, name: str = "hf") -> None:
+        """Initialize the adapter.
+
+        Args:
+            tokenizer: A ``tokenizers.Tokenizer`` instance
+            name: Tokenizer name
+        """
+        self.tokenizer = tokenizer
+        self.name = name
+
+    @classmethod
+    def from_file(cls, path: str, name: str | None = None) -> "HFTokenizer":
+        """Load a ``tokenizer.json`` file.
+
+        Args:
+            path: Path to the tokenizer file
+            name: Optional tokenizer name
+
+        Returns:
+            Loaded tokenizer
+
+        Raises:
+            TokenizerError: If ``tokenizers`` is missing or the file is invalid
+        """
+        try:
+            from tokenizers import Tokenizer as _HFTokenizer
+        except ImportError as e:
+            raise TokenizerError(
+                "tokenizers package not installed. Install with: pip install tokenizers"
+            ) from e
+
+        try:
+            tokenizer = _HFTokenizer.from_file(path)
+        except Exception as e:
+            raise TokenizerError(f"Failed to load tokenizer from {path}: {e}") from e
+        return cls(tokenizer, name=name or os.path.basename(os.path.dirname(path)))
+
+    def encode(self, text: str) -> list[int]:
+        """Encode a text to token ids.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Token ids
+        """
+        return list(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Token count
+        """
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in several texts in one batched call.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Token counts in input order
+        """
+        encodings = self.tokenizer.encode_batch(list(texts), add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+
+def load_tokenizer(path: str) -> Tokenizer:
+    """Load a tokenizer from a local path.
+
+    ``path`` may be a ``tokenizer.json`` file, a ``vocab.json`` file (with
+    ``merges.txt`` next to it) or a directory containing either.
+
+    Args:
+        path: Tokenizer file or directory
+
+    Returns:
+        Loaded tokenizer
+
+    Raises:
+        TokenizerError: If no supported tokenizer files are found
+    """
+    directory = path if os.path.isdir(path) else os.path.dirname(path)
+    tokenizer_json = os.path.join(directory, "tokenizer.json")
+    vocab_json = os.path.join(directory, "vocab.json")
+    merges_txt = os.path.join(directory, "merges.txt")
+
+    if path.endswith("tokenizer.json") or (
+        os.path.isdir(path) and os.path.exists(tokenizer_json)
+    ):
+        try:
+            return HFTokenizer.from_file(tokenizer_json)
+        except TokenizerError as e:
+            # Fall through to vocab/merges files when they are present
+            if not (os.path.exists(vocab_json) and os.path.exists(merges_txt)):
+                raise
+            logger.debug(f"Using BPE files instead of tokenizer.json: {e}")
+
+    if os.path.exists(vocab_json) and os.path.exists(merges_txt):
+        return BPETokenizer.from_files(vocab_json, merges_txt)
+
+    raise TokenizerError(f"No tokenizer files found at {path}")
+
+
+class TokenCounter:
+    """Tokenizer wrapper with an LRU cache of per-string counts.
+
+    Long texts are keyed by a digest so the cache does not keep them alive.
+    The counter is thread-safe.
+    """
+
+    _DIGEST_THRESHOLD = 256
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = 8192) -> None:
+        """Initialize the counter.
+
+        Args:
+            tokenizer: Tokenizer used for cache misses
+            cache_size: Maximum number of memoized counts
+        """
+        self.tokenizer = tokenizer
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str | bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Token count
+        """
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in several texts.
+
+        Cache misses are sent to the tokenizer as one batch.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Token counts in input order
+        """
+        keys = [self._key(text) for text in texts]
+        counts: list[int | None] = [None] * len(texts)
+        missing: dict[str | bytes, list[int]] = {}
+
+        with self._lock:
+            for index, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing.setdefault(key, []).append(index)
+                else:
+                    self._cache.move_to_end(key)
+                    counts[index] = cached
+            self._hits += len(texts) - sum(len(v) for v in missing.values())
+            self._misses += len(missing)
+
+        if missing:
+            positions = list(missing.values())
+            fresh = self.tokenizer.count_many([texts[p[0]] for p in positions])
+            with self._lock:
+                for key, indexes, value in zip(missing, positions, fresh, strict=True):
+                    for index in indexes:
+                        counts[index] = value
+                    self._cache[key] = value
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return counts  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Forget all memoized counts."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "tokenizer": self.tokenizer.name,
+                "size": len(self._cache),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / total if total else 0.0,
+            }
+
+    def _key(self, text: str) -> str | bytes:
+        """Cache key for a text."""
+        if len(text) <= self._DIGEST_THRESHOLD:
+            return text
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+TokenizerFactory = Callable[[], Tokenizer]
+
+_factories: dict[str, TokenizerFactory] = {}
+_counters: dict[str, TokenCounter] = {}
+_registry_lock = threading.Lock()
+
+
+def register_tokenizer(pattern: str, factory: TokenizerFactory) -> None:
+    """Register a tokenizer for models matching a pattern.
+
+    Patterns are matched against model names with ``fnmatch`` (for example
+    ``"gpt-4o*"``); the longest matching pattern wins.
+
+    Args:
+        pattern: Model name or glob pattern
+        factory: Callable creating the tokenizer on first use
+    """
+    with _registry_lock:
+        _factories[pattern] = factory
+        # Models previously resolved may now map to this tokenizer
+        _counters.clear()
+
+
+def get_token_counter(model: str | None = None) -> TokenCounter:
+    """Get the cached token counter for a model.
+
+    Args:
+        model: Model name, a registered tokenizer name, or a local tokenizer
+            path (see ``load_tokenizer``); None selects the heuristic
+
+    Returns:
+        Token counter (heuristic if nothing better is available)
+    """
+    key = model or ""
+    with _registry_lock:
+        counter = _counters.get(key)
+        if counter is not None:
+            return counter
+        matches = [p for p in _factories if model and fnmatch.fnmatchcase(model, p)]
+        factory = _factories[max(matches, key=len)] if matches else None
+
+    tokenizer: Tokenizer | None = None
+    try:
+        if factory is not None:
+            tokenizer = factory()
+        elif model and os.path.exists(model):
+            tokenizer = load_tokenizer(model)
+    except TokenizerError as e:
+        logger.warning(f"Falling back to heuristic token counts for {model}: {e}")
+
+    counter = TokenCounter(tokenizer or HeuristicTokenizer())
+    with _registry_lock:
+        return _counters.setdefault(key, counter)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Count the tokens in a text for a model.
+
+    Args:
+        text: Text to analyze
+        model: Optional model name or tokenizer path
+
+    Returns:
+        Token count
+    """
+    return get_token_counter(model).count(text)
+
+
+def count_tokens_many(texts: Sequence[str], model: str | None = None) -> list[int]:
+    """Count the tokens in several texts for a model.
+
+    Args:
+        texts: Texts to analyze
+        model: Optional model name or tokenizer path
+
+    Returns:
+        Token counts in input order
+    """
+    return get_token_counter(model).count_many(texts)
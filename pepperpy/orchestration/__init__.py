@@ -5,7 +5,33 @@
 allowing execution and management of various workflow types.
 """
 
-from pepperpy.orchestration.base import OrchestrationProvider
+from pepperpy.orchestration.base import (
+    ExecutionEvent,
+    ExecutionHandle,
+    OrchestrationProvider,
+)
+from pepperpy.orchestration.cache import (
+    MemoryTaskCache,
+    SQLiteTaskCache,
+    TaskCache,
+)
+from pepperpy.orchestration.checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from pepperpy.orchestration.distributed import (
+    DistributedTaskExecutor,
+    RemoteTaskError,
+    SQLiteTaskBroker,
+    TaskBroker,
+    TaskWorker,
+)
+from pepperpy.orchestration.executors import (
+    ProcessTaskExecutor,
+    TaskExecutor,
+    ThreadTaskExecutor,
+)
 from pepperpy.orchestration.orchestrator import WorkflowOrchestrator
 from pepperpy.orchestration.patterns import (
     AgentOrchestrator,
@@ -16,15 +42,41 @@
     ParallelFlow,
     SequentialFlow,
 )
+from pepperpy.orchestration.scheduler import TaskScheduler
+from pepperpy.orchestration.store import (
+    ExecutionStore,
+    MemoryExecutionStore,
+    SQLiteExecutionStore,
+)
 
 __all__ = [
     "AgentOrchestrator",
+    "CheckpointStore",
     "ConditionalFlow",
+    "DistributedTaskExecutor",
+    "ExecutionEvent",
+    "ExecutionHandle",
+    "ExecutionStore",
+    "FileCheckpointStore",
     "Flow",
     "FlowStatus",
+    "MemoryExecutionStore",
+    "MemoryTaskCache",
     "OrchestrationError",
     "OrchestrationProvider",
     "ParallelFlow",
+    "ProcessTaskExecutor",
+    "RemoteTaskError",
+    "SQLiteCheckpointStore",
+    "SQLiteExecutionStore",
+    "SQLiteTaskBroker",
+    "SQLiteTaskCache",
     "SequentialFlow",
+    "TaskBroker",
+    "TaskCache",
+    "TaskExecutor",
+    "TaskScheduler",
+    "TaskWorker",
+    "ThreadTaskExecutor",
     "WorkflowOrchestrator",
 ]
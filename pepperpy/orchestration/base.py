@@ -4,10 +4,114 @@
 This module defines the base interface for workflow orchestration providers.
 """
 
+import asyncio
+import time
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
-from pepperpy.workflow.models import Workflow, WorkflowExecution
+from pepperpy.workflow.models import (
+    ExecutionStatus,
+    TaskStatus,
+    Workflow,
+    WorkflowExecution,
+)
+
+# Bounds of the status polling used for providers that do not publish events
+_POLL_INITIAL = 0.05
+_POLL_MAX = 1.0
+
+
+@dataclass
+class ExecutionEvent:
+    """State transition of a workflow execution or of one of its tasks.
+
+    Attributes:
+        execution_id: Workflow execution ID
+        status: New status
+        task_id: Task ID, or None for a transition of the execution itself
+        error: Error message for failures
+        timestamp: Time of the transition
+    """
+
+    execution_id: str
+    status: ExecutionStatus | TaskStatus
+    task_id: str | None = None
+    error: str | None = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+class _ExecutionChannel:
+    """Completion signal and event subscribers of one execution."""
+
+    def __init__(self) -> None:
+        self.finished = asyncio.Event()
+        self.subscribers: list[asyncio.Queue[ExecutionEvent | None]] = []
+
+
+async def _no_events() -> AsyncIterator[ExecutionEvent]:
+    """Empty event stream of a finished execution."""
+    return
+    yield
+
+
+class ExecutionHandle:
+    """Awaitable handle on a workflow execution.
+
+    Awaiting the handle waits for the execution to finish and returns it;
+    ``events()`` streams its state transitions.
+
+    Example:
+        ```python
+        handle = await provider.start_workflow("etl", inputs)
+        async for event in handle.events():
+            print(event.task_id, event.status)
+        execution = await handle
+        ```
+    """
+
+    def __init__(self, provider: "OrchestrationProvider", execution_id: str) -> None:
+        """Initialize the handle.
+
+        Args:
+            provider: Provider running the execution
+            execution_id: Execution ID
+        """
+        self.provider = provider
+        self.execution_id = execution_id
+
+    def done(self) -> bool:
+        """Whether the provider has reported the execution as finished."""
+        return self.provider._execution_finished(self.execution_id)
+
+    async def wait(self, timeout: float | None = None) -> WorkflowExecution:
+        """Wait for the execution to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (forever if None)
+
+        Returns:
+            The finished execution
+        """
+        return await self.provider.wait_for_execution(self.execution_id, timeout)
+
+    def __await__(self):
+        """Wait for the execution to finish."""
+        return self.wait().__await__()
+
+    def events(self) -> AsyncIterator[ExecutionEvent]:
+        """Stream the state transitions of the execution.
+
+        The subscription starts when this method is called and the stream
+        ends after the execution's terminal event. Providers that do not
+        publish events yield nothing.
+
+        Returns:
+            Async iterator of events
+        """
+        return self.provider.subscribe(self.execution_id)
 
 
 class OrchestrationProvider:
@@ -28,6 +132,7 @@ def __init__(self, **kwargs: Any) -> None:
         self.initialized = False
         self.workflows: dict[str, Workflow] = {}
         self.executions: dict[str, WorkflowExecution] = {}
+        self._channels: dict[str, _ExecutionChannel] = {}
 
     async def initialize(self) -> None:
         """Initialize the provider."""
@@ -89,6 +194,169 @@ async def execute_workflow(
         """
         pass
 
+    async def start_workflow(
+        self,
+        workflow_id: str,
+        inputs: dict[str, Any] | None = None,
+        execution_id: str | None = None,
+        **kwargs: Any,
+    ) -> ExecutionHandle:
+        """Execute a workflow and return a handle on the execution.
+
+        Args:
+            workflow_id: Workflow ID
+            inputs: Workflow inputs
+            execution_id: Optional execution ID (generated if not provided)
+            **kwargs: Provider-specific execution options
+
+        Returns:
+            Handle on the execution
+        """
+        execution_id = await self.execute_workflow(
+            workflow_id, inputs, execution_id, **kwargs
+        )
+        return self.get_execution_handle(execution_id)
+
+    def get_execution_handle(self, execution_id: str) -> ExecutionHandle:
+        """Get an awaitable handle on an execution.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Handle on the execution
+        """
+        return ExecutionHandle(self, execution_id)
+
+    async def wait_for_execution(
+        self, execution_id: str, timeout: float | None = None
+    ) -> WorkflowExecution:
+        """Wait for an execution to reach a terminal state.
+
+        Providers that publish events wake the waiter as soon as the execution
+        finishes; for the others the status is polled with backoff.
+
+        Args:
+            execution_id: Execution ID
+            timeout: Maximum seconds to wait (forever if None)
+
+        Returns:
+            The finished execution
+
+        Raises:
+            ValueError: If the execution is not found
+            TimeoutError: If the timeout expires first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        channel: _ExecutionChannel | None = None
+        delay = _POLL_INITIAL
+        while True:
+            execution = await self.get_execution(execution_id)
+            if execution is None:
+                raise ValueError(f"Execution {execution_id} not found")
+            if execution.is_terminal() or self._execution_finished(execution_id):
+                return execution
+            if channel is None:
+                # Only executions still running get a channel
+                channel = self._channels.setdefault(execution_id, _ExecutionChannel())
+            wait = delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Execution {execution_id} did not finish in {timeout}s"
+                    )
+                wait = min(wait, remaining)
+            try:
+                await asyncio.wait_for(channel.finished.wait(), wait)
+            except TimeoutError:
+                delay = min(delay * 2, _POLL_MAX)
+
+    def subscribe(self, execution_id: str) -> AsyncIterator[ExecutionEvent]:
+        """Stream the state transitions of an execution.
+
+        The subscription is registered immediately, before the first
+        iteration, so no transition published afterwards is missed. An
+        execution that has already finished yields nothing.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Async iterator of events, ending after the terminal event
+        """
+        if self._execution_finished(execution_id):
+            return _no_events()
+        queue: asyncio.Queue[ExecutionEvent | None] = asyncio.Queue()
+        channel = self._channels.setdefault(execution_id, _ExecutionChannel())
+        channel.subscribers.append(queue)
+        return self._drain(execution_id, channel, queue)
+
+    async def _drain(
+        self,
+        execution_id: str,
+        channel: _ExecutionChannel,
+        queue: "asyncio.Queue[ExecutionEvent | None]",
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Yield a subscriber's events until the terminal sentinel."""
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            if queue in channel.subscribers:
+                channel.subscribers.remove(queue)
+            if not channel.subscribers and channel.finished.is_set():
+                self._channels.pop(execution_id, None)
+
+    def _publish_event(
+        self,
+        execution_id: str,
+        status: ExecutionStatus | TaskStatus,
+        task_id: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Deliver a state transition to the subscribers of an execution.
+
+        Args:
+            execution_id: Execution ID
+            status: New status
+            task_id: Task ID, or None for the execution itself
+            error: Error message for failures
+        """
+        channel = self._channels.get(execution_id)
+        if channel is None or not channel.subscribers:
+            return
+        event = ExecutionEvent(execution_id, status, task_id, error)
+        for queue in channel.subscribers:
+            queue.put_nowait(event)
+
+    def _finish_execution(self, execution: WorkflowExecution) -> None:
+        """Publish an execution's terminal event and wake its waiters.
+
+        Args:
+            execution: The finished execution
+        """
+        self._publish_event(execution.id, execution.status, error=execution.error)
+        channel = self._channels.get(execution.id)
+        if channel is None:
+            return
+        channel.finished.set()
+        for queue in channel.subscribers:
+            queue.put_nowait(None)
+        if not channel.subscribers:
+            del self._channels[execution.id]
+
+    def _execution_finished(self, execution_id: str) -> bool:
+        """Whether an execution is known to be finished."""
+        channel = self._channels.get(execution_id)
+        if channel is not None and channel.finished.is_set():
+            return True
+        execution = self.executions.get(execution_id)
+        return execution is not None and execution.is_terminal()
+
     @abstractmethod
     async def get_execution(self, execution_id: str) -> WorkflowExecution | None:
         """Get a workflow execution by ID.
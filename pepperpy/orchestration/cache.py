@@ -0,0 +1,314 @@
+"""
+Task Result Cache for PepperPy Orchestration.
+
+Tasks created with ``cache=True`` are memoized: before running such a task,
+the orchestrator hashes its identity, code version, configuration (its
+metadata) and inputs, and reuses the stored outputs when the hash is known.
+Since a task's inputs include its dependencies' outputs, unchanged
+subgraphs are served from the cache and only the tasks downstream of a
+change run again, like a build system. Every task receives all workflow
+inputs, so declare an ``input_schema`` on a cached task to key it on the
+inputs it reads only; otherwise any changed workflow input is a miss.
+
+Bump a task's ``version`` when its code changes to stop reusing old results,
+or drop them explicitly with ``invalidate``. ``WorkflowExecution.cache_hits``
+lists the tasks of a run that were served from the cache.
+
+Keys are only built from values with a stable representation across
+processes (JSON types, sets, tuples, bytes, enums, dates, dataclasses and
+pydantic models); a task whose key inputs include anything else is run
+without caching.
+
+Example:
+    ```python
+    task = Task("embed", "Embed chunks", embed, cache=True, version="2")
+    provider = LocalOrchestrationProvider(cache=SQLiteTaskCache("cache.db"))
+    ```
+"""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+
+from pepperpy.orchestration.checkpoint import JSONSerializer, Serializer
+from pepperpy.workflow.models import Task
+
+# Returned by ``get`` on a miss, so that ``None`` can be a cached value
+MISSING: Any = object()
+
+
+# Values whose string form identifies them
+_STRING_VALUES = (
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    Decimal,
+    uuid.UUID,
+    PurePath,
+)
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a value to a JSON form that is the same in every process.
+
+    Values other than JSON scalars, lists and string-keyed dicts are tagged
+    with their type, so that e.g. a set and a list of the same items differ.
+
+    Raises:
+        TypeError: If the value has no stable representation
+    """
+    if value is None or isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _canonical(item) for key, item in value.items()}
+
+    if isinstance(value, Enum):
+        payload = _canonical(value.value)
+    elif isinstance(value, dict):
+        payload = sorted(
+            ([_canonical(key), _canonical(item)] for key, item in value.items()),
+            key=_sort_key,
+        )
+    elif isinstance(value, tuple):
+        payload = [_canonical(item) for item in value]
+    elif isinstance(value, set | frozenset):
+        payload = sorted((_canonical(item) for item in value), key=_sort_key)
+    elif isinstance(value, bytes | bytearray):
+        payload = bytes(value).hex()
+    elif isinstance(value, _STRING_VALUES):
+        payload = str(value)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        payload = {
+            field.name: _canonical(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    elif callable(getattr(value, "model_dump", None)):
+        # pydantic models
+        payload = _canonical(value.model_dump())
+    else:
+        raise TypeError(
+            f"{type(value).__name__} values have no stable cache key representation"
+        )
+    return {f"__{type(value).__qualname__}__": payload}
+
+
+def _sort_key(value: Any) -> str:
+    """Order canonical values independently of hashing and insertion order."""
+    return json.dumps(value, sort_keys=True)
+
+
+def task_cache_key(task: Task, inputs: dict[str, Any]) -> str:
+    """Cache key of a task run.
+
+    Args:
+        task: Task definition
+        inputs: Task inputs, including the outputs of its dependencies
+
+    Returns:
+        Hash of the task ID, function, version, metadata and inputs (only
+        those named in the task's input schema, if it declares one)
+
+    Raises:
+        TypeError: If the metadata or inputs contain a value without a
+            stable representation (see ``_canonical``)
+    """
+    function = task.function
+    if task.input_schema:
+        inputs = {
+            name: value for name, value in inputs.items() if name in task.input_schema
+        }
+    payload = json.dumps(
+        {
+            "task": task.id,
+            "function": (
+                f"{function.__module__}.{function.__qualname__}"
+                if function is not None
+                else None
+            ),
+            "version": task.version,
+            "config": _canonical(task.metadata),
+            "inputs": _canonical(inputs),
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+class TaskCache(ABC):
+    """Storage of task outputs by cache key."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Look up cached outputs.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached outputs, or ``MISSING``
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, task: Task, outputs: Any) -> None:
+        """Cache the outputs of a task run.
+
+        Args:
+            key: Cache key
+            task: Task that produced the outputs
+            outputs: Task outputs
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, task_id: str, version: str | None = None) -> int:
+        """Drop the cached outputs of a task.
+
+        Args:
+            task_id: Task ID
+            version: Only drop the outputs of this task version
+
+        Returns:
+            Number of entries removed
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached output."""
+        pass
+
+    def close(self) -> None:  # noqa: B027 (optional hook)
+        """Release resources."""
+        pass
+
+
+class MemoryTaskCache(TaskCache):
+    """In-process cache keeping the most recently used entries."""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries kept; the least recently used are
+                evicted first
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, str, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        """Look up cached outputs."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        self._entries.move_to_end(key)
+        outputs = entry[2]
+        # A shallow copy, so that a run updating its outputs spares the cache
+        return dict(outputs) if isinstance(outputs, dict) else outputs
+
+    def set(self, key: str, task: Task, outputs: Any) -> None:
+        """Cache the outputs of a task run."""
+        if isinstance(outputs, dict):
+            outputs = dict(outputs)
+        self._entries[key] = (task.id, task.version, outputs)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, task_id: str, version: str | None = None) -> int:
+        """Drop the cached outputs of a task."""
+        keys = [
+            key
+            for key, (entry_task, entry_version, _) in self._entries.items()
+            if entry_task == task_id and version in (None, entry_version)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached output."""
+        self._entries.clear()
+
+
+class SQLiteTaskCache(TaskCache):
+    """Cache persisted in a SQLite database in WAL mode.
+
+    Results survive restarts, so re-running a workflow in a new process
+    only recomputes what changed.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], serializer: Serializer | None = None
+    ) -> None:
+        """Open or create the database.
+
+        Args:
+            path: Database file
+            serializer: Output serializer (defaults to JSON)
+        """
+        self.path = os.fspath(path)
+        self.serializer = serializer or JSONSerializer()
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS task_cache ("
+            "key TEXT PRIMARY KEY, task_id TEXT NOT NULL, version TEXT NOT NULL, "
+            "data BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_cache_task "
+            "ON task_cache (task_id, version)"
+        )
+
+    def get(self, key: str) -> Any:
+        """Look up cached outputs."""
+        row = self._db.execute(
+            "SELECT data FROM task_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return MISSING
+        return self.serializer.loads(row[0])
+
+    def set(self, key: str, task: Task, outputs: Any) -> None:
+        """Cache the outputs of a task run."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO task_cache "
+            "(key, task_id, version, data, created_at) VALUES (?, ?, ?, ?, ?)",
+            (key, task.id, task.version, self.serializer.dumps(outputs), time.time()),
+        )
+
+    def invalidate(self, task_id: str, version: str | None = None) -> int:
+        """Drop the cached outputs of a task."""
+        if version is None:
+            cursor = self._db.execute(
+                "DELETE FROM task_cache WHERE task_id = ?", (task_id,)
+            )
+        else:
+            cursor = self._db.execute(
+                "DELETE FROM task_cache WHERE task_id = ? AND version = ?",
+                (task_id, version),
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Drop every cached output."""
+        self._db.execute("DELETE FROM task_cache")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
@@ -0,0 +1,323 @@
+"""
+Task Checkpoints for PepperPy Orchestration.
+
+A checkpoint store keeps the outputs of completed tasks so that a workflow
+that failed halfway can be run again without redoing the expensive steps.
+Checkpoints are grouped under a key derived from the workflow ID, the
+workflow version and a hash of the inputs: bump the workflow version when
+task code changes to invalidate old checkpoints. Each checkpoint also records
+the execution that wrote it, so a finished execution can clear its own
+checkpoints without touching those of executions still running.
+
+Example:
+    ```python
+    provider = LocalOrchestrationProvider(
+        checkpoints=SQLiteCheckpointStore("checkpoints.db")
+    )
+    execution_id = await provider.execute_workflow("ingest", inputs)
+    ...  # fails at step 40 of 50
+    await provider.resume(execution_id)  # runs steps 40 to 50 only
+    ```
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Protocol
+from urllib.parse import quote, unquote
+
+from pepperpy.workflow.models import Workflow
+
+
+class Serializer(Protocol):
+    """Converts task outputs to bytes and back."""
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value."""
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a value."""
+        ...
+
+
+class JSONSerializer:
+    """JSON serializer; values must be JSON-compatible."""
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value to UTF-8 JSON."""
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize UTF-8 JSON."""
+        return json.loads(data)
+
+
+class PickleSerializer:
+    """Pickle serializer for arbitrary Python outputs.
+
+    Only load checkpoints written by a trusted process.
+    """
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        """Initialize the serializer.
+
+        Args:
+            protocol: Pickle protocol
+        """
+        self.protocol = protocol
+
+    def dumps(self, value: Any) -> bytes:
+        """Pickle a value."""
+        return pickle.dumps(value, protocol=self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        """Unpickle a value."""
+        return pickle.loads(data)
+
+
+def checkpoint_key(workflow: Workflow, inputs: dict[str, Any]) -> str:
+    """Checkpoint key of a workflow run.
+
+    Args:
+        workflow: Workflow definition
+        inputs: Workflow inputs
+
+    Returns:
+        Key combining the workflow ID, its version and a hash of the inputs
+    """
+    payload = json.dumps(inputs, sort_keys=True, default=repr).encode("utf-8")
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{workflow.id}@{workflow.version}:{digest}"
+
+
+class CheckpointStore(ABC):
+    """Storage of completed task outputs, grouped by checkpoint key."""
+
+    def __init__(self, serializer: Serializer | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            serializer: Output serializer (defaults to JSON)
+        """
+        self.serializer = serializer or JSONSerializer()
+
+    @abstractmethod
+    def load(self, key: str) -> dict[str, Any]:
+        """Load the checkpointed outputs of a run.
+
+        Args:
+            key: Checkpoint key
+
+        Returns:
+            Task ID to outputs
+        """
+        pass
+
+    @abstractmethod
+    def save(
+        self, key: str, task_id: str, outputs: Any, execution_id: str | None = None
+    ) -> None:
+        """Checkpoint the outputs of a completed task.
+
+        Args:
+            key: Checkpoint key
+            task_id: Task ID
+            outputs: Task outputs
+            execution_id: ID of the execution writing the checkpoint
+        """
+        pass
+
+    @abstractmethod
+    def executions(self, key: str) -> set[str]:
+        """IDs of the executions that wrote checkpoints under a key.
+
+        Args:
+            key: Checkpoint key
+
+        Returns:
+            Execution IDs (checkpoints saved without one are not included)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str, execution_id: str | None = None) -> None:
+        """Delete the checkpoints of a run.
+
+        Args:
+            key: Checkpoint key
+            execution_id: Only delete the checkpoints written by this
+                execution (all of them if None)
+        """
+        pass
+
+    def close(self) -> None:  # noqa: B027 (optional hook)
+        """Release resources."""
+        pass
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoints as files: one directory per run, one file per task.
+
+    The file name carries the task ID and the ID of the execution that wrote
+    it, separated by ``@`` (which ``quote`` always escapes).
+
+    Files are written to a temporary name and renamed, so a crash never
+    leaves a partial checkpoint behind.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], serializer: Serializer | None = None
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Root directory of the checkpoints
+            serializer: Output serializer (defaults to JSON)
+        """
+        super().__init__(serializer)
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _run_dir(self, key: str) -> str:
+        """Directory of a run."""
+        return os.path.join(self.directory, quote(key, safe=""))
+
+    def load(self, key: str) -> dict[str, Any]:
+        """Load the checkpointed outputs of a run."""
+        run_dir = self._run_dir(key)
+        if not os.path.isdir(run_dir):
+            return {}
+        outputs: dict[str, Any] = {}
+        for name in os.listdir(run_dir):
+            if not name.endswith(".ckpt"):
+                continue
+            task_id, _ = _parse_checkpoint_name(name)
+            with open(os.path.join(run_dir, name), "rb") as f:
+                outputs[task_id] = self.serializer.loads(f.read())
+        return outputs
+
+    def save(
+        self, key: str, task_id: str, outputs: Any, execution_id: str | None = None
+    ) -> None:
+        """Checkpoint the outputs of a completed task."""
+        run_dir = self._run_dir(key)
+        os.makedirs(run_dir, exist_ok=True)
+        name = quote(task_id, safe="")
+        if execution_id is not None:
+            name += "@" + quote(execution_id, safe="")
+        path = os.path.join(run_dir, name + ".ckpt")
+        data = self.serializer.dumps(outputs)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    def executions(self, key: str) -> set[str]:
+        """IDs of the executions that wrote checkpoints under a key."""
+        run_dir = self._run_dir(key)
+        if not os.path.isdir(run_dir):
+            return set()
+        writers = (
+            _parse_checkpoint_name(name)[1]
+            for name in os.listdir(run_dir)
+            if name.endswith(".ckpt")
+        )
+        return {writer for writer in writers if writer is not None}
+
+    def delete(self, key: str, execution_id: str | None = None) -> None:
+        """Delete the checkpoints of a run."""
+        run_dir = self._run_dir(key)
+        if not os.path.isdir(run_dir):
+            return
+        for name in os.listdir(run_dir):
+            if (
+                execution_id is None
+                or _parse_checkpoint_name(name.removesuffix(".tmp"))[1]
+                == execution_id
+            ):
+                os.remove(os.path.join(run_dir, name))
+        if not os.listdir(run_dir):
+            os.rmdir(run_dir)
+
+
+def _parse_checkpoint_name(name: str) -> tuple[str, str | None]:
+    """Task ID and writing execution ID of a checkpoint file name."""
+    task_id, _, execution_id = name.removesuffix(".ckpt").partition("@")
+    return unquote(task_id), unquote(execution_id) if execution_id else None
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints in a SQLite database in WAL mode."""
+
+    def __init__(
+        self, path: str | os.PathLike[str], serializer: Serializer | None = None
+    ) -> None:
+        """Open or create the database.
+
+        Args:
+            path: Database file
+            serializer: Output serializer (defaults to JSON)
+        """
+        super().__init__(serializer)
+        self.path = os.fspath(path)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "key TEXT NOT NULL, task_id TEXT NOT NULL, data BLOB NOT NULL, "
+            "created_at REAL NOT NULL, execution_id TEXT, "
+            "PRIMARY KEY (key, task_id))"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(checkpoints)")}
+        if "execution_id" not in columns:
+            # Databases created before checkpoints recorded their writer
+            self._db.execute("ALTER TABLE checkpoints ADD COLUMN execution_id TEXT")
+
+    def load(self, key: str) -> dict[str, Any]:
+        """Load the checkpointed outputs of a run."""
+        return {
+            task_id: self.serializer.loads(data)
+            for task_id, data in self._db.execute(
+                "SELECT task_id, data FROM checkpoints WHERE key = ?", (key,)
+            )
+        }
+
+    def save(
+        self, key: str, task_id: str, outputs: Any, execution_id: str | None = None
+    ) -> None:
+        """Checkpoint the outputs of a completed task."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO checkpoints "
+            "(key, task_id, data, created_at, execution_id) VALUES (?, ?, ?, ?, ?)",
+            (key, task_id, self.serializer.dumps(outputs), time.time(), execution_id),
+        )
+
+    def executions(self, key: str) -> set[str]:
+        """IDs of the executions that wrote checkpoints under a key."""
+        return {
+            execution_id
+            for (execution_id,) in self._db.execute(
+                "SELECT DISTINCT execution_id FROM checkpoints "
+                "WHERE key = ? AND execution_id IS NOT NULL",
+                (key,),
+            )
+        }
+
+    def delete(self, key: str, execution_id: str | None = None) -> None:
+        """Delete the checkpoints of a run."""
+        if execution_id is None:
+            self._db.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
+        else:
+            self._db.execute(
+                "DELETE FROM checkpoints WHERE key = ? AND execution_id = ?",
+                (key, execution_id),
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
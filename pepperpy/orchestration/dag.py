@@ -0,0 +1,293 @@
+"""
+DAG Scheduler for PepperPy Orchestration.
+
+Event-driven execution of a dependency graph. Each node keeps a count of
+unfinished dependencies; when a node finishes, its dependents' counters are
+decremented and the ones reaching zero are dispatched right away from the
+done callback. No polling, and the work per completion is proportional to
+the node's out-degree rather than to the size of the graph.
+
+Example:
+    ```python
+    scheduler = DAGScheduler(
+        nodes=["fetch", "parse", "index"],
+        dependencies={"parse": {"fetch"}, "index": {"parse"}},
+        run=run_node,
+        max_concurrency=4,
+    )
+    results = await scheduler.run()
+    ```
+"""
+
+import asyncio
+import functools
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from typing import Any
+
+from pepperpy.core import get_logger
+
+logger = get_logger("orchestration.dag")
+
+
+class DAGScheduler:
+    """Runs the nodes of a DAG as soon as their dependencies complete.
+
+    With ``fail_fast`` (the default) the first failure stops dispatching;
+    nodes already running are allowed to finish and ``run`` then raises the
+    failure. Without it, only the dependents of a failed node are skipped.
+    ``cancel`` also cancels the running nodes.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[str],
+        dependencies: Mapping[str, Iterable[str]],
+        run: Callable[[str], Coroutine[Any, Any, Any]],
+        max_concurrency: int | None = None,
+        fail_fast: bool = True,
+        completed: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Build the scheduler and validate the graph.
+
+        Args:
+            nodes: Node IDs
+            dependencies: Node ID to the IDs it depends on
+            run: Coroutine function executing one node
+            max_concurrency: Maximum nodes running at once (unbounded if None)
+            fail_fast: Stop dispatching on the first failure
+            completed: Results of nodes that already ran (e.g. restored from a
+                checkpoint); they are not run again
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._run = run
+        self.max_concurrency = max_concurrency
+        self.fail_fast = fail_fast
+
+        self._in_degree: dict[str, int] = dict.fromkeys(nodes, 0)
+        self._dependents: dict[str, list[str]] = {}
+        for node, deps in dependencies.items():
+            if node not in self._in_degree:
+                raise ValueError(f"Unknown node '{node}' in dependencies")
+            for dep in set(deps):
+                if dep not in self._in_degree:
+                    raise ValueError(f"Node '{node}' depends on unknown node '{dep}'")
+                self._in_degree[node] += 1
+                self._dependents.setdefault(dep, []).append(node)
+        self._check_acyclic()
+
+        self.results: dict[str, Any] = {}
+        for node, result in (completed or {}).items():
+            if node not in self._in_degree:
+                raise ValueError(f"Unknown completed node '{node}'")
+            self.results[node] = result
+            for dependent in self._dependents.get(node, ()):
+                self._in_degree[dependent] -= 1
+        self._ready: deque[str] = deque(
+            node
+            for node, degree in self._in_degree.items()
+            if degree == 0 and node not in self.results
+        )
+        self._running: dict[str, asyncio.Task[Any]] = {}
+        self.errors: dict[str, BaseException] = {}
+        self.skipped: set[str] = set()
+        self.cancelled: set[str] = set()
+        self._futures: dict[str, asyncio.Future[Any]] = {}
+        self._done: asyncio.Future[None] | None = None
+        self._stopped = False
+        self._started = False
+
+    def _check_acyclic(self) -> None:
+        """Raise if the graph has a cycle (Kahn's algorithm)."""
+        in_degree = dict(self._in_degree)
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            node = queue.popleft()
+            visited += 1
+            for dependent in self._dependents.get(node, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        if visited != len(in_degree):
+            cyclic = sorted(node for node, degree in in_degree.items() if degree)
+            raise ValueError(f"Dependency cycle among nodes: {cyclic}")
+
+    @property
+    def finished(self) -> bool:
+        """Whether the run is over."""
+        return self._done is not None and self._done.done()
+
+    @property
+    def running(self) -> set[str]:
+        """IDs of the nodes currently running."""
+        return set(self._running)
+
+    def future(self, node: str) -> asyncio.Future[Any]:
+        """Future resolving to a node's result.
+
+        The future is cancelled if the node is skipped or cancelled.
+
+        Args:
+            node: Node ID
+
+        Returns:
+            Completion future of the node
+
+        Raises:
+            KeyError: If the node is unknown
+        """
+        if node not in self._in_degree:
+            raise KeyError(node)
+        future = self._futures.get(node)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[node] = future
+            if node in self.results:
+                future.set_result(self.results[node])
+            elif node in self.errors:
+                future.set_exception(self.errors[node])
+            elif node in self.skipped or node in self.cancelled:
+                future.cancel()
+        return future
+
+    def start(self) -> asyncio.Future[None]:
+        """Start dispatching without waiting.
+
+        Returns:
+            Future resolving once no node is running or left to run
+        """
+        if self._done is None:
+            self._done = asyncio.get_running_loop().create_future()
+        if not self._started:
+            self._started = True
+            self._dispatch()
+        return self._done
+
+    async def run(self) -> dict[str, Any]:
+        """Run the graph to completion.
+
+        Returns:
+            Node ID to result
+
+        Raises:
+            BaseException: The first node failure
+        """
+        await asyncio.shield(self.start())
+        if self.errors:
+            raise next(iter(self.errors.values()))
+        return self.results
+
+    def stop(self) -> None:
+        """Stop dispatching; nodes already running are left to finish."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._skip_remaining()
+        self._maybe_finish()
+
+    def cancel(self) -> None:
+        """Stop dispatching and cancel the running nodes.
+
+        The run finishes once every cancelled node has unwound.
+        """
+        self.stop()
+        for task in self._running.values():
+            task.cancel()
+
+    def _dispatch(self) -> None:
+        """Start ready nodes up to the concurrency limit."""
+        limit = self.max_concurrency
+        while self._ready and not self._stopped:
+            if limit is not None and len(self._running) >= limit:
+                break
+            node = self._ready.popleft()
+            task: asyncio.Task[Any] = asyncio.create_task(
+                self._run(node), name=f"dag:{node}"
+            )
+            self._running[node] = task
+            task.add_done_callback(functools.partial(self._on_done, node))
+        self._maybe_finish()
+
+    def _on_done(self, node: str, task: asyncio.Task[Any]) -> None:
+        """Record a finished node and release its dependents."""
+        del self._running[node]
+        future = self._futures.get(node)
+        if task.cancelled():
+            error: BaseException | None = asyncio.CancelledError()
+        else:
+            error = task.exception()
+
+        if task.cancelled() and self._stopped:
+            # Cancelled by ``cancel``: not a failure of the node
+            self.cancelled.add(node)
+            if future is not None:
+                future.cancel()
+        elif error is None:
+            result = task.result()
+            self.results[node] = result
+            if future is not None and not future.done():
+                future.set_result(result)
+            for dependent in self._dependents.get(node, ()):
+                self._in_degree[dependent] -= 1
+                if self._in_degree[dependent] == 0 and dependent not in self.results:
+                    self._ready.append(dependent)
+        else:
+            self.errors[node] = error
+            if future is not None and not future.done():
+                future.set_exception(error)
+            if self.fail_fast:
+                self._stopped = True
+                self._skip_remaining()
+            else:
+                self._skip_dependents(node)
+        self._dispatch()
+
+    def _skip(self, node: str) -> None:
+        """Mark a node as never run."""
+        self.skipped.add(node)
+        future = self._futures.get(node)
+        if future is not None:
+            future.cancel()
+
+    def _skip_remaining(self) -> None:
+        """Skip every node that has not started."""
+        self._ready.clear()
+        for node in self._in_degree:
+            if (
+                node not in self._running
+                and node not in self.results
+                and node not in self.errors
+                and node not in self.skipped
+                and node not in self.cancelled
+            ):
+                self._skip(node)
+
+    def _skip_dependents(self, node: str) -> None:
+        """Skip the transitive dependents of a failed node."""
+        stack = list(self._dependents.get(node, ()))
+        while stack:
+            dependent = stack.pop()
+            if dependent in self.skipped:
+                continue
+            self._skip(dependent)
+            stack.extend(self._dependents.get(dependent, ()))
+
+    def _maybe_finish(self) -> None:
+        """Resolve the done future once nothing can run any more."""
+        if self._done is None or self._done.done() or self._running:
+            return
+        if self._ready and not self._stopped:
+            return
+        settled = (
+            len(self.results)
+            + len(self.errors)
+            + len(self.skipped)
+            + len(self.cancelled)
+        )
+        if self._stopped or settled == len(self._in_degree):
+            self._done.set_result(None)
@@ -0,0 +1,731 @@
+"""
+Distributed Task Execution for PepperPy Orchestration.
+
+A coordinator (the ``LocalOrchestrationProvider``) keeps the workflow state
+and the DAG; tasks that select the ``DistributedTaskExecutor`` are turned
+into jobs on a ``TaskBroker``. ``TaskWorker`` processes lease jobs from the
+broker, run them and post their results back.
+
+Leases make the scheme tolerant of dying workers: a worker extends the
+leases of its running jobs with heartbeats, and a job whose lease expires
+(the worker crashed or hung) is delivered again to another worker, up to
+``max_deliveries`` times. Delivery is therefore at least once: task
+functions run this way should be idempotent.
+
+``SQLiteTaskBroker`` shares one database file between the processes of a
+machine, which is enough to use every core; another ``TaskBroker``
+implementation (Redis, a message queue, ...) scales the same workers out.
+
+Example:
+    ```python
+    # Coordinator
+    broker = SQLiteTaskBroker("jobs.db")
+    provider = LocalOrchestrationProvider(
+        executors={"distributed": DistributedTaskExecutor(broker)}
+    )
+    task = Task("ocr", "OCR", ocr_page, executor="distributed")
+
+    # Workers, one process per core:
+    #   python -m pepperpy.orchestration.distributed jobs.db --processes 8
+    ```
+"""
+
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+import pickle
+import socket
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pepperpy.core import get_logger
+from pepperpy.orchestration.executors import TaskExecutor, _call
+from pepperpy.workflow.models import WorkflowError
+
+logger = get_logger("orchestration.distributed")
+
+
+class RemoteTaskError(WorkflowError):
+    """A task failed on a worker and its exception could not be returned."""
+
+    pass
+
+
+@dataclass
+class BrokerJob:
+    """A job leased to a worker."""
+
+    id: str
+    payload: bytes
+    deliveries: int
+
+
+@dataclass
+class JobResult:
+    """Outcome of a finished job.
+
+    ``status`` is "done" (``result`` holds the pickled return value) or
+    "failed" (``error`` describes the failure and ``result`` holds the
+    pickled exception when it could be pickled).
+    """
+
+    job_id: str
+    status: str
+    result: bytes | None = None
+    error: str | None = None
+
+
+class TaskBroker(ABC):
+    """Job queue shared by a coordinator and its workers."""
+
+    @abstractmethod
+    def submit(self, job_id: str, payload: bytes) -> None:
+        """Queue a job.
+
+        Args:
+            job_id: Unique job ID
+            payload: Pickled ``(function, inputs)``
+        """
+        pass
+
+    @abstractmethod
+    def lease(
+        self, worker_id: str, limit: int, lease_seconds: float
+    ) -> list[BrokerJob]:
+        """Lease queued jobs, or jobs whose lease expired.
+
+        Args:
+            worker_id: Worker ID
+            limit: Maximum jobs to lease
+            lease_seconds: Lease duration
+
+        Returns:
+            The leased jobs, oldest first
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(
+        self, worker_id: str, job_ids: Iterable[str], lease_seconds: float
+    ) -> set[str]:
+        """Extend the leases of running jobs.
+
+        Args:
+            worker_id: Worker ID
+            job_ids: Jobs the worker is running
+            lease_seconds: New lease duration from now
+
+        Returns:
+            IDs of the jobs the worker no longer owns (expired and
+            redelivered, or cancelled); their outcomes will be rejected
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: bytes) -> bool:
+        """Post the result of a job.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker ID
+            result: Pickled return value
+
+        Returns:
+            False if the worker no longer owned the job (the result is dropped)
+        """
+        pass
+
+    @abstractmethod
+    def fail(
+        self, job_id: str, worker_id: str, error: str, exception: bytes | None
+    ) -> bool:
+        """Post the failure of a job.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker ID
+            error: Error description
+            exception: Pickled exception, if it could be pickled
+
+        Returns:
+            False if the worker no longer owned the job
+        """
+        pass
+
+    @abstractmethod
+    def release(self, job_ids: Iterable[str], worker_id: str) -> None:
+        """Give leased jobs back for immediate redelivery (e.g. on shutdown).
+
+        Args:
+            job_ids: Job IDs
+            worker_id: Worker ID
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> None:
+        """Withdraw a job; a worker running it loses its lease.
+
+        Args:
+            job_id: Job ID
+        """
+        pass
+
+    @abstractmethod
+    def results(self, job_ids: Iterable[str]) -> dict[str, JobResult]:
+        """Get the outcome of the finished jobs among ``job_ids``.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Job ID to result, for finished jobs only
+        """
+        pass
+
+    @abstractmethod
+    def forget(self, job_ids: Iterable[str]) -> None:
+        """Delete jobs whose results were collected.
+
+        Args:
+            job_ids: Job IDs
+        """
+        pass
+
+    def close(self) -> None:  # noqa: B027 (optional hook)
+        """Release resources."""
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    worker_id TEXT,
+    lease_expires REAL,
+    deliveries INTEGER NOT NULL DEFAULT 0,
+    result BLOB,
+    error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, lease_expires);
+"""
+
+# SQLite limits the number of bound parameters per statement
+_CHUNK = 500
+
+
+def _chunks(items: Iterable[str]) -> Iterable[list[str]]:
+    """Split IDs into lists small enough to bind."""
+    chunk: list[str] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == _CHUNK:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SQLiteTaskBroker(TaskBroker):
+    """Broker backed by a SQLite database in WAL mode.
+
+    Every process opens its own broker on the same file; leasing runs in an
+    immediate transaction so that two workers never lease the same job.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_deliveries: int = 3,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        """Open or create the database.
+
+        Args:
+            path: Database file
+            max_deliveries: Deliveries after which a job whose lease expires
+                is failed instead of redelivered
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = os.fspath(path)
+        self.max_deliveries = max_deliveries
+        self._db = sqlite3.connect(
+            self.path, timeout=busy_timeout, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def _expire(self, now: float) -> None:
+        """Fail expired jobs that used up their deliveries."""
+        self._db.execute(
+            "UPDATE jobs SET status = 'failed', worker_id = NULL, error = "
+            "'Lease expired after ' || deliveries || ' deliveries' "
+            "WHERE status = 'leased' AND lease_expires < ? AND deliveries >= ?",
+            (now, self.max_deliveries),
+        )
+
+    def submit(self, job_id: str, payload: bytes) -> None:
+        """Queue a job."""
+        self._db.execute(
+            "INSERT INTO jobs (id, payload, status, created_at) "
+            "VALUES (?, ?, 'queued', ?)",
+            (job_id, payload, time.time()),
+        )
+
+    def lease(
+        self, worker_id: str, limit: int, lease_seconds: float
+    ) -> list[BrokerJob]:
+        """Lease queued jobs, or jobs whose lease expired."""
+        if limit < 1:
+            return []
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._expire(now)
+            rows = self._db.execute(
+                "SELECT id, payload, deliveries FROM jobs "
+                "WHERE status = 'queued' "
+                "OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY rowid LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._db.executemany(
+                "UPDATE jobs SET status = 'leased', worker_id = ?, "
+                "lease_expires = ?, deliveries = deliveries + 1 WHERE id = ?",
+                [(worker_id, now + lease_seconds, job_id) for job_id, _, _ in rows],
+            )
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        return [
+            BrokerJob(id=job_id, payload=payload, deliveries=deliveries + 1)
+            for job_id, payload, deliveries in rows
+        ]
+
+    def heartbeat(
+        self, worker_id: str, job_ids: Iterable[str], lease_seconds: float
+    ) -> set[str]:
+        """Extend the leases of running jobs."""
+        lost: set[str] = set()
+        expires = time.time() + lease_seconds
+        for chunk in _chunks(job_ids):
+            marks = ",".join("?" * len(chunk))
+            self._db.execute(
+                f"UPDATE jobs SET lease_expires = ? WHERE id IN ({marks}) "
+                "AND worker_id = ? AND status = 'leased'",
+                (expires, *chunk, worker_id),
+            )
+            owned = {
+                row[0]
+                for row in self._db.execute(
+                    f"SELECT id FROM jobs WHERE id IN ({marks}) "
+                    "AND worker_id = ? AND status = 'leased'",
+                    (*chunk, worker_id),
+                )
+            }
+            lost.update(set(chunk) - owned)
+        return lost
+
+    def _finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: bytes | None,
+        error: str | None,
+    ) -> bool:
+        """Record the outcome of a leased job."""
+        cursor = self._db.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, worker_id = NULL "
+            "WHERE id = ? AND worker_id = ? AND status = 'leased'",
+            (status, result, error, job_id, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: bytes) -> bool:
+        """Post the result of a job."""
+        return self._finish(job_id, worker_id, "done", result, None)
+
+    def fail(
+        self, job_id: str, worker_id: str, error: str, exception: bytes | None
+    ) -> bool:
+        """Post the failure of a job."""
+        return self._finish(job_id, worker_id, "failed", exception, error)
+
+    def release(self, job_ids: Iterable[str], worker_id: str) -> None:
+        """Give leased jobs back for immediate redelivery."""
+        for chunk in _chunks(job_ids):
+            marks = ",".join("?" * len(chunk))
+            self._db.execute(
+                "UPDATE jobs SET status = 'queued', worker_id = NULL, "
+                "lease_expires = NULL, deliveries = MAX(deliveries - 1, 0) "
+                f"WHERE id IN ({marks}) AND worker_id = ? AND status = 'leased'",
+                (*chunk, worker_id),
+            )
+
+    def cancel(self, job_id: str) -> None:
+        """Withdraw a job."""
+        self._db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def results(self, job_ids: Iterable[str]) -> dict[str, JobResult]:
+        """Get the outcome of the finished jobs among ``job_ids``."""
+        self._expire(time.time())
+        results: dict[str, JobResult] = {}
+        for chunk in _chunks(job_ids):
+            marks = ",".join("?" * len(chunk))
+            for job_id, status, result, error in self._db.execute(
+                f"SELECT id, status, result, error FROM jobs WHERE id IN ({marks}) "
+                "AND status IN ('done', 'failed')",
+                chunk,
+            ):
+                results[job_id] = JobResult(job_id, status, result, error)
+        return results
+
+    def forget(self, job_ids: Iterable[str]) -> None:
+        """Delete jobs whose results were collected."""
+        for chunk in _chunks(job_ids):
+            marks = ",".join("?" * len(chunk))
+            self._db.execute(f"DELETE FROM jobs WHERE id IN ({marks})", chunk)
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per status."""
+        return dict(
+            self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+class DistributedTaskExecutor(TaskExecutor):
+    """Runs task functions on ``TaskWorker`` processes through a broker.
+
+    Functions must be importable by the workers (module-level) and inputs
+    and results picklable.
+    """
+
+    def __init__(
+        self,
+        broker: TaskBroker,
+        max_workers: int = 64,
+        poll_interval: float = 0.05,
+        name: str = "distributed",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            broker: Broker shared with the workers
+            max_workers: Maximum jobs outstanding at once
+            poll_interval: Seconds between polls of the broker for results
+            name: Executor name
+        """
+        super().__init__(name, max_workers)
+        self.broker = broker
+        self.poll_interval = poll_interval
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._poller: asyncio.Task[None] | None = None
+
+    async def _submit(self, func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+        """Queue a job and wait for its result."""
+        try:
+            payload = pickle.dumps((func, inputs), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise TypeError(
+                f"Cannot send {getattr(func, '__qualname__', func)!r} to a worker; "
+                f"distributed tasks need module-level functions and picklable "
+                f"inputs: {e}"
+            ) from e
+
+        job_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = future
+        self.broker.submit(job_id, payload)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if self._pending.pop(job_id, None) is not None:
+                self.broker.cancel(job_id)
+            raise
+
+    async def _poll(self) -> None:
+        """Collect results while jobs are outstanding."""
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                results = self.broker.results(list(self._pending))
+            except Exception as e:
+                logger.warning(f"Executor '{self.name}' could not poll broker: {e}")
+                continue
+            for job_id, result in results.items():
+                future = self._pending.pop(job_id, None)
+                if future is None or future.done():
+                    continue
+                try:
+                    future.set_result(_unpack(result))
+                except Exception as e:
+                    future.set_exception(e)
+            if results:
+                self.broker.forget(results)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop polling and withdraw the outstanding jobs."""
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+        for job_id, future in self._pending.items():
+            self.broker.cancel(job_id)
+            future.cancel()
+        self._pending.clear()
+
+
+def _unpack(result: JobResult) -> Any:
+    """Return a job's value, or raise its error."""
+    if result.status == "done":
+        return pickle.loads(result.result or pickle.dumps(None))
+    error: BaseException | None = None
+    if result.result is not None:
+        try:
+            error = pickle.loads(result.result)
+        except Exception:
+            error = None
+    if isinstance(error, BaseException):
+        raise error
+    raise RemoteTaskError(result.error or f"Job {result.job_id} failed")
+
+
+class TaskWorker:
+    """Leases jobs from a broker and runs them.
+
+    Each job runs in a thread of the worker, so the worker keeps sending
+    heartbeats while a synchronous function holds it; start one worker
+    process per core for CPU-bound functions. Threads cannot be interrupted:
+    a job whose lease is lost keeps its slot until its function returns, and
+    its outcome is then dropped.
+    """
+
+    def __init__(
+        self,
+        broker: TaskBroker,
+        worker_id: str | None = None,
+        concurrency: int = 1,
+        lease_seconds: float = 30.0,
+        heartbeat_interval: float | None = None,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            broker: Broker to lease jobs from
+            worker_id: Worker ID (defaults to host, PID and a random suffix)
+            concurrency: Maximum jobs running at once
+            lease_seconds: Lease duration; a job is redelivered if the worker
+                sends no heartbeat for this long
+            heartbeat_interval: Seconds between heartbeats (defaults to a
+                third of the lease)
+            poll_interval: Seconds between polls when the queue is empty
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.broker = broker
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        )
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.completed = 0
+        self.failed = 0
+        self._running: dict[str, asyncio.Task[None]] = {}
+        # Running jobs whose lease was lost
+        self._lost: set[str] = set()
+        self._wakeup: asyncio.Event | None = None
+        self._stopping = False
+
+    def stop(self) -> None:
+        """Stop leasing; ``run`` returns once the running jobs finish."""
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self, max_idle: float | None = None) -> None:
+        """Lease and run jobs until stopped.
+
+        Args:
+            max_idle: Return after this many seconds without any job
+                (run forever if None)
+        """
+        self._wakeup = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat())
+        idle_since = time.monotonic()
+        logger.info(f"Worker {self.worker_id} started")
+        try:
+            while not self._stopping:
+                free = self.concurrency - len(self._running)
+                jobs = (
+                    self.broker.lease(self.worker_id, free, self.lease_seconds)
+                    if free
+                    else []
+                )
+                for job in jobs:
+                    task = asyncio.create_task(self._execute(job))
+                    self._running[job.id] = task
+                    task.add_done_callback(functools.partial(self._job_done, job.id))
+                if self._running or jobs:
+                    idle_since = time.monotonic()
+                elif max_idle is not None and time.monotonic() - idle_since > max_idle:
+                    break
+                if jobs and len(self._running) < self.concurrency:
+                    # More may be queued: lease again right away
+                    continue
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+            if self._running:
+                await asyncio.wait(set(self._running.values()))
+        except asyncio.CancelledError:
+            # Hand unfinished jobs to other workers without waiting for expiry
+            running = dict(self._running)
+            for task in running.values():
+                task.cancel()
+            self.broker.release(running, self.worker_id)
+            raise
+        finally:
+            heartbeat.cancel()
+            logger.info(
+                f"Worker {self.worker_id} stopped: {self.completed} completed, "
+                f"{self.failed} failed"
+            )
+
+    def _job_done(self, job_id: str, task: asyncio.Task[None]) -> None:
+        """Free the slot of a finished job (done callback of its task)."""
+        self._running.pop(job_id, None)
+        self._lost.discard(job_id)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _heartbeat(self) -> None:
+        """Extend leases and note the jobs this worker lost."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            active = [job_id for job_id in self._running if job_id not in self._lost]
+            if not active:
+                continue
+            try:
+                lost = self.broker.heartbeat(self.worker_id, active, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Worker {self.worker_id} heartbeat failed: {e}")
+                continue
+            for job_id in lost:
+                if job_id in self._running:
+                    logger.warning(f"Worker {self.worker_id} lost job {job_id}")
+                    self._lost.add(job_id)
+
+    async def _execute(self, job: BrokerJob) -> None:
+        """Run one job and post its outcome."""
+        try:
+            func, inputs = pickle.loads(job.payload)
+            result = await asyncio.to_thread(_call, func, inputs)
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if job.id in self._lost:
+                logger.warning(f"Failure of job {job.id} dropped: lease lost")
+                return
+            self.failed += 1
+            logger.error(f"Job {job.id} failed on worker {self.worker_id}: {e}")
+            try:
+                exception: bytes | None = pickle.dumps(e)
+            except Exception:
+                exception = None
+            self.broker.fail(
+                job.id, self.worker_id, f"{type(e).__name__}: {e}", exception
+            )
+            return
+        if job.id not in self._lost and self.broker.complete(
+            job.id, self.worker_id, data
+        ):
+            self.completed += 1
+        else:
+            logger.warning(f"Result of job {job.id} dropped: lease lost")
+
+
+def run_worker(
+    path: str, concurrency: int = 1, max_idle: float | None = None, **kwargs: Any
+) -> None:
+    """Run a ``TaskWorker`` on a SQLite broker until interrupted.
+
+    Args:
+        path: Broker database file
+        concurrency: Maximum jobs running at once
+        max_idle: Return after this many idle seconds (run forever if None)
+        **kwargs: Further ``TaskWorker`` options
+    """
+    broker = SQLiteTaskBroker(path)
+    try:
+        asyncio.run(TaskWorker(broker, concurrency=concurrency, **kwargs).run(max_idle))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start worker processes for a SQLite broker."""
+    parser = argparse.ArgumentParser(
+        description="Run PepperPy orchestration workers on a SQLite broker"
+    )
+    parser.add_argument("path", help="broker database file")
+    parser.add_argument(
+        "--processes", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="jobs per worker process"
+    )
+    parser.add_argument("--lease", type=float, default=30.0, help="lease seconds")
+    parser.add_argument(
+        "--max-idle", type=float, default=None, help="exit after idle seconds"
+    )
+    args = parser.parse_args(argv)
+
+    # Create the database before the workers race to
+    SQLiteTaskBroker(args.path).close()
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(args.path, args.concurrency, args.max_idle),
+            kwargs={"lease_seconds": args.lease},
+            name=f"pepperpy-worker-{i}",
+        )
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
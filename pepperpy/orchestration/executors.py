@@ -0,0 +1,413 @@
+"""
+Task Executors for PepperPy Orchestration.
+
+By default workflow tasks run on the orchestrator's event loop, which is
+right for I/O-bound steps (LLM calls, HTTP) but lets a CPU-bound step (OCR,
+chunking, parsing) stall every concurrent workflow. A task can instead name
+an executor:
+
+- ``"thread"``: a bounded thread pool, for blocking calls and C extensions
+  that release the GIL;
+- ``"process"``: a persistent pool of worker processes, for pure-Python CPU
+  work.
+
+Arguments and results cross the process boundary with pickle protocol 5.
+Out-of-band buffers (bytearrays, NumPy arrays, ...) at least
+``shm_threshold`` bytes large are placed in shared memory instead of being
+copied through the pool's pipe. Functions run in a process must be
+importable, i.e. defined at module level.
+
+Each executor limits the tasks it runs at once to its pool size; the others
+wait in its queue. Queue depth, queue time and run time are reported per
+executor.
+
+Example:
+    ```python
+    def extract_text(pdf: bytes) -> dict:
+        ...
+
+    task = Task("extract", "Extract text", extract_text, executor="process")
+    provider = LocalOrchestrationProvider(
+        executors={"process": ProcessTaskExecutor(max_workers=4, prestart=True)}
+    )
+    ```
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import multiprocessing
+import os
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from pepperpy.core import get_logger
+from pepperpy.core.observability import (
+    create_counter,
+    create_gauge,
+    create_histogram,
+    get_metric,
+)
+
+logger = get_logger("orchestration.executors")
+
+# Buffers from this size are passed through shared memory
+DEFAULT_SHM_THRESHOLD = 1 << 20
+
+# A buffer is either inline bytes or a (shared memory name, size) pair
+_BufferSpec = bytes | tuple[str, int]
+
+
+def _metric(name: str, description: str, factory: Callable[..., Any]) -> Any:
+    """Get or create a metric."""
+    return get_metric(name) or factory(name, description)
+
+
+class TaskExecutor(ABC):
+    """Runs task functions outside the event loop with bounded concurrency."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """Initialize the executor.
+
+        Args:
+            name: Executor name used in metrics and logs
+            max_workers: Maximum functions running at once
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.name = name
+        self.max_workers = max_workers
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self._slots: asyncio.Semaphore | None = None
+
+    async def run(self, func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+        """Run ``func(**inputs)`` on the executor.
+
+        Args:
+            func: Task function (sync, or async for thread and process pools)
+            inputs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        labels = {"executor": self.name}
+        depth = _metric(
+            "orchestration_executor_queue_depth",
+            "Tasks waiting for an executor worker",
+            create_gauge,
+        )
+        queued_at = time.monotonic()
+        self.queued += 1
+        depth.set(self.queued, labels=labels)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+            depth.set(self.queued, labels=labels)
+
+        started = time.monotonic()
+        _metric(
+            "orchestration_executor_queue_seconds",
+            "Time tasks wait for an executor worker",
+            create_histogram,
+        ).observe(started - queued_at, labels=labels)
+        self.running += 1
+        outcome = "error"
+        try:
+            result = await self._submit(func, inputs)
+            outcome = "ok"
+            self.completed += 1
+            return result
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.running -= 1
+            self._slots.release()
+            _metric(
+                "orchestration_executor_run_seconds",
+                "Time tasks run on an executor",
+                create_histogram,
+            ).observe(time.monotonic() - started, labels=labels)
+            _metric(
+                "orchestration_executor_tasks_total",
+                "Tasks run on executors by outcome",
+                create_counter,
+            ).increment(labels={**labels, "outcome": outcome})
+
+    @abstractmethod
+    async def _submit(self, func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+        """Run a function on a free worker."""
+        pass
+
+    async def start(self) -> None:  # noqa: B027 (optional hook)
+        """Prepare the executor's workers."""
+        pass
+
+    def shutdown(self, wait: bool = True) -> None:  # noqa: B027 (optional hook)
+        """Stop the executor's workers.
+
+        Args:
+            wait: Wait for running functions to finish
+        """
+        pass
+
+    def stats(self) -> dict[str, int]:
+        """Current queue and completion counts."""
+        return {
+            "max_workers": self.max_workers,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+def _call(func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+    """Call a task function, running it to completion if it is async."""
+    result = func(**inputs)
+    if inspect.isawaitable(result):
+        result = asyncio.run(_await(result))
+    return result
+
+
+async def _await(awaitable: Any) -> Any:
+    """Await an awaitable (``asyncio.run`` needs a coroutine)."""
+    return await awaitable
+
+
+class ThreadTaskExecutor(TaskExecutor):
+    """Runs task functions in a bounded thread pool."""
+
+    def __init__(self, max_workers: int | None = None, name: str = "thread") -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Pool size (defaults to ``min(32, cpu_count + 4)``)
+            name: Executor name
+        """
+        super().__init__(name, max_workers or min(32, (os.cpu_count() or 1) + 4))
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Create the pool on first use."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix=f"pepperpy-{self.name}"
+            )
+        return self._pool
+
+    async def _submit(self, func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+        """Run a function on a pool thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), functools.partial(_call, func, inputs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+def _encode(
+    value: Any, threshold: int
+) -> tuple[bytes, list[_BufferSpec], list[SharedMemory]]:
+    """Pickle a value, moving large out-of-band buffers to shared memory.
+
+    Returns:
+        Pickle data, buffer specs and the shared memory segments created
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    specs: list[_BufferSpec] = []
+    segments: list[SharedMemory] = []
+    try:
+        for buffer in buffers:
+            with buffer.raw() as view:
+                if view.nbytes < threshold:
+                    specs.append(bytes(view))
+                    continue
+                segment = SharedMemory(create=True, size=view.nbytes)
+                segments.append(segment)
+                assert segment.buf is not None
+                segment.buf[: view.nbytes] = view
+                specs.append((segment.name, view.nbytes))
+    except BaseException:
+        _release(segments, unlink=True)
+        raise
+    return data, specs, segments
+
+
+def _decode(
+    data: bytes, specs: list[_BufferSpec], copy: bool
+) -> tuple[Any, list[SharedMemory]]:
+    """Unpickle a value encoded by ``_encode``.
+
+    Args:
+        data: Pickle data
+        specs: Buffer specs
+        copy: Copy shared buffers so the segments can be released at once
+
+    Returns:
+        The value and the shared memory segments attached
+    """
+    buffers: list[Any] = []
+    segments: list[SharedMemory] = []
+    for spec in specs:
+        if isinstance(spec, bytes):
+            buffers.append(spec)
+            continue
+        name, size = spec
+        segment = SharedMemory(name=name)
+        segments.append(segment)
+        assert segment.buf is not None
+        buffers.append(bytearray(segment.buf[:size]) if copy else segment.buf[:size])
+    return pickle.loads(data, buffers=buffers), segments
+
+
+def _release(segments: list[SharedMemory], unlink: bool) -> None:
+    """Close (and optionally unlink) shared memory segments."""
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            # Still referenced by a live object; the mapping goes with it
+            pass
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _run_in_worker(
+    data: bytes, specs: list[_BufferSpec], threshold: int
+) -> tuple[bytes, list[_BufferSpec]]:
+    """Worker side of ``ProcessTaskExecutor``: decode, call, encode."""
+    (func, inputs), segments = _decode(data, specs, copy=False)
+    try:
+        result = _call(func, inputs)
+        del func, inputs
+        result_data, result_specs, result_segments = _encode(result, threshold)
+    finally:
+        _release(segments, unlink=False)
+    # The parent unlinks the result segments after reading them
+    _release(result_segments, unlink=False)
+    return result_data, result_specs
+
+
+def _warm_up() -> int:
+    """No-op job forcing a worker process to start."""
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def _discard_result(future: concurrent.futures.Future) -> None:
+    """Unlink the result segments of a job nobody is waiting for."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, specs = future.result()
+    for spec in specs:
+        if not isinstance(spec, bytes):
+            try:
+                segment = SharedMemory(name=spec[0])
+            except FileNotFoundError:
+                continue
+            _release([segment], unlink=True)
+
+
+class ProcessTaskExecutor(TaskExecutor):
+    """Runs task functions in a persistent pool of worker processes."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+        mp_context: str | None = None,
+        prestart: bool = False,
+        name: str = "process",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            shm_threshold: Minimum size in bytes of buffers passed through
+                shared memory
+            mp_context: Multiprocessing start method (defaults to "forkserver"
+                where available, else "spawn")
+            prestart: Start every worker in ``start`` instead of on demand
+            name: Executor name
+        """
+        super().__init__(name, max_workers or os.cpu_count() or 1)
+        self.shm_threshold = shm_threshold
+        if mp_context is None:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = "forkserver" if "forkserver" in methods else "spawn"
+        self.mp_context = mp_context
+        self.prestart = prestart
+        self._pool: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Create the pool on first use."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context),
+            )
+        return self._pool
+
+    async def start(self) -> None:
+        """Start the worker processes if ``prestart`` is set."""
+        if self.prestart:
+            await self.warm()
+
+    async def warm(self) -> None:
+        """Start every worker process now rather than on first use."""
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *(loop.run_in_executor(pool, _warm_up) for _ in range(self.max_workers))
+        )
+        logger.debug(f"Executor '{self.name}' warmed {len(set(pids))} workers")
+
+    async def _submit(self, func: Callable[..., Any], inputs: dict[str, Any]) -> Any:
+        """Run a function in a worker process."""
+        try:
+            data, specs, segments = _encode((func, inputs), self.shm_threshold)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise TypeError(
+                f"Cannot send {getattr(func, '__qualname__', func)!r} to a worker "
+                f"process; process tasks need module-level functions and "
+                f"picklable inputs: {e}"
+            ) from e
+
+        job = self._get_pool().submit(_run_in_worker, data, specs, self.shm_threshold)
+        try:
+            result_data, result_specs = await asyncio.wrap_future(job)
+        except asyncio.CancelledError:
+            job.add_done_callback(_discard_result)
+            raise
+        finally:
+            _release(segments, unlink=True)
+
+        result, result_segments = _decode(result_data, result_specs, copy=True)
+        _release(result_segments, unlink=True)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
@@ -6,17 +6,29 @@
 """
 
 import asyncio
+import inspect
 import uuid
 from datetime import datetime
 from typing import Any
 
 from pepperpy.core import get_logger
 from pepperpy.orchestration.base import OrchestrationProvider
+from pepperpy.orchestration.cache import MISSING, TaskCache, task_cache_key
+from pepperpy.orchestration.checkpoint import CheckpointStore, checkpoint_key
+from pepperpy.orchestration.dag import DAGScheduler
+from pepperpy.orchestration.executors import (
+    ProcessTaskExecutor,
+    TaskExecutor,
+    ThreadTaskExecutor,
+)
+from pepperpy.orchestration.scheduler import TaskScheduler
+from pepperpy.orchestration.store import ExecutionStore, MemoryExecutionStore
 from pepperpy.workflow.models import (
     ExecutionStatus,
     Task,
     TaskExecution,
     TaskStatus,
+    TaskTimeoutError,
     Workflow,
     WorkflowExecution,
 )
@@ -32,7 +44,12 @@ class LocalOrchestrationProvider(OrchestrationProvider):
     def __init__(
         self,
         max_concurrent_tasks: int = 5,
-        execution_timeout: int = 300,
+        execution_timeout: float | None = 300,
+        store: ExecutionStore | None = None,
+        checkpoints: CheckpointStore | None = None,
+        executors: dict[str, TaskExecutor] | None = None,
+        cache: TaskCache | None = None,
+        scheduler: TaskScheduler | None = None,
         **kwargs,
     ):
         """Initialize the local orchestration provider.
@@ -40,25 +57,63 @@ def __init__(
         Args:
             max_concurrent_tasks: Maximum number of tasks to execute concurrently
             execution_timeout: Maximum execution time for a workflow in seconds
+                (None for no limit); running tasks are cancelled when it expires
+            store: Execution history store (defaults to an in-memory LRU of
+                the last 1000 finished executions)
+            checkpoints: Optional store of completed task outputs; runs with
+                the same workflow version and inputs skip checkpointed tasks
+            executors: Executors tasks can select by name, in addition to the
+                default "thread" and "process" pools (which they can replace)
+            cache: Optional store of task outputs by input hash, used by
+                tasks created with ``cache=True``
+            scheduler: Optional global scheduler sharing a fixed number of
+                task slots between executions by priority class and tenant;
+                ``max_concurrent_tasks`` then only limits each execution
             **kwargs: Additional configuration options
         """
         super().__init__(**kwargs)
         self.max_concurrent_tasks = max_concurrent_tasks
         self.execution_timeout = execution_timeout
         self.logger = get_logger("orchestration.local")
+        # ``executions`` only holds executions in progress; history is in the store
+        self.store = store or MemoryExecutionStore()
+        self.checkpoints = checkpoints
+        self._checkpoint_keys: dict[str, str] = {}
+        # Executions whose checkpoints a run reused and clears once it completes
+        self._checkpoint_writers: dict[str, set[str]] = {}
+        self.cache = cache
+        self.scheduler = scheduler
+        # Execution ID to (priority class, fair-share flow)
+        self._admission: dict[str, tuple[str, str]] = {}
+        self.executors: dict[str, TaskExecutor] = {
+            "thread": ThreadTaskExecutor(),
+            "process": ProcessTaskExecutor(),
+            **(executors or {}),
+        }
+        self._schedulers: dict[str, DAGScheduler] = {}
+        self._execution_tasks: dict[str, asyncio.Task[None]] = {}
 
     async def initialize(self) -> None:
         """Initialize the provider."""
         await super().initialize()
         self.logger.debug("Initializing local orchestration provider")
+        for executor in self.executors.values():
+            await executor.start()
 
     async def cleanup(self) -> None:
         """Clean up resources."""
         self.logger.debug("Cleaning up local orchestration provider")
         # Cancel any running executions
-        for execution_id, execution in self.executions.items():
+        for execution_id, execution in list(self.executions.items()):
             if execution.status == ExecutionStatus.RUNNING:
                 await self.cancel_execution(execution_id)
+        for executor in self.executors.values():
+            executor.shutdown(wait=False)
+        self.store.close()
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+        if self.cache is not None:
+            self.cache.close()
         await super().cleanup()
 
     async def register_workflow(self, workflow: Workflow) -> None:
@@ -94,6 +149,9 @@ async def execute_workflow(
         workflow_id: str,
         inputs: dict[str, Any] | None = None,
         execution_id: str | None = None,
+        timeout: float | None = None,
+        priority: str | None = None,
+        tenant: str | None = None,
     ) -> str:
         """Execute a workflow.
 
@@ -101,12 +159,19 @@ async def execute_workflow(
             workflow_id: Workflow ID
             inputs: Workflow inputs
             execution_id: Optional execution ID (generated if not provided)
+            timeout: Optional deadline in seconds, overriding
+                ``execution_timeout``
+            priority: Priority class of the tasks (defaults to the workflow's
+                "priority" metadata, then the scheduler's default class)
+            tenant: Tenant the tasks are fair-shared as (defaults to the
+                workflow's "tenant" metadata, then the workflow ID)
 
         Returns:
             Execution ID
 
         Raises:
-            ValueError: If workflow not found
+            ValueError: If workflow not found, its task graph is invalid or
+                the priority class is unknown
         """
         workflow = await self.get_workflow(workflow_id)
         if not workflow:
@@ -121,16 +186,186 @@ async def execute_workflow(
             inputs=inputs or {},
             created_at=datetime.now(),
         )
-        self.executions[execution_id] = execution
-
-        # Start execution in background
-        asyncio.create_task(self._execute_workflow_tasks(execution))
+        self._start_execution(
+            execution, workflow, timeout, priority=priority, tenant=tenant
+        )
 
         self.logger.info(
             f"Started workflow execution {execution_id} for workflow {workflow_id}"
         )
         return execution_id
 
+    async def resume(
+        self,
+        execution_id: str,
+        timeout: float | None = None,
+        priority: str | None = None,
+        tenant: str | None = None,
+    ) -> str:
+        """Resume a failed, cancelled or interrupted execution.
+
+        Tasks that completed in the previous attempt (or that have a
+        checkpoint) are not run again; the execution continues from the
+        first tasks that did not complete, under the same execution ID.
+
+        Args:
+            execution_id: Execution ID
+            timeout: Optional deadline in seconds, overriding
+                ``execution_timeout``
+            priority: Priority class of the remaining tasks
+            tenant: Tenant the remaining tasks are fair-shared as
+
+        Returns:
+            Execution ID
+
+        Raises:
+            ValueError: If the execution is unknown or still running, or its
+                workflow is not registered
+        """
+        if execution_id in self.executions:
+            raise ValueError(f"Execution {execution_id} is still running")
+        previous = self.store.get_execution(execution_id)
+        if previous is None:
+            raise ValueError(f"Execution {execution_id} not found")
+        if previous.status == ExecutionStatus.COMPLETED:
+            return execution_id
+        workflow = await self.get_workflow(previous.workflow_id)
+        if not workflow:
+            raise ValueError(f"Workflow {previous.workflow_id} not found")
+
+        execution = WorkflowExecution(
+            id=execution_id,
+            workflow_id=previous.workflow_id,
+            status=ExecutionStatus.PENDING,
+            inputs=previous.inputs,
+            created_at=previous.created_at,
+        )
+        self._start_execution(
+            execution, workflow, timeout, previous, priority=priority, tenant=tenant
+        )
+
+        self.logger.info(f"Resumed workflow execution {execution_id}")
+        return execution_id
+
+    def _start_execution(
+        self,
+        execution: WorkflowExecution,
+        workflow: Workflow,
+        timeout: float | None,
+        previous: WorkflowExecution | None = None,
+        priority: str | None = None,
+        tenant: str | None = None,
+    ) -> None:
+        """Create task executions and start running the workflow.
+
+        Args:
+            execution: New execution record
+            workflow: Workflow definition
+            timeout: Deadline in seconds overriding ``execution_timeout``
+            previous: Earlier attempt of the same execution to resume from
+            priority: Priority class of the tasks
+            tenant: Tenant the tasks are fair-shared as
+
+        Raises:
+            ValueError: If the task graph or priority class is invalid
+        """
+        admission = None
+        if self.scheduler is not None:
+            admission = (
+                self.scheduler.resolve_class(
+                    priority or workflow.metadata.get("priority")
+                ),
+                tenant or workflow.metadata.get("tenant") or workflow.id,
+            )
+        for task in workflow.tasks.values():
+            if task.executor is not None and task.executor not in self.executors:
+                raise ValueError(
+                    f"Task {task.id} uses unknown executor '{task.executor}'"
+                )
+
+        # Outputs of tasks that do not need to run again
+        restored: dict[str, TaskExecution] = {}
+        # Task executions run again keep their IDs so the journal stays coherent
+        previous_ids: dict[str, str] = {}
+        if previous is not None:
+            for task_execution in previous.task_executions.values():
+                previous_ids[task_execution.task_id] = task_execution.id
+                if (
+                    task_execution.status == TaskStatus.COMPLETED
+                    and task_execution.task_id in workflow.tasks
+                ):
+                    restored[task_execution.task_id] = task_execution
+        key = None
+        checkpointed: dict[str, Any] = {}
+        writers: set[str] = set()
+        if self.checkpoints is not None:
+            key = checkpoint_key(workflow, execution.inputs)
+            checkpointed = {
+                task_id: outputs
+                for task_id, outputs in self.checkpoints.load(key).items()
+                if task_id in workflow.tasks and task_id not in restored
+            }
+            # Checkpoints of executions still running here are left to them
+            writers = self.checkpoints.executions(key) - set(self._schedulers)
+
+        # Create task executions for all tasks
+        task_executions: dict[str, TaskExecution] = {}
+        for task_id in workflow.tasks:
+            task_execution = restored.get(task_id) or TaskExecution(
+                id=previous_ids.get(task_id) or str(uuid.uuid4()),
+                task_id=task_id,
+                workflow_execution_id=execution.id,
+                status=TaskStatus.PENDING,
+            )
+            if task_id in checkpointed:
+                task_execution.status = TaskStatus.COMPLETED
+                task_execution.outputs = checkpointed[task_id]
+                task_execution.completed_at = datetime.now()
+            task_executions[task_id] = task_execution
+            execution.task_executions[task_execution.id] = task_execution
+
+        async def run_task(task_id: str) -> dict[str, Any]:
+            return await self._run_task(
+                workflow.tasks[task_id], workflow, execution, task_executions
+            )
+
+        # Validates the graph before anything is recorded
+        scheduler = DAGScheduler(
+            nodes=workflow.tasks,
+            dependencies=workflow.dependencies,
+            run=run_task,
+            max_concurrency=self.max_concurrent_tasks,
+            completed={
+                task_id: task_executions[task_id].outputs
+                for task_id in (*restored, *checkpointed)
+            },
+        )
+        self.executions[execution.id] = execution
+        self.store.save_execution(execution)
+        for task_id in checkpointed:
+            self._record_task(task_executions[task_id])
+        if restored or checkpointed:
+            self.logger.info(
+                f"Execution {execution.id}: skipping "
+                f"{len(restored) + len(checkpointed)} completed tasks"
+            )
+        self._schedulers[execution.id] = scheduler
+        if key is not None:
+            self._checkpoint_keys[execution.id] = key
+            self._checkpoint_writers[execution.id] = writers | {execution.id}
+        if admission is not None:
+            self._admission[execution.id] = admission
+
+        # Start execution in background
+        self._execution_tasks[execution.id] = asyncio.create_task(
+            self._execute_workflow_tasks(
+                execution,
+                workflow,
+                task_executions,
+                timeout if timeout is not None else self.execution_timeout,
+            )
+        )
+
     async def get_execution(self, execution_id: str) -> WorkflowExecution | None:
         """Get a workflow execution by ID.
 
@@ -140,11 +375,39 @@ async def get_execution(self, execution_id: str) -> WorkflowExecution | None:
         Returns:
             Execution if found, None otherwise
         """
-        return self.executions.get(execution_id)
+        execution = self.executions.get(execution_id)
+        if execution is None:
+            execution = self.store.get_execution(execution_id)
+        return execution
+
+    def task_future(self, execution_id: str, task_id: str) -> asyncio.Future[Any]:
+        """Future resolving to a task's outputs within a running execution.
+
+        The future raises the task's error if it fails and is cancelled if the
+        task never runs.
+
+        Args:
+            execution_id: Execution ID
+            task_id: Task ID
+
+        Returns:
+            Completion future of the task
+
+        Raises:
+            ValueError: If the execution is not running
+            KeyError: If the task is not part of the workflow
+        """
+        scheduler = self._schedulers.get(execution_id)
+        if scheduler is None:
+            raise ValueError(f"Execution {execution_id} is not running")
+        return scheduler.future(task_id)
 
     async def cancel_execution(self, execution_id: str) -> bool:
         """Cancel a workflow execution.
 
+        Running tasks are cancelled and their ``on_cancel`` hooks awaited
+        before this method returns.
+
         Args:
             execution_id: Execution ID
 
@@ -159,121 +422,119 @@ async def cancel_execution(self, execution_id: str) -> bool:
         if not execution.is_terminal():
             execution.status = ExecutionStatus.CANCELED
             execution.completed_at = datetime.now()
+            scheduler = self._schedulers.get(execution_id)
+            if scheduler is not None:
+                scheduler.cancel()
+            runner = self._execution_tasks.get(execution_id)
+            if runner is not None and runner is not asyncio.current_task():
+                await asyncio.wait({runner})
             self.logger.info(f"Cancelled workflow execution {execution_id}")
             return True
 
         return False
 
     async def list_executions(
-        self, workflow_id: str | None = None
+        self,
+        workflow_id: str | None = None,
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
     ) -> list[WorkflowExecution]:
-        """List workflow executions.
+        """List workflow executions, most recent first.
 
         Args:
             workflow_id: Optional workflow ID to filter by
+            status: Optional status to filter by
+            since: Only executions created at or after this time
+            until: Only executions created before this time
+            limit: Maximum number of executions
 
         Returns:
             List of workflow executions
         """
-        if workflow_id:
-            return [
-                execution
-                for execution in self.executions.values()
-                if execution.workflow_id == workflow_id
-            ]
-        return list(self.executions.values())
-
-    async def _execute_workflow_tasks(self, execution: WorkflowExecution) -> None:
+        executions = self.store.list_executions(
+            workflow_id=workflow_id,
+            status=status,
+            since=since,
+            until=until,
+            limit=limit,
+        )
+        # Prefer the live objects of executions in progress
+        return [self.executions.get(e.id, e) for e in executions]
+
+    def _execution_finished(self, execution_id: str) -> bool:
+        """Whether an execution is no longer in progress."""
+        return execution_id not in self.executions
+
+    def _record_task(self, task_execution: TaskExecution) -> None:
+        """Journal a task transition and publish it to subscribers.
+
+        Args:
+            task_execution: Task execution in its new state
+        """
+        self.store.record_task(task_execution)
+        self._publish_event(
+            task_execution.workflow_execution_id,
+            task_execution.status,
+            task_execution.task_id,
+            task_execution.error,
+        )
+
+    async def _execute_workflow_tasks(
+        self,
+        execution: WorkflowExecution,
+        workflow: Workflow,
+        task_executions: dict[str, TaskExecution],
+        timeout: float | None,
+    ) -> None:
         """Execute the tasks in a workflow.
 
-        This method handles the actual execution of tasks, respecting
-        dependencies and managing state.
+        Tasks are dispatched by a ``DAGScheduler`` the moment their last
+        dependency completes, up to ``max_concurrent_tasks`` at once. The first
+        failure stops dispatching; tasks already running are left to finish.
+        When the deadline expires, running tasks are cancelled.
 
         Args:
             execution: Workflow execution
+            workflow: Workflow definition
+            task_executions: Dict of task ID to execution
+            timeout: Deadline in seconds, or None
         """
-        workflow = await self.get_workflow(execution.workflow_id)
-        if not workflow:
-            execution.status = ExecutionStatus.FAILED
-            execution.error = f"Workflow {execution.workflow_id} not found"
-            return
-
+        scheduler = self._schedulers[execution.id]
         try:
             # Update execution status
-            execution.status = ExecutionStatus.RUNNING
+            if execution.status == ExecutionStatus.PENDING:
+                execution.status = ExecutionStatus.RUNNING
+                self._publish_event(execution.id, ExecutionStatus.RUNNING)
             execution.started_at = datetime.now()
-
-            # Create task executions for all tasks
-            task_executions: dict[str, TaskExecution] = {}
-            for task_id, task in workflow.tasks.items():
-                task_execution = TaskExecution(
-                    id=str(uuid.uuid4()),
-                    task_id=task_id,
-                    workflow_execution_id=execution.id,
-                    status=TaskStatus.PENDING,
+            self.store.save_execution(execution)
+
+            done = scheduler.start()
+            try:
+                await asyncio.wait_for(asyncio.shield(done), timeout)
+            except TimeoutError:
+                self.logger.warning(
+                    f"Workflow execution {execution.id} timed out after {timeout}s"
                 )
-                task_executions[task_id] = task_execution
-                execution.task_executions[task_execution.id] = task_execution
-
-            # Initialize task state
-            completed_tasks: set[str] = set()
-            failed_tasks: set[str] = set()
-            pending_tasks: set[str] = set(workflow.tasks.keys())
-            running_tasks: set[str] = set()
-
-            # Process tasks until all are completed or we hit an error
-            while pending_tasks or running_tasks:
-                # Check if any running tasks can be started (have all dependencies met)
-                ready_tasks = [
-                    task_id
-                    for task_id in pending_tasks
-                    if all(
-                        dep in completed_tasks
-                        for dep in workflow.get_task_dependencies(task_id)
-                    )
-                ]
-
-                # Start ready tasks (up to max concurrent)
-                while ready_tasks and len(running_tasks) < self.max_concurrent_tasks:
-                    task_id = ready_tasks.pop(0)
-                    task = workflow.tasks[task_id]
-                    task_execution = task_executions[task_id]
-
-                    # Move task to running state
-                    pending_tasks.remove(task_id)
-                    running_tasks.add(task_id)
-                    task_execution.status = TaskStatus.RUNNING
-                    task_execution.started_at = datetime.now()
-
-                    # Prepare task inputs
-                    task_inputs = self._prepare_task_inputs(
-                        task, workflow, task_executions, execution.inputs
-                    )
-                    task_execution.inputs = task_inputs
-
-                    # Start task execution
-                    asyncio.create_task(
-                        self._execute_task(
-                            task,
-                            task_execution,
-                            task_executions,
-                            running_tasks,
-                            completed_tasks,
-                            failed_tasks,
-                        )
-                    )
-
-                # Wait a bit before checking again
-                await asyncio.sleep(0.1)
-
-                # Check if we failed
-                if failed_tasks:
+                if execution.status == ExecutionStatus.RUNNING:
                     execution.status = ExecutionStatus.FAILED
-                    execution.error = "One or more tasks failed"
-                    break
+                    execution.error = f"Workflow execution timed out after {timeout}s"
+                scheduler.cancel()
+                await asyncio.shield(done)
+            except asyncio.CancelledError:
+                scheduler.cancel()
+                raise
+            if scheduler.errors and execution.status == ExecutionStatus.RUNNING:
+                execution.status = ExecutionStatus.FAILED
+                execution.error = "One or more tasks failed"
+
+            for task_id in scheduler.skipped:
+                task_executions[task_id].status = TaskStatus.CANCELED
+                self._record_task(task_executions[task_id])
 
             # Update execution status
-            if execution.status != ExecutionStatus.FAILED:
+            if execution.status == ExecutionStatus.RUNNING:
                 execution.status = ExecutionStatus.COMPLETED
 
                 # Collect outputs from exit tasks
@@ -282,7 +543,7 @@ async def _execute_workflow_tasks(self, execution: WorkflowExecution) -> None:
                     task_execution = task_executions[task_id]
                     execution.outputs.update(task_execution.outputs)
 
-            execution.completed_at = datetime.now()
+            execution.completed_at = execution.completed_at or datetime.now()
             self.logger.info(
                 f"Workflow execution {execution.id} completed with status {execution.status}"
             )
@@ -293,53 +554,227 @@ async def _execute_workflow_tasks(self, execution: WorkflowExecution) -> None:
             execution.error = str(e)
             execution.completed_at = datetime.now()
 
-    async def _execute_task(
+        finally:
+            del self._schedulers[execution.id]
+            del self._execution_tasks[execution.id]
+            self.store.save_execution(execution)
+            self.executions.pop(execution.id, None)
+            self._admission.pop(execution.id, None)
+            key = self._checkpoint_keys.pop(execution.id, None)
+            writers = self._checkpoint_writers.pop(execution.id, set())
+            if (
+                self.checkpoints is not None
+                and key is not None
+                and execution.status == ExecutionStatus.COMPLETED
+            ):
+                # Checkpoints only serve to resume unfinished runs; those of
+                # other executions still running are theirs to clear
+                for writer in writers:
+                    self.checkpoints.delete(key, writer)
+            self._finish_execution(execution)
+
+    async def _run_task(
         self,
         task: Task,
-        task_execution: TaskExecution,
+        workflow: Workflow,
+        execution: WorkflowExecution,
         task_executions: dict[str, TaskExecution],
-        running_tasks: set[str],
-        completed_tasks: set[str],
-        failed_tasks: set[str],
-    ) -> None:
-        """Execute a single task.
+    ) -> dict[str, Any]:
+        """Wait for a scheduler slot, if any, then run a ready task.
 
         Args:
             task: Task to execute
-            task_execution: Task execution record
-            task_executions: Dict of all task executions
-            running_tasks: Set of currently running task IDs
-            completed_tasks: Set of completed task IDs
-            failed_tasks: Set of failed task IDs
+            workflow: Workflow definition
+            execution: Workflow execution
+            task_executions: Dict of task ID to execution
+
+        Returns:
+            Task outputs
         """
+        admission = self._admission.get(execution.id)
+        if self.scheduler is None or admission is None:
+            return await self._run_admitted_task(
+                task, workflow, execution, task_executions
+            )
         try:
-            self.logger.debug(f"Executing task {task.id}: {task.name}")
+            await self.scheduler.acquire(*admission)
+        except asyncio.CancelledError:
+            task_execution = task_executions[task.id]
+            task_execution.status = TaskStatus.CANCELED
+            task_execution.completed_at = datetime.now()
+            self._record_task(task_execution)
+            raise
+        try:
+            return await self._run_admitted_task(
+                task, workflow, execution, task_executions
+            )
+        finally:
+            self.scheduler.release()
 
-            # Execute the task
-            outputs = await task.execute(task_execution.inputs)
+    async def _run_admitted_task(
+        self,
+        task: Task,
+        workflow: Workflow,
+        execution: WorkflowExecution,
+        task_executions: dict[str, TaskExecution],
+    ) -> dict[str, Any]:
+        """Prepare a ready task and execute it.
 
-            # Update task execution
+        Args:
+            task: Task to execute
+            workflow: Workflow definition
+            execution: Workflow execution
+            task_executions: Dict of task ID to execution
+
+        Returns:
+            Task outputs
+        """
+        task_execution = task_executions[task.id]
+        task_execution.status = TaskStatus.RUNNING
+        task_execution.started_at = datetime.now()
+        self._record_task(task_execution)
+        task_execution.inputs = self._prepare_task_inputs(
+            task, workflow, task_executions, execution.inputs
+        )
+        cache_key = None
+        outputs: dict[str, Any] = MISSING
+        if task.cache and self.cache is not None:
+            try:
+                cache_key = task_cache_key(task, task_execution.inputs)
+            except TypeError as e:
+                self.logger.warning(f"Not caching task {task.id}: {e}")
+            else:
+                try:
+                    outputs = self.cache.get(cache_key)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Could not read cache of task {task.id}: {e}"
+                    )
+        if outputs is not MISSING:
+            self.logger.debug(f"Task {task.id} served from cache")
             task_execution.status = TaskStatus.COMPLETED
             task_execution.outputs = outputs
+            task_execution.cached = True
             task_execution.completed_at = datetime.now()
+            self._record_task(task_execution)
+        else:
+            outputs = await self._execute_and_cache(task, task_execution, cache_key)
+
+        key = self._checkpoint_keys.get(execution.id)
+        if self.checkpoints is not None and key is not None:
+            try:
+                self.checkpoints.save(key, task.id, outputs, execution.id)
+            except Exception as e:
+                self.logger.warning(f"Could not checkpoint task {task.id}: {e}")
+        return outputs
+
+    async def _execute_and_cache(
+        self, task: Task, task_execution: TaskExecution, cache_key: str | None
+    ) -> dict[str, Any]:
+        """Execute a task, running its cleanup hook if it is cancelled.
 
-            # Update task sets
-            running_tasks.remove(task.id)
-            completed_tasks.add(task.id)
+        Args:
+            task: Task to execute
+            task_execution: Task execution record
+            cache_key: Key to cache the outputs under, if the task is cached
 
-            self.logger.debug(f"Task {task.id} completed successfully")
+        Returns:
+            Task outputs
+        """
+        try:
+            outputs = await self._execute_task(task, task_execution)
+        except asyncio.CancelledError:
+            self.logger.info(f"Task {task.id} cancelled")
+            task_execution.status = TaskStatus.CANCELED
+            task_execution.completed_at = datetime.now()
+            self._record_task(task_execution)
+            await self._run_cancel_hook(task, task_execution)
+            raise
 
-        except Exception as e:
-            self.logger.error(f"Task {task.id} failed: {e}")
+        if self.cache is not None and cache_key is not None:
+            try:
+                self.cache.set(cache_key, task, outputs)
+            except Exception as e:
+                self.logger.warning(f"Could not cache task {task.id}: {e}")
+        return outputs
 
-            # Update task execution
-            task_execution.status = TaskStatus.FAILED
-            task_execution.error = str(e)
-            task_execution.completed_at = datetime.now()
+    async def _execute_task(
+        self, task: Task, task_execution: TaskExecution
+    ) -> dict[str, Any]:
+        """Execute a single task, applying its timeout and retry policy.
+
+        Args:
+            task: Task to execute
+            task_execution: Task execution record
+
+        Returns:
+            Task outputs
+
+        Raises:
+            Exception: The last error of the task, after recording the failure
+        """
+        policy = task.retry_policy
+        while True:
+            task_execution.attempts += 1
+            try:
+                self.logger.debug(f"Executing task {task.id}: {task.name}")
+
+                # Execute the task
+                try:
+                    outputs = await asyncio.wait_for(
+                        task.execute(
+                            task_execution.inputs,
+                            self.executors.get(task.executor or ""),
+                        ),
+                        task.timeout,
+                    )
+                except TimeoutError:
+                    await self._run_cancel_hook(task, task_execution)
+                    raise TaskTimeoutError(task.id, task.timeout or 0) from None
+
+                # Update task execution
+                task_execution.status = TaskStatus.COMPLETED
+                task_execution.outputs = outputs
+                task_execution.completed_at = datetime.now()
+                self._record_task(task_execution)
+
+                self.logger.debug(f"Task {task.id} completed successfully")
+                return outputs
+
+            except Exception as e:
+                if policy and policy.should_retry(e, task_execution.attempts):
+                    delay = policy.get_delay(task_execution.attempts)
+                    self.logger.warning(
+                        f"Task {task.id} attempt {task_execution.attempts} failed: "
+                        f"{e}; retrying in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
 
-            # Update task sets
-            running_tasks.remove(task.id)
-            failed_tasks.add(task.id)
+                self.logger.error(f"Task {task.id} failed: {e}")
+
+                # Update task execution
+                task_execution.status = TaskStatus.FAILED
+                task_execution.error = str(e)
+                task_execution.completed_at = datetime.now()
+                self._record_task(task_execution)
+                raise
+
+    async def _run_cancel_hook(self, task: Task, task_execution: TaskExecution) -> None:
+        """Run a task's cleanup hook, logging its errors.
+
+        Args:
+            task: Cancelled or timed-out task
+            task_execution: Task execution record
+        """
+        if task.on_cancel is None:
+            return
+        try:
+            result = task.on_cancel(task_execution.inputs)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.error(f"Cleanup hook of task {task.id} failed: {e}")
 
     def _prepare_task_inputs(
         self,
@@ -2,7 +2,7 @@
 
 from typing import Any, TypeVar
 
-from pepperpy.orchestration.base import OrchestrationProvider
+from pepperpy.orchestration.base import ExecutionHandle, OrchestrationProvider
 from pepperpy.orchestration.local import LocalOrchestrationProvider
 from pepperpy.workflow.models import Task, Workflow, WorkflowExecution
 
@@ -155,6 +155,7 @@ async def execute(
         workflow: Workflow,
         inputs: dict[str, Any] | None = None,
         wait: bool = True,
+        timeout: float | None = None,
     ) -> WorkflowExecution | None:
         """Execute a workflow.
 
@@ -162,10 +163,28 @@ async def execute(
             workflow: Workflow to execute
             inputs: Optional workflow inputs
             wait: Whether to wait for completion
+            timeout: Maximum seconds to wait (forever if None)
 
         Returns:
             Workflow execution if wait is True, None otherwise
         """
+        handle = await self.start(workflow, inputs)
+        if wait:
+            return await handle.wait(timeout)
+        return None
+
+    async def start(
+        self, workflow: Workflow, inputs: dict[str, Any] | None = None
+    ) -> ExecutionHandle:
+        """Start a workflow without waiting for it.
+
+        Args:
+            workflow: Workflow to execute
+            inputs: Optional workflow inputs
+
+        Returns:
+            Awaitable handle streaming the execution's progress
+        """
         # Initialize if needed
         await self.initialize()
 
@@ -179,22 +198,10 @@ async def execute(
             await self._provider.register_workflow(workflow)
 
         # Execute workflow
-        execution_id = await self._provider.execute_workflow(
+        return await self._provider.start_workflow(
             workflow_id=workflow.id, inputs=inputs or {}
         )
 
-        # Wait for completion if requested
-        if wait:
-            execution = await self._provider.get_execution(execution_id)
-            while execution and not execution.is_terminal():
-                import asyncio
-
-                await asyncio.sleep(0.1)
-                execution = await self._provider.get_execution(execution_id)
-            return execution
-
-        return None
-
     async def cancel(self, execution_id: str) -> bool:
         """Cancel a workflow execution.
 
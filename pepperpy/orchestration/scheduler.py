@@ -0,0 +1,320 @@
+"""
+Global Task Scheduler for PepperPy Orchestration.
+
+Each execution's ``DAGScheduler`` decides *which* of its tasks are ready;
+the ``TaskScheduler`` decides which ready task, across all executions, gets
+one of a fixed number of worker slots. Without it, a 5,000-task batch job
+keeps the event loop busy in discovery order and interactive requests wait
+behind it.
+
+When a slot frees up the scheduler picks:
+
+1. a priority class: the highest priority wins, but a class with waiting
+   requests gains one priority point per ``aging`` seconds it goes without
+   being served, so low-priority work is delayed rather than starved;
+2. within the class, a flow (a tenant, or the workflow ID): start-time fair
+   queuing shares the class's slots between flows in proportion to their
+   weights, however many tasks each flow has queued.
+
+Example:
+    ```python
+    scheduler = TaskScheduler(
+        max_slots=16,
+        classes={"interactive": 10, "default": 5, "batch": 0},
+        weights={"tenant-a": 2.0},
+    )
+    provider = LocalOrchestrationProvider(scheduler=scheduler)
+    await provider.execute_workflow("report", inputs, priority="batch")
+    ```
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+from pepperpy.core import get_logger
+from pepperpy.core.observability import (
+    create_counter,
+    create_gauge,
+    create_histogram,
+    get_metric,
+)
+
+logger = get_logger("orchestration.scheduler")
+
+# Default priority classes; higher is served first
+DEFAULT_CLASSES = {"interactive": 10, "default": 5, "batch": 0}
+
+
+def _metric(name: str, description: str, factory: Callable[..., Any]) -> Any:
+    """Get or create a metric."""
+    return get_metric(name) or factory(name, description)
+
+
+class _Waiter:
+    """A request for a slot."""
+
+    __slots__ = ("enqueued_at", "future")
+
+    def __init__(self, future: asyncio.Future[None]) -> None:
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class _ClassQueue:
+    """Fair queue of the requests of one priority class."""
+
+    def __init__(self, priority: float) -> None:
+        self.priority = priority
+        # (start tag, arrival order, waiter)
+        self.heap: list[tuple[float, int, _Waiter]] = []
+        self.virtual_time = 0.0
+        self.last_finish: dict[str, float] = {}
+        self.last_served = 0.0
+        self.queued = 0
+        self.dispatched = 0
+        self.wait_seconds = 0.0
+
+    def head(self) -> _Waiter | None:
+        """The next request, dropping cancelled ones."""
+        while self.heap and self.heap[0][2].future.done():
+            heapq.heappop(self.heap)
+        return self.heap[0][2] if self.heap else None
+
+
+class TaskScheduler:
+    """Shares a fixed number of task slots between priority classes and flows."""
+
+    def __init__(
+        self,
+        max_slots: int = 8,
+        classes: Mapping[str, float] | None = None,
+        default_class: str = "default",
+        aging: float | None = 30.0,
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_slots: Maximum tasks running at once
+            classes: Priority class name to priority (higher is served first)
+            default_class: Class of requests that do not name one
+            aging: Seconds of waiting worth one priority point (None disables
+                aging, making priorities strict)
+            weights: Flow (tenant or workflow ID) to fair-share weight;
+                flows not listed weigh 1
+
+        Raises:
+            ValueError: If a setting is invalid
+        """
+        if max_slots < 1:
+            raise ValueError("max_slots must be at least 1")
+        classes = dict(classes or DEFAULT_CLASSES)
+        if default_class not in classes:
+            raise ValueError(f"Unknown default priority class '{default_class}'")
+        if aging is not None and aging <= 0:
+            raise ValueError("aging must be positive")
+        self.max_slots = max_slots
+        self.default_class = default_class
+        self.aging = aging
+        self.running = 0
+        self._classes = {
+            name: _ClassQueue(priority) for name, priority in classes.items()
+        }
+        self._weights: dict[str, float] = {}
+        for flow, weight in (weights or {}).items():
+            self.set_weight(flow, weight)
+        self._order = itertools.count()
+
+    @property
+    def classes(self) -> list[str]:
+        """Priority class names, highest priority first."""
+        return sorted(self._classes, key=lambda name: -self._classes[name].priority)
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(queue.queued for queue in self._classes.values())
+
+    def set_weight(self, flow: str, weight: float) -> None:
+        """Set the fair-share weight of a flow.
+
+        Args:
+            flow: Tenant or workflow ID
+            weight: Relative share of the slots of its class
+
+        Raises:
+            ValueError: If the weight is not positive
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._weights[flow] = weight
+
+    def resolve_class(self, priority_class: str | None) -> str:
+        """Validate a priority class name.
+
+        Args:
+            priority_class: Class name, or None for the default class
+
+        Returns:
+            The class name
+
+        Raises:
+            ValueError: If the class is unknown
+        """
+        if priority_class is None:
+            return self.default_class
+        if priority_class not in self._classes:
+            raise ValueError(
+                f"Unknown priority class '{priority_class}'; "
+                f"available: {self.classes}"
+            )
+        return priority_class
+
+    async def acquire(self, priority_class: str | None = None, flow: str = "") -> None:
+        """Wait for a slot.
+
+        Args:
+            priority_class: Class of the request (defaults to ``default_class``)
+            flow: Tenant or workflow ID the request is accounted to
+
+        Raises:
+            ValueError: If the class is unknown
+        """
+        name = self.resolve_class(priority_class)
+        queue = self._classes[name]
+        if self.running < self.max_slots and not self.queued:
+            self.running += 1
+            self._dispatched(name, queue, 0.0)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future())
+        start = max(queue.virtual_time, queue.last_finish.get(flow, 0.0))
+        queue.last_finish[flow] = start + 1.0 / self._weights.get(flow, 1.0)
+        heapq.heappush(queue.heap, (start, next(self._order), waiter))
+        queue.queued += 1
+        self._report_depth(name, queue)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted and cancelled at once: hand the slot on
+                self.release()
+            else:
+                waiter.future.cancel()
+                queue.queued -= 1
+                self._report_depth(name, queue)
+            raise
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next request."""
+        self.running -= 1
+        self._dispatch()
+        self._report_running()
+
+    @asynccontextmanager
+    async def slot(
+        self, priority_class: str | None = None, flow: str = ""
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a block.
+
+        Args:
+            priority_class: Class of the request
+            flow: Tenant or workflow ID the request is accounted to
+        """
+        await self.acquire(priority_class, flow)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Queue statistics per priority class.
+
+        Returns:
+            Class name to queued requests, dispatched requests and mean
+            queue time in seconds
+        """
+        return {
+            name: {
+                "queued": queue.queued,
+                "dispatched": queue.dispatched,
+                "mean_wait": (
+                    queue.wait_seconds / queue.dispatched if queue.dispatched else 0.0
+                ),
+            }
+            for name, queue in self._classes.items()
+        }
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best waiting requests."""
+        while self.running < self.max_slots:
+            picked = self._pick()
+            if picked is None:
+                return
+            name, queue = picked
+            start, _, waiter = heapq.heappop(queue.heap)
+            queue.virtual_time = max(queue.virtual_time, start)
+            queue.last_served = time.monotonic()
+            if not queue.heap:
+                # Every flow is idle: forget their finish tags
+                queue.last_finish.clear()
+            queue.queued -= 1
+            self.running += 1
+            waiter.future.set_result(None)
+            self._report_depth(name, queue)
+            self._dispatched(name, queue, time.monotonic() - waiter.enqueued_at)
+
+    def _pick(self) -> tuple[str, _ClassQueue] | None:
+        """The class with the highest priority, aged by its time unserved."""
+        now = time.monotonic()
+        best: tuple[str, _ClassQueue] | None = None
+        best_score = 0.0
+        for name, queue in self._classes.items():
+            head = queue.head()
+            if head is None:
+                continue
+            score = queue.priority
+            if self.aging is not None:
+                waiting_since = max(head.enqueued_at, queue.last_served)
+                score += (now - waiting_since) / self.aging
+            if best is None or score > best_score:
+                best, best_score = (name, queue), score
+        return best
+
+    def _dispatched(self, name: str, queue: _ClassQueue, waited: float) -> None:
+        """Account for a granted slot."""
+        queue.dispatched += 1
+        queue.wait_seconds += waited
+        labels = {"class": name}
+        _metric(
+            "orchestration_scheduler_queue_seconds",
+            "Time tasks wait for a scheduler slot",
+            create_histogram,
+        ).observe(waited, labels=labels)
+        _metric(
+            "orchestration_scheduler_dispatched_total",
+            "Tasks granted a scheduler slot",
+            create_counter,
+        ).increment(labels=labels)
+        self._report_running()
+
+    def _report_running(self) -> None:
+        """Publish the number of slots in use."""
+        _metric(
+            "orchestration_scheduler_running",
+            "Tasks holding a scheduler slot",
+            create_gauge,
+        ).set(self.running)
+
+    def _report_depth(self, name: str, queue: _ClassQueue) -> None:
+        """Publish the queue depth of a class."""
+        _metric(
+            "orchestration_scheduler_queue_depth",
+            "Tasks waiting for a scheduler slot",
+            create_gauge,
+        ).set(queue.queued, labels={"class": name})
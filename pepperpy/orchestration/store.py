@@ -0,0 +1,565 @@
+"""
+Execution Stores for PepperPy Orchestration.
+
+An execution store keeps the history of workflow executions for an
+orchestration provider:
+
+- ``MemoryExecutionStore`` keeps finished executions in an LRU bounded by
+  count and age, so a long-lived worker does not accumulate every
+  execution's inputs and outputs.
+- ``SQLiteExecutionStore`` persists executions in a SQLite database in WAL
+  mode. Task state transitions are appended to a journal table, and queries
+  by workflow, status and creation time are served by indexes. Executions
+  survive a restart and can be resumed from the journal.
+
+Both stores apply a retention policy (``max_executions`` and ``max_age``) to
+finished executions only; running executions are never evicted.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from pepperpy.core import get_logger
+from pepperpy.workflow.models import (
+    ExecutionStatus,
+    TaskExecution,
+    TaskStatus,
+    WorkflowExecution,
+)
+
+logger = get_logger("orchestration.store")
+
+
+class ExecutionStore(ABC):
+    """Storage of workflow executions and their task transitions."""
+
+    @abstractmethod
+    def save_execution(self, execution: WorkflowExecution) -> None:
+        """Create or update an execution.
+
+        Args:
+            execution: Workflow execution
+        """
+        pass
+
+    @abstractmethod
+    def record_task(self, task_execution: TaskExecution) -> None:
+        """Record a task state transition.
+
+        Args:
+            task_execution: Task execution in its new state
+        """
+        pass
+
+    @abstractmethod
+    def get_execution(self, execution_id: str) -> WorkflowExecution | None:
+        """Get an execution by ID.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Execution if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    def list_executions(
+        self,
+        workflow_id: str | None = None,
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowExecution]:
+        """List executions, most recent first.
+
+        Args:
+            workflow_id: Only executions of this workflow
+            status: Only executions with this status
+            since: Only executions created at or after this time
+            until: Only executions created before this time
+            limit: Maximum number of executions
+
+        Returns:
+            Matching executions
+        """
+        pass
+
+    @abstractmethod
+    def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            True if the execution existed
+        """
+        pass
+
+    @abstractmethod
+    def prune(self) -> int:
+        """Apply the retention policy.
+
+        Returns:
+            Number of executions removed
+        """
+        pass
+
+    def close(self) -> None:  # noqa: B027 (optional hook)
+        """Release resources."""
+        pass
+
+
+def _expired(
+    execution: WorkflowExecution, max_age: float | None, now: datetime
+) -> bool:
+    """Whether a finished execution is past its retention age."""
+    if max_age is None:
+        return False
+    finished = execution.completed_at or execution.created_at
+    return (now - finished).total_seconds() > max_age
+
+
+def _matches(
+    execution: WorkflowExecution,
+    workflow_id: str | None,
+    status: ExecutionStatus | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> bool:
+    """Whether an execution passes the list filters."""
+    return (
+        (workflow_id is None or execution.workflow_id == workflow_id)
+        and (status is None or execution.status == status)
+        and (since is None or execution.created_at >= since)
+        and (until is None or execution.created_at < until)
+    )
+
+
+class MemoryExecutionStore(ExecutionStore):
+    """In-memory store with LRU and age limits on finished executions."""
+
+    def __init__(
+        self, max_executions: int | None = 1000, max_age: float | None = None
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            max_executions: Maximum finished executions kept (None for no limit)
+            max_age: Seconds a finished execution is kept (None for no limit)
+        """
+        self.max_executions = max_executions
+        self.max_age = max_age
+        self._active: dict[str, WorkflowExecution] = {}
+        self._finished: OrderedDict[str, WorkflowExecution] = OrderedDict()
+
+    def save_execution(self, execution: WorkflowExecution) -> None:
+        """Create or update an execution."""
+        if not execution.is_terminal():
+            self._active[execution.id] = execution
+            return
+        self._active.pop(execution.id, None)
+        self._finished[execution.id] = execution
+        self._finished.move_to_end(execution.id)
+        self._evict()
+
+    def record_task(self, task_execution: TaskExecution) -> None:
+        """Task executions are kept on their execution; nothing to record."""
+        pass
+
+    def get_execution(self, execution_id: str) -> WorkflowExecution | None:
+        """Get an execution by ID, refreshing its LRU position."""
+        execution = self._active.get(execution_id)
+        if execution is not None:
+            return execution
+        execution = self._finished.get(execution_id)
+        if execution is None:
+            return None
+        if _expired(execution, self.max_age, datetime.now()):
+            del self._finished[execution_id]
+            return None
+        self._finished.move_to_end(execution_id)
+        return execution
+
+    def list_executions(
+        self,
+        workflow_id: str | None = None,
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowExecution]:
+        """List executions, most recent first."""
+        self.prune()
+        executions = [
+            execution
+            for execution in (*self._active.values(), *self._finished.values())
+            if _matches(execution, workflow_id, status, since, until)
+        ]
+        executions.sort(key=lambda e: e.created_at, reverse=True)
+        return executions[:limit] if limit is not None else executions
+
+    def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution."""
+        return (
+            self._active.pop(execution_id, None) is not None
+            or self._finished.pop(execution_id, None) is not None
+        )
+
+    def prune(self) -> int:
+        """Remove expired and excess finished executions."""
+        removed = 0
+        if self.max_age is not None:
+            now = datetime.now()
+            for execution_id in [
+                execution_id
+                for execution_id, execution in self._finished.items()
+                if _expired(execution, self.max_age, now)
+            ]:
+                del self._finished[execution_id]
+                removed += 1
+        return removed + self._evict()
+
+    def _evict(self) -> int:
+        """Drop least recently used finished executions over the limit."""
+        removed = 0
+        if self.max_executions is not None:
+            while len(self._finished) > self.max_executions:
+                self._finished.popitem(last=False)
+                removed += 1
+        return removed
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    inputs TEXT,
+    outputs TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_executions_created
+    ON executions (created_at);
+CREATE INDEX IF NOT EXISTS idx_executions_status
+    ON executions (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_executions_workflow
+    ON executions (workflow_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_executions_completed
+    ON executions (completed_at) WHERE completed_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS task_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT NOT NULL,
+    task_execution_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    outputs TEXT,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_task_events_execution
+    ON task_events (execution_id, seq);
+"""
+
+_TERMINAL = tuple(
+    status.value
+    for status in (
+        ExecutionStatus.COMPLETED,
+        ExecutionStatus.FAILED,
+        ExecutionStatus.CANCELED,
+    )
+)
+
+
+def _to_ts(value: datetime | None) -> float | None:
+    """Datetime to epoch seconds."""
+    return value.timestamp() if value is not None else None
+
+
+def _from_ts(value: float | None) -> datetime | None:
+    """Epoch seconds to datetime."""
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+def _dumps(value: Any) -> str:
+    """Default serializer: JSON, with ``str`` for unsupported values."""
+    return json.dumps(value, default=str)
+
+
+class SQLiteExecutionStore(ExecutionStore):
+    """SQLite-backed store with an append-only journal of task transitions.
+
+    The database runs in WAL mode with ``synchronous=NORMAL``: readers do not
+    block the writer, and a transaction is committed every ``commit_every``
+    task transitions and on every execution update, so a crash loses at most
+    the last few transitions.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_executions: int | None = None,
+        max_age: float | None = None,
+        commit_every: int = 100,
+        prune_every: int = 100,
+        serialize: Callable[[Any], str] = _dumps,
+        deserialize: Callable[[str], Any] = json.loads,
+    ) -> None:
+        """Open or create the database.
+
+        Args:
+            path: Database file (":memory:" for a private in-memory database)
+            max_executions: Maximum finished executions kept (None for no limit)
+            max_age: Seconds a finished execution is kept (None for no limit)
+            commit_every: Task transitions buffered before a commit
+            prune_every: Finished executions saved between retention runs
+            serialize: Converts inputs and outputs to text
+            deserialize: Restores inputs and outputs from text
+        """
+        self.path = os.fspath(path)
+        self.max_executions = max_executions
+        self.max_age = max_age
+        self.commit_every = commit_every
+        self.prune_every = prune_every
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self._uncommitted = 0
+        self._finished_since_prune = 0
+
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=OFF")
+        self._db.executescript(_SCHEMA)
+        self._db.execute("BEGIN")
+
+    def _commit(self) -> None:
+        """Commit buffered writes and open the next transaction."""
+        self._db.execute("COMMIT")
+        self._db.execute("BEGIN")
+        self._uncommitted = 0
+
+    def save_execution(self, execution: WorkflowExecution) -> None:
+        """Create or update an execution."""
+        self._db.execute(
+            "INSERT INTO executions (id, workflow_id, status, inputs, outputs, "
+            "error, created_at, started_at, completed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET status = excluded.status, "
+            "outputs = excluded.outputs, error = excluded.error, "
+            "started_at = excluded.started_at, "
+            "completed_at = excluded.completed_at",
+            (
+                execution.id,
+                execution.workflow_id,
+                execution.status.value,
+                self.serialize(execution.inputs),
+                self.serialize(execution.outputs),
+                execution.error,
+                _to_ts(execution.created_at),
+                _to_ts(execution.started_at),
+                _to_ts(execution.completed_at),
+            ),
+        )
+        self._commit()
+        if execution.is_terminal():
+            self._finished_since_prune += 1
+            if self._finished_since_prune >= self.prune_every:
+                self.prune()
+
+    def record_task(self, task_execution: TaskExecution) -> None:
+        """Append a task state transition to the journal."""
+        completed = task_execution.status == TaskStatus.COMPLETED
+        self._db.execute(
+            "INSERT INTO task_events (execution_id, task_execution_id, task_id, "
+            "status, attempts, cached, error, outputs, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                task_execution.workflow_execution_id,
+                task_execution.id,
+                task_execution.task_id,
+                task_execution.status.value,
+                task_execution.attempts,
+                task_execution.cached,
+                task_execution.error,
+                self.serialize(task_execution.outputs) if completed else None,
+                time.time(),
+            ),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self._commit()
+
+    def get_execution(self, execution_id: str) -> WorkflowExecution | None:
+        """Get an execution by ID, rebuilding its tasks from the journal."""
+        row = self._db.execute(
+            "SELECT * FROM executions WHERE id = ?", (execution_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        execution = self._row_to_execution(row)
+        self._replay(execution)
+        return execution
+
+    def list_executions(
+        self,
+        workflow_id: str | None = None,
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowExecution]:
+        """List executions, most recent first.
+
+        Task executions are not loaded; use ``get_execution`` for them.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if workflow_id is not None:
+            clauses.append("workflow_id = ?")
+            params.append(workflow_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(ExecutionStatus(status).value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(_to_ts(since))
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(_to_ts(until))
+        sql = "SELECT * FROM executions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._row_to_execution(row) for row in self._db.execute(sql, params)]
+
+    def delete_execution(self, execution_id: str) -> bool:
+        """Delete an execution and its journal."""
+        cursor = self._db.execute(
+            "DELETE FROM executions WHERE id = ?", (execution_id,)
+        )
+        self._db.execute(
+            "DELETE FROM task_events WHERE execution_id = ?", (execution_id,)
+        )
+        self._commit()
+        return cursor.rowcount > 0
+
+    def prune(self) -> int:
+        """Remove expired and excess finished executions with their journals."""
+        self._finished_since_prune = 0
+        placeholders = ", ".join("?" * len(_TERMINAL))
+        doomed: list[str] = []
+        if self.max_age is not None:
+            doomed += [
+                row[0]
+                for row in self._db.execute(
+                    f"SELECT id FROM executions WHERE completed_at < ? "
+                    f"AND status IN ({placeholders})",
+                    (time.time() - self.max_age, *_TERMINAL),
+                )
+            ]
+        if self.max_executions is not None:
+            doomed += [
+                row[0]
+                for row in self._db.execute(
+                    f"SELECT id FROM executions WHERE status IN ({placeholders}) "
+                    "ORDER BY completed_at DESC LIMIT -1 OFFSET ?",
+                    (*_TERMINAL, self.max_executions),
+                )
+            ]
+        doomed = list(dict.fromkeys(doomed))
+        if doomed:
+            self._db.executemany(
+                "DELETE FROM executions WHERE id = ?", ((i,) for i in doomed)
+            )
+            self._db.executemany(
+                "DELETE FROM task_events WHERE execution_id = ?",
+                ((i,) for i in doomed),
+            )
+            logger.debug(f"Pruned {len(doomed)} executions from {self.path}")
+        self._commit()
+        return len(doomed)
+
+    def close(self) -> None:
+        """Commit pending transitions and close the database."""
+        self._db.execute("COMMIT")
+        self._db.close()
+
+    def _row_to_execution(self, row: tuple[Any, ...]) -> WorkflowExecution:
+        """Build an execution (without tasks) from a row."""
+        (
+            execution_id,
+            workflow_id,
+            status,
+            inputs,
+            outputs,
+            error,
+            created_at,
+            started_at,
+            completed_at,
+        ) = row
+        return WorkflowExecution(
+            id=execution_id,
+            workflow_id=workflow_id,
+            status=ExecutionStatus(status),
+            inputs=self.deserialize(inputs) if inputs else {},
+            outputs=self.deserialize(outputs) if outputs else {},
+            error=error,
+            created_at=_from_ts(created_at),
+            started_at=_from_ts(started_at),
+            completed_at=_from_ts(completed_at),
+        )
+
+    def _replay(self, execution: WorkflowExecution) -> None:
+        """Rebuild an execution's task states from its journal."""
+        tasks: dict[str, TaskExecution] = {}
+        for (
+            task_execution_id,
+            task_id,
+            status,
+            attempts,
+            cached,
+            error,
+            outputs,
+            timestamp,
+        ) in self._db.execute(
+            "SELECT task_execution_id, task_id, status, attempts, cached, error, "
+            "outputs, timestamp FROM task_events WHERE execution_id = ? ORDER BY seq",
+            (execution.id,),
+        ):
+            task = tasks.get(task_execution_id)
+            if task is None:
+                task = tasks[task_execution_id] = TaskExecution(
+                    id=task_execution_id,
+                    task_id=task_id,
+                    workflow_execution_id=execution.id,
+                )
+            task.status = TaskStatus(status)
+            task.attempts = attempts
+            task.cached = bool(cached)
+            task.error = error
+            when = _from_ts(timestamp)
+            if task.status == TaskStatus.RUNNING:
+                task.started_at = task.started_at or when
+            elif task.status != TaskStatus.PENDING:
+                task.completed_at = when
+            if outputs is not None:
+                task.outputs = self.deserialize(outputs)
+        execution.task_executions = tasks
@@ -6,13 +6,16 @@
 """
 
 from pepperpy.workflow.base import (
+    BatchStage,
     ComponentType,
+    ConcurrentStage,
     Pipeline,
     PipelineConfig,
     PipelineContext,
     PipelineError,
     PipelineRegistry,
     PipelineStage,
+    StageStats,
     Workflow,
     WorkflowComponent,
     WorkflowError,
@@ -21,13 +24,16 @@
 )
 
 __all__ = [
+    "BatchStage",
     "ComponentType",
+    "ConcurrentStage",
     "Pipeline",
     "PipelineConfig",
     "PipelineContext",
     "PipelineError",
     "PipelineRegistry",
     "PipelineStage",
+    "StageStats",
     "Workflow",
     "WorkflowComponent",
     "WorkflowError",
@@ -6,12 +6,21 @@
 - PipelineContext: Context for passing data and metadata between stages
 - PipelineConfig: Configuration for pipelines
 - PipelineRegistry: Registry for storing and retrieving pipelines
+
+Pipelines process one item at a time with ``process``, or a stream of items
+with ``stream``: each stage then runs as a group of workers connected to the
+next stage by a bounded queue, so stages overlap and a slow stage pushes
+back on the ones before it. ``ConcurrentStage`` and ``BatchStage`` tune how
+a stage runs in streaming mode.
 """
 
+import asyncio
 import enum
+import inspect
 import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Generic, TypeVar, cast
@@ -30,7 +39,9 @@
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "BatchStage",
     "ComponentType",
+    "ConcurrentStage",
     "DocumentWorkflow",
     "Pipeline",
     "PipelineConfig",
@@ -38,6 +49,7 @@
     "PipelineError",
     "PipelineRegistry",
     "PipelineStage",
+    "StageStats",
     "Workflow",
     "WorkflowComponent",
     "WorkflowProvider",
@@ -129,6 +141,44 @@ class PipelineConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class StageStats:
+    """Throughput and latency of a stage during a streaming run."""
+
+    name: str
+    workers: int = 1
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    max_latency: float = 0.0
+    max_queue_depth: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds between the first item taken and the last one finished."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items finished per second."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean processing time per item, in seconds."""
+        return self.busy_seconds / self.items if self.items else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean time an item waited in the stage's input queue, in seconds."""
+        return self.wait_seconds / self.items if self.items else 0.0
+
+
 class PipelineStage(Generic[Input, Output], ABC):
     """Base class for all pipeline stages.
 
@@ -226,6 +276,7 @@ def __init__(
         self._name = name
         self._stages = stages if stages is not None else []
         self._config = config or PipelineConfig(name=name)
+        self._stats: list[StageStats] = []
 
     @property
     def name(self) -> str:
@@ -290,6 +341,132 @@ def process(
             logger.error(f"Error in pipeline {self.name}: {e!s}")
             raise PipelineError(f"Error in pipeline {self.name}: {e!s}") from e
 
+    @property
+    def stats(self) -> list[StageStats]:
+        """Get the per-stage statistics of the last streaming run.
+
+        Returns:
+            One entry per stage, in pipeline order
+        """
+        return list(self._stats)
+
+    async def stream(
+        self,
+        items: Iterable[Input] | AsyncIterable[Input],
+        context: PipelineContext | None = None,
+        buffer_size: int | None = None,
+    ) -> AsyncIterator[Output]:
+        """Process a stream of items with all stages running concurrently.
+
+        Each stage is a group of workers (see ``ConcurrentStage`` and
+        ``BatchStage``) reading from a bounded queue fed by the previous
+        stage. When a queue is full the stage before it waits, so memory
+        stays bounded however fast items arrive. Stage results that are
+        awaitable are awaited, so stages may wrap async functions.
+
+        Args:
+            items: Input items
+            context: The pipeline context shared by all items, created if None
+            buffer_size: Capacity of each inter-stage queue (defaults to the
+                ``buffer_size`` config option, or 16)
+
+        Yields:
+            Processed items, in input order unless a stage is unordered
+
+        Raises:
+            PipelineError: If a stage fails; the other stages are cancelled
+        """
+        if context is None:
+            context = PipelineContext()
+        if buffer_size is None:
+            buffer_size = self._config.options.get("buffer_size", 16)
+        if buffer_size < 1:
+            raise PipelineError("buffer_size must be at least 1")
+
+        logger.debug(f"Streaming pipeline: {self.name}")
+        queues: list[asyncio.Queue[Any]] = [
+            asyncio.Queue(maxsize=buffer_size) for _ in range(len(self._stages) + 1)
+        ]
+        runners = [
+            _StageRunner(stage, queues[i], queues[i + 1], context, buffer_size)
+            for i, stage in enumerate(self._stages)
+        ]
+        self._stats = [runner.stats for runner in runners]
+        tasks = [asyncio.create_task(self._feed(items, queues[0]))]
+        tasks.extend(asyncio.create_task(runner.run()) for runner in runners)
+        supervisor = asyncio.create_task(self._supervise(tasks, queues[-1]))
+        try:
+            while True:
+                entry = await queues[-1].get()
+                if entry is _END:
+                    break
+                if isinstance(entry, _Failure):
+                    error = entry.error
+                    if isinstance(error, PipelineError):
+                        raise error
+                    raise PipelineError(
+                        f"Error in pipeline {self.name}: {error!s}"
+                    ) from error
+                yield entry[0]
+        finally:
+            for task in (*tasks, supervisor):
+                task.cancel()
+            await asyncio.gather(*tasks, supervisor, return_exceptions=True)
+
+    async def process_stream(
+        self,
+        items: Iterable[Input] | AsyncIterable[Input],
+        context: PipelineContext | None = None,
+        buffer_size: int | None = None,
+    ) -> list[Output]:
+        """Process a stream of items and collect the results.
+
+        Args:
+            items: Input items
+            context: The pipeline context shared by all items, created if None
+            buffer_size: Capacity of each inter-stage queue
+
+        Returns:
+            The processed items
+
+        Raises:
+            PipelineError: If a stage fails
+        """
+        return [item async for item in self.stream(items, context, buffer_size)]
+
+    @staticmethod
+    async def _feed(
+        items: Iterable[Input] | AsyncIterable[Input], queue: asyncio.Queue[Any]
+    ) -> None:
+        """Put the input items on the first queue, then the end marker."""
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                await queue.put((item, time.perf_counter()))
+        else:
+            for item in items:
+                await queue.put((item, time.perf_counter()))
+        await queue.put(_END)
+
+    @staticmethod
+    async def _supervise(
+        tasks: list[asyncio.Task[None]], output: asyncio.Queue[Any]
+    ) -> None:
+        """Cancel every stage once one fails and report the failure."""
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        error = next(
+            (
+                task.exception()
+                for task in done
+                if not task.cancelled() and task.exception() is not None
+            ),
+            None,
+        )
+        if error is None:
+            return
+        for task in tasks:
+            task.cancel()
+        await output.put(_Failure(error))
+
 
 class PipelineRegistry:
     """Registry for storing and retrieving pipelines.
@@ -921,3 +1098,326 @@ def process(self, input_data: Input, context: PipelineContext) -> Output:
         except Exception as e:
             logger.error(f"Error in conditional stage {self.name}: {e!s}")
             raise PipelineError(f"Error in conditional stage {self.name}: {e!s}") from e
+
+
+class ConcurrentStage(PipelineStage[Input, Output]):
+    """A pipeline stage run by several workers in streaming mode.
+
+    This stage wraps another stage and sets how ``Pipeline.stream`` runs it.
+    Outside streaming mode it behaves like the wrapped stage.
+    """
+
+    def __init__(
+        self,
+        stage: PipelineStage[Input, Output],
+        concurrency: int = 1,
+        ordered: bool = True,
+        in_thread: bool = False,
+    ):
+        """Initialize a concurrent stage.
+
+        Args:
+            stage: The stage to run
+            concurrency: Number of items processed at once
+            ordered: Whether to emit results in the order the items reached
+                this stage; otherwise they are emitted as soon as they are ready
+            in_thread: Whether to call the stage in a worker thread, for
+                blocking stages that would otherwise stall the event loop
+
+        Raises:
+            PipelineError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise PipelineError("concurrency must be at least 1")
+        super().__init__(stage.name, stage.description)
+        self.stage = stage
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.in_thread = in_thread
+
+    def process(self, input_data: Input, context: PipelineContext) -> Output:
+        """Process the input data with the wrapped stage.
+
+        Args:
+            input_data: The input data to process
+            context: The pipeline context
+
+        Returns:
+            The processed output data
+        """
+        return self.stage.process(input_data, context)
+
+
+class BatchStage(PipelineStage[Input, Output]):
+    """A pipeline stage that processes items in batches.
+
+    In streaming mode, items are grouped until ``batch_size`` are available
+    or ``max_wait`` seconds have passed since the first one, and the
+    function is called once per batch (e.g. one embedding request for 32
+    chunks). It must return one output per input, in order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[list[Input], PipelineContext], list[Output]],
+        batch_size: int = 32,
+        max_wait: float = 0.05,
+        description: str = "",
+    ):
+        """Initialize a batch stage.
+
+        Args:
+            name: The name of the stage
+            func: The function processing a batch (may be async)
+            batch_size: Maximum items per batch
+            max_wait: Maximum seconds to wait for a batch to fill
+            description: A description of the stage
+
+        Raises:
+            PipelineError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise PipelineError("batch_size must be at least 1")
+        super().__init__(name, description)
+        self.func = func
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+    def process_batch(self, items: list[Input], context: PipelineContext) -> Any:
+        """Process a batch of items.
+
+        Args:
+            items: The input items
+            context: The pipeline context
+
+        Returns:
+            The outputs, or an awaitable resolving to them
+        """
+        return self.func(items, context)
+
+    def process(self, input_data: Input, context: PipelineContext) -> Output:
+        """Process a single item as a batch of one.
+
+        Args:
+            input_data: The input data to process
+            context: The pipeline context
+
+        Returns:
+            The processed output data
+
+        Raises:
+            PipelineError: If the batch function is asynchronous
+        """
+        result = self.func([input_data], context)
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise PipelineError(
+                f"Batch stage {self.name} is asynchronous; use Pipeline.stream"
+            )
+        return result[0]
+
+
+# End of stream marker in inter-stage queues
+_END: Any = object()
+
+
+@dataclass
+class _Failure:
+    """A stage failure forwarded to the stream consumer."""
+
+    error: BaseException
+
+
+class _StageRunner:
+    """Runs one stage of a streaming pipeline as a group of workers.
+
+    Queue entries are ``(item, enqueued_at)`` tuples. Items are numbered as
+    they are taken from the inbox; an ordered stage holds back results until
+    the earlier ones are emitted.
+    """
+
+    def __init__(
+        self,
+        stage: PipelineStage,
+        inbox: asyncio.Queue[Any],
+        outbox: asyncio.Queue[Any],
+        context: PipelineContext,
+        buffer_size: int,
+    ):
+        """Initialize the runner.
+
+        Args:
+            stage: The stage, possibly wrapped in a ``ConcurrentStage``
+            inbox: Queue of the items to process
+            outbox: Queue of the processed items
+            context: The pipeline context
+            buffer_size: Capacity of the inter-stage queues
+        """
+        options = stage if isinstance(stage, ConcurrentStage) else None
+        self.stage = options.stage if options else stage
+        self.concurrency = options.concurrency if options else 1
+        self.ordered = options.ordered if options else True
+        self.in_thread = options.in_thread if options else False
+        self.inbox = inbox
+        self.outbox = outbox
+        self.context = context
+        self.stats = StageStats(name=stage.name, workers=self.concurrency)
+        # Bounds the items taken but not yet emitted, so a slow item cannot
+        # make an ordered stage buffer the rest of the stream
+        batch_size = self.stage.batch_size if isinstance(self.stage, BatchStage) else 1
+        self._window = (
+            asyncio.Semaphore(self.concurrency * batch_size + buffer_size)
+            if self.ordered
+            else None
+        )
+        self._pending: dict[int, Any] = {}
+        self._taken = 0
+        self._next_seq = 0
+        self._emit_lock = asyncio.Lock()
+
+    async def run(self) -> None:
+        """Process items until the end of the stream."""
+        worker = (
+            self._batch_worker if isinstance(self.stage, BatchStage) else self._worker
+        )
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # A failed worker leaves its siblings running otherwise
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        await self.outbox.put(_END)
+
+    async def _take(self) -> Any:
+        """Take the next item from the inbox as ``(seq, item)``, or ``_END``."""
+        if self._window is not None:
+            await self._window.acquire()
+        try:
+            entry = await self.inbox.get()
+        except BaseException:
+            if self._window is not None:
+                self._window.release()
+            raise
+        if entry is _END:
+            # Leave the marker for the other workers
+            self.inbox.put_nowait(_END)
+            if self._window is not None:
+                self._window.release()
+            return _END
+        now = time.perf_counter()
+        stats = self.stats
+        if stats.started_at is None:
+            stats.started_at = now
+        stats.wait_seconds += now - entry[1]
+        stats.max_queue_depth = max(stats.max_queue_depth, self.inbox.qsize() + 1)
+        seq = self._taken
+        self._taken += 1
+        return seq, entry[0]
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a stage function, awaiting its result if needed."""
+        try:
+            if self.in_thread:
+                result = await asyncio.to_thread(func, *args)
+            else:
+                result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except PipelineError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in pipeline stage {self.stage.name}: {e!s}")
+            raise PipelineError(
+                f"Error in pipeline stage {self.stage.name}: {e!s}"
+            ) from e
+
+    def _record(self, started: float, items: int) -> None:
+        """Account for a finished call."""
+        now = time.perf_counter()
+        stats = self.stats
+        stats.items += items
+        stats.batches += 1
+        stats.busy_seconds += now - started
+        stats.max_latency = max(stats.max_latency, now - started)
+        stats.finished_at = now
+
+    async def _emit(self, results: list[tuple[int, Any]]) -> None:
+        """Pass results to the next stage, in input order if ordered."""
+        if self._window is None:
+            for _, result in results:
+                await self.outbox.put((result, time.perf_counter()))
+            return
+        async with self._emit_lock:
+            self._pending.update(results)
+            while self._next_seq in self._pending:
+                result = self._pending.pop(self._next_seq)
+                await self.outbox.put((result, time.perf_counter()))
+                self._next_seq += 1
+                self._window.release()
+
+    async def _worker(self) -> None:
+        """Process items one at a time."""
+        while (entry := await self._take()) is not _END:
+            seq, item = entry
+            started = time.perf_counter()
+            result = await self._call(self.stage, item, self.context)
+            self._record(started, 1)
+            await self._emit([(seq, result)])
+
+    async def _batch_worker(self) -> None:
+        """Process items in batches of up to ``batch_size``."""
+        stage = cast(BatchStage, self.stage)
+        # A take still pending when a batch times out starts the next batch
+        getter: asyncio.Task[Any] | None = None
+        try:
+            finished = False
+            while not finished:
+                if getter is None:
+                    getter = asyncio.create_task(self._take())
+                entry = await getter
+                getter = None
+                if entry is _END:
+                    break
+                batch = [entry]
+                deadline = time.perf_counter() + stage.max_wait
+                while len(batch) < stage.batch_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    if getter is None:
+                        getter = asyncio.create_task(self._take())
+                    done, _ = await asyncio.wait({getter}, timeout=remaining)
+                    if not done:
+                        break
+                    entry = getter.result()
+                    getter = None
+                    if entry is _END:
+                        finished = True
+                        break
+                    batch.append(entry)
+
+                started = time.perf_counter()
+                results = await self._call(
+                    stage.process_batch, [item for _, item in batch], self.context
+                )
+                if len(results) != len(batch):
+                    raise PipelineError(
+                        f"Batch stage {stage.name} returned {len(results)} "
+                        f"outputs for {len(batch)} inputs"
+                    )
+                self._record(started, len(batch))
+                await self._emit(
+                    [
+                        (seq, result)
+                        for (seq, _), result in zip(batch, results, strict=True)
+                    ]
+                )
+        finally:
+            if getter is not None:
+                getter.cancel()
+                await asyncio.gather(getter, return_exceptions=True)
@@ -10,6 +10,8 @@
 from enum import Enum
 from typing import Any
 
+from pepperpy.core.retry import RetryStrategy, calculate_delay
+
 
 class WorkflowError(Exception):
     """Base class for all workflow-related exceptions."""
@@ -52,6 +54,89 @@ def __init__(self, task_id: str, original_error: Exception | None = None) -> Non
         super().__init__(message)
 
 
+class TaskTimeoutError(WorkflowError):
+    """Raised when a task attempt exceeds its timeout."""
+
+    def __init__(self, task_id: str, timeout: float) -> None:
+        """Initialize with task ID and timeout.
+
+        Args:
+            task_id: The ID of the task that timed out
+            timeout: The timeout in seconds
+        """
+        self.task_id = task_id
+        self.timeout = timeout
+        super().__init__(f"Task '{task_id}' timed out after {timeout}s")
+
+
+class RetryPolicy:
+    """Retry policy of a task.
+
+    Failed attempts (including timeouts) whose error matches ``retry_on`` are
+    retried with exponential backoff until ``max_retries`` is exhausted.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: bool = True,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+    ):
+        """Initialize a retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt
+            initial_delay: Delay before the first retry in seconds
+            backoff_factor: Multiplier applied to the delay after each retry
+            max_delay: Upper bound of the delay in seconds
+            jitter: Randomize delays to spread retries out
+            retry_on: Exception types worth retrying
+        """
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Check whether a failed attempt should be retried.
+
+        Args:
+            error: Error raised by the attempt
+            attempt: Number of the failed attempt (1-based)
+
+        Returns:
+            True if the task should be attempted again
+        """
+        return attempt <= self.max_retries and isinstance(error, self.retry_on)
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            attempt: Number of the failed attempt (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        strategy = (
+            RetryStrategy.EXPONENTIAL_JITTER
+            if self.jitter
+            else RetryStrategy.EXPONENTIAL_BACKOFF
+        )
+        return calculate_delay(
+            attempt - 1,
+            strategy,
+            self.initial_delay,
+            self.backoff_factor,
+            max_delay=self.max_delay,
+        )
+
+
 class TaskStatus(str, Enum):
     """Status of a task execution."""
 
@@ -88,6 +173,12 @@ def __init__(
         input_schema: dict[str, Any] | None = None,
         output_schema: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        on_cancel: Callable[[dict[str, Any]], Any] | None = None,
+        executor: str | None = None,
+        cache: bool = False,
+        version: str = "1.0.0",
     ):
         """Initialize a task.
 
@@ -99,6 +190,17 @@ def __init__(
             input_schema: Optional input schema
             output_schema: Optional output schema
             metadata: Optional metadata
+            timeout: Optional timeout per attempt in seconds
+            retry_policy: Optional policy for retrying failed attempts
+            on_cancel: Optional cleanup hook called with the task inputs when
+                an attempt is cancelled or times out (may be async)
+            executor: Optional name of the orchestrator executor to run the
+                function on ("thread", "process", ...) instead of the event
+                loop; the function may then be synchronous
+            cache: Whether to reuse the outputs of a previous run with the
+                same version, metadata and inputs (needs an orchestrator
+                task cache)
+            version: Task code version; bump it to invalidate cached outputs
         """
         self.id = id
         self.name = name
@@ -107,6 +209,12 @@ def __init__(
         self.input_schema = input_schema or {}
         self.output_schema = output_schema or {}
         self.metadata = metadata or {}
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.on_cancel = on_cancel
+        self.executor = executor
+        self.cache = cache
+        self.version = version
 
     @classmethod
     def from_function(cls, func: Callable) -> "Task":
@@ -152,11 +260,15 @@ def from_function(cls, func: Callable) -> "Task":
             output_schema=output_schema,
         )
 
-    async def execute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+    async def execute(
+        self, inputs: dict[str, Any], executor: Any | None = None
+    ) -> dict[str, Any]:
         """Execute the task.
 
         Args:
             inputs: Task inputs
+            executor: Optional executor with an async ``run(func, inputs)``
+                method to run the function on
 
         Returns:
             Task outputs
@@ -167,7 +279,10 @@ async def execute(self, inputs: dict[str, Any]) -> dict[str, Any]:
         if not self.function:
             raise ValueError(f"No function set for task '{self.id}'")
 
-        result = await self.function(**inputs)
+        if executor is not None:
+            result = await executor.run(self.function, inputs)
+        else:
+            result = await self.function(**inputs)
 
         # Convert to dict if not already
         if not isinstance(result, dict):
@@ -434,6 +549,8 @@ def __init__(
         created_at: datetime | None = None,
         started_at: datetime | None = None,
         completed_at: datetime | None = None,
+        attempts: int = 0,
+        cached: bool = False,
     ):
         """Initialize a task execution.
 
@@ -448,6 +565,8 @@ def __init__(
             created_at: Creation timestamp
             started_at: Start timestamp
             completed_at: Completion timestamp
+            attempts: Number of attempts made
+            cached: Whether the outputs were served from the task cache
         """
         self.id = id
         self.task_id = task_id
@@ -459,6 +578,8 @@ def __init__(
         self.created_at = created_at or datetime.now()
         self.started_at = started_at
         self.completed_at = completed_at
+        self.attempts = attempts
+        self.cached = cached
 
     def is_terminal(self) -> bool:
         """Check if task is in a terminal state.
@@ -529,6 +650,22 @@ def is_terminal(self) -> bool:
             ExecutionStatus.CANCELED,
         )
 
+    @property
+    def cache_hits(self) -> list[str]:
+        """IDs of the tasks whose outputs were served from the task cache."""
+        return [
+            task_execution.task_id
+            for task_execution in self.task_executions.values()
+            if task_execution.cached
+        ]
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of the task executions served from the task cache."""
+        if not self.task_executions:
+            return 0.0
+        return len(self.cache_hits) / len(self.task_executions)
+
     def get_task_execution(self, task_id: str) -> TaskExecution | None:
         """Get task execution by task ID.
 
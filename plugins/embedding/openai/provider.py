@@ -8,6 +8,7 @@
 from typing import Any
 
 from pepperpy.embedding.base import EmbeddingError, EmbeddingProvider
+from pepperpy.embedding.batching import EmbeddingBatcher
 from pepperpy.plugin import BasePluginProvider, ProviderPlugin
 
 
@@ -22,6 +23,7 @@ class OpenAIEmbeddingsProvider(EmbeddingProvider, BasePluginProvider, ProviderPl
     model: str = "text-embedding-3-small"
     dimensions: int = 256
     batch_size: int = 100
+    batch_wait: float = 0.005
 
     async def initialize(self) -> None:
         """Initialize the provider.
@@ -33,8 +35,24 @@ async def initialize(self) -> None:
         if initialized:
             return
 
-        # Initialize resources
-        # TODO: Add initialization code
+        # One client for the provider lifetime so connections are reused
+        try:
+            from openai import AsyncOpenAI
+
+            self.client = AsyncOpenAI(api_key=self.api_key)
+        except (ImportError, ModuleNotFoundError):
+            self.logger.warning(
+                "OpenAI package not installed. Using fallback for testing. "
+                "Install with: pip install openai>=1.0.0"
+            )
+            self.client = None
+
+        # Concurrent embed() calls share batched API requests
+        self.batcher = EmbeddingBatcher(
+            self._embed_batch,
+            max_batch_size=self.batch_size,
+            max_wait=self.batch_wait,
+        )
 
         self.initialized = True
         self.logger.debug(
@@ -49,8 +67,11 @@ async def cleanup(self) -> None:
         if not self.initialized:
             return
 
-        # Clean up resources
-        # TODO: Add cleanup code for any resources created during initialization
+        # Deliver anything still waiting in the batcher
+        await self.batcher.close()
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
 
         try:
             # Clean up resources using the instance method inherited from ResourceMixin
@@ -88,6 +109,16 @@ async def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
 
                 embedding = await self.embed(text)
                 return {"status": "success", "result": embedding}
+            elif task_type == "embed_batch":
+                texts = input_data.get("texts")
+                if not texts:
+                    return {
+                        "status": "error",
+                        "message": "No texts provided for embedding",
+                    }
+
+                embeddings = await self.embed_batch(texts)
+                return {"status": "success", "result": {"embeddings": embeddings}}
             elif task_type == "example_task":
                 # TODO: Implement task
                 return {"status": "success", "result": "Task executed successfully"}
@@ -101,6 +132,9 @@ async def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
     async def embed(self, text: str, **kwargs: Any) -> list[float]:
         """Generate embeddings for text.
 
+        Concurrent calls with the default dimensions are micro-batched into a
+        single API request.
+
         Args:
             text: Text to embed
             **kwargs: Additional parameters for embedding
@@ -115,28 +149,64 @@ async def embed(self, text: str, **kwargs: Any) -> list[float]:
         dims = kwargs.get("dimensions", self.dimensions)
 
         try:
-            # Use OpenAI embeddings API
-            try:
-                from openai import AsyncOpenAI
+            if dims != self.dimensions:
+                return (await self._embed_batch([text], dimensions=dims))[0]
+            return await self.batcher.embed(text)
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error generating embedding: {e}")
+            raise EmbeddingError(f"Failed to generate embedding: {e}") from e
 
-                # Initialize client
-                client = AsyncOpenAI(api_key=self.api_key)
+    async def embed_batch(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Generate embeddings for several texts.
 
-                # Call OpenAI API
-                response = await client.embeddings.create(
-                    model=self.model, input=text, dimensions=dims
-                )
+        Args:
+            texts: Texts to embed
+            **kwargs: Additional parameters for embedding
+
+        Returns:
+            Embedding vectors in input order
+        """
+        if not self.initialized:
+            await self.initialize()
 
-                # Extract embedding
-                return response.data[0].embedding
-            except (ImportError, ModuleNotFoundError):
-                self.logger.warning(
-                    "OpenAI package not installed or API unavailable. Using fallback for testing. "
-                    "Install with: pip install openai>=1.0.0"
+        dims = kwargs.get("dimensions", self.dimensions)
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors.extend(
+                await self._embed_batch(
+                    texts[start : start + self.batch_size], dimensions=dims
                 )
-                # Fallback for testing - return random vector
-                return [random.random() for _ in range(dims)]
+            )
+        return vectors
 
+    async def _embed_batch(
+        self, texts: list[str], dimensions: int | None = None
+    ) -> list[list[float]]:
+        """Embed a batch of texts with one API request.
+
+        Args:
+            texts: Texts to embed (at most batch_size)
+            dimensions: Optional output dimensions
+
+        Returns:
+            Embedding vectors in input order
+        """
+        dims = dimensions or self.dimensions
+
+        if self.client is None:
+            # Fallback for testing - return random vectors
+            return [[random.random() for _ in range(dims)] for _ in texts]
+
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model, input=texts, dimensions=dims
+            )
         except Exception as e:
-            self.logger.error(f"Error generating embedding: {e}")
-            raise EmbeddingError(f"Failed to generate embedding: {e}") from e
+            self.logger.error(f"Error generating embeddings: {e}")
+            raise EmbeddingError(f"Failed to generate embeddings: {e}") from e
+
+        # The API may return items out of order; sort by index
+        data = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in data]
@@ -4,29 +4,22 @@
 This provider implements a llm plugin for the PepperPy framework.
 """
 
-import os
+import json
 from collections.abc import AsyncIterator
-import collections.abc
-from typing import dict, list, set, Any
+from typing import Any
 
-from pepperpy.core.errors import PepperpyError
-from pepperpy.llm.base import LLMProvider
-from pepperpy.plugin import ProviderPlugin
-from pepperpy.llm.base import LlmError
-from pepperpy.llm.base import LlmError
+from pepperpy.core.transport import get_transport_manager
+from pepperpy.llm.base import LLMError, LLMProvider
+from pepperpy.llm.llamacpp import LlamaCppWorkerPool, LlamaPrefixCache
+from pepperpy.plugin import BasePluginProvider
 
-logger = logger.getLogger(__name__)
+# Try to import llama.cpp Python bindings
+try:
+    import llama_cpp
 
-
-class LLMError(class LLMError(PepperpyError):
-    """Error raised by LLM providers."""):
-    """
-    Llm llmerror provider.
-    
-    This provider implements llmerror functionality for the PepperPy llm framework.
-    """
-
-    pass
+    LLAMA_CPP_AVAILABLE = True
+except ImportError:
+    LLAMA_CPP_AVAILABLE = False
 
 
 class GenerationResult:
@@ -43,19 +36,7 @@ def __init__(self, content: str, **kwargs: Any):
         self.metadata = kwargs
 
     def __str__(self) -> str:
-
-
-    """Return the content as string.
-
-
-
-    Returns:
-
-
-        Return description
-
-
-    """
+        """Return the content as string."""
         return self.content
 
 
@@ -73,19 +54,7 @@ def __init__(self, content: str, **kwargs: Any):
         self.metadata = kwargs
 
     def __str__(self) -> str:
-
-
-    """Return the content as string.
-
-
-
-    Returns:
-
-
-        Return description
-
-
-    """
+        """Return the content as string."""
         return self.content
 
 
@@ -97,10 +66,10 @@ class LocalProvider(LLMProvider, BasePluginProvider):
     """
 
     async def initialize(self) -> None:
- """Initialize the provider.
+        """Initialize the provider.
 
         This method is called automatically when the provider is first used.
- """
+        """
         # Skip if already initialized
         if self.initialized:
             return
@@ -109,6 +78,7 @@ async def initialize(self) -> None:
         await super().initialize()
 
         # Initialize local model client
+        self.worker = None
         try:
             # Get configuration parameters
             model_path = self.model_path
@@ -125,16 +95,24 @@ async def initialize(self) -> None:
 
             # Import client library based on api_type
             if api_type == "llama.cpp":
-                try:
-                    # Try to import llama.cpp Python bindings
-                    import llama_cpp
-
-                    self.client = llama_cpp.Llama(
-                        model_path=model_path,
-                        n_ctx=self.context_length,
-                        n_threads=self.threads or 4),
+                if LLAMA_CPP_AVAILABLE:
+                    # Inference runs on worker threads, one model per thread,
+                    # so generation never blocks the event loop
+                    self.worker = LlamaCppWorkerPool(
+                        lambda: llama_cpp.Llama(
+                            model_path=model_path,
+                            n_ctx=self.context_length,
+                            n_threads=self.threads or 4,
+                            verbose=False,
+                        ),
+                        instances=self.get_config("instances", 1),
+                        max_queue=self.get_config("max_queue", 32),
+                        queue_timeout=self.get_config("queue_timeout"),
+                        prefix_cache=self._create_prefix_cache(),
                     )
-                except ImportError:
+                    await self.worker.start()
+                    self.client = None
+                else:
                     self.logger.warning(
                         "llama_cpp package not installed, trying HTTP API"
                     )
@@ -150,6 +128,22 @@ async def initialize(self) -> None:
         except Exception as e:
             raise LLMError(f"Failed to initialize local model client: {e}") from e
 
+    def _create_prefix_cache(self) -> LlamaPrefixCache | None:
+        """Create the prompt-prefix state cache from configuration.
+
+        Returns:
+            Prefix cache, or None if disabled
+        """
+        if not self.get_config("prefix_cache", True):
+            return None
+        return LlamaPrefixCache(
+            capacity_bytes=self.get_config("prefix_cache_bytes", 1 << 30),
+            max_entries=self.get_config("prefix_cache_entries", 16),
+            block_size=self.get_config("prefix_cache_block_size", 64),
+            disk_dir=self.get_config("prefix_cache_dir"),
+            disk_capacity_bytes=self.get_config("prefix_cache_disk_bytes", 8 << 30),
+        )
+
     async def _setup_http_client(
         self, host: str, port: int, api_type: str = "default"
     ) -> None:
@@ -160,29 +154,23 @@ async def _setup_http_client(
             port: API port
             api_type: Type of API (default, oobabooga, etc.)
         """
-        try:
-            import aiohttp
-
-            self.client = aiohttp.ClientSession()
-            self.api_base_url = f"http://{host}:{port}"
-            self.api_type = api_type
-        except ImportError:
-            self.logger.warning(
-                "aiohttp package not installed. Will use mock responses."
-            )
-            self.client = None
+        self.api_base_url = f"http://{host}:{port}"
+        self.api_type = api_type
+        # Pooled session shared with other clients of the same server
+        self.client = await get_transport_manager().get_session(self.api_base_url)
 
     async def cleanup(self) -> None:
- """Clean up provider resources.
+        """Clean up provider resources.
 
         This method is called automatically when the context manager exits.
- """
-        # Clean up client if it exists
-        if hasattr(self, "client") and self.client:
-            # Close aiohttp session if it's that type
-            if hasattr(self.client, "close") and callable(self.client.close):
-                await self.client.close()
+        """
+        # Stop llama.cpp workers if they exist
+        if getattr(self, "worker", None) is not None:
+            await self.worker.close()
+            self.worker = None
 
+        # The pooled HTTP session is owned by the transport manager
+        if hasattr(self, "client") and self.client:
             self.client = None
 
         # Call the base class cleanup
@@ -201,7 +189,7 @@ async def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
         task_type = input_data.get("task")
 
         if not task_type:
-            raise LlmError("No task specified")
+            raise LLMError("No task specified")
 
         try:
             # Ensure initialization
@@ -218,7 +206,7 @@ async def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
             elif task_type == "completion":
                 prompt = input_data.get("prompt", "")
                 if not prompt:
-                    raise LlmError("No prompt provided")
+                    raise LLMError("No prompt provided")
 
                 # Convert prompt to message format
                 messages = [{"role": "user", "content": prompt}]
@@ -228,15 +216,13 @@ async def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
                 return {"status": "success", "result": response.content}
             elif task_type == "stream":
                 messages = input_data.get("messages", [])
-                # For API responses, this will actually stream
-                # But we need to return something directly here
-                generation = self.stream(messages, **input_data.get("options", {}))
+                # A task result is returned whole, so collect the full response
                 response = await self.generate(
                     messages, **input_data.get("options", {})
                 )
                 return {"status": "success", "result": response.content}
             else:
-                raise LlmError(f"Unknown task type: {task_type)"}
+                raise LLMError(f"Unknown task type: {task_type}")
 
         except Exception as e:
             self.logger.error(f"Error executing task '{task_type}': {e}")
@@ -315,6 +301,22 @@ async def generate(self, messages: list[Any], **kwargs: Any) -> GenerationResult
             temperature = kwargs.get("temperature", self.temperature)
             max_tokens = kwargs.get("max_tokens", self.max_tokens)
 
+            # In-process llama.cpp model served by worker threads
+            if self.worker is not None:
+                prompt = self._format_prompt(formatted_messages)
+                completion = await self.worker.complete(
+                    prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stop=kwargs.get("stop", ["### User:", "\n\n"]),
+                )
+                return GenerationResult(
+                    content=completion["text"].strip(),
+                    model=model,
+                    finish_reason=completion["finish_reason"],
+                    completion_tokens=completion["completion_tokens"],
+                )
+
             # If client exists, call local model API
             if self.client:
                 # Handle different client types
@@ -327,19 +329,6 @@ async def generate(self, messages: list[Any], **kwargs: Any) -> GenerationResult
                         max_tokens=max_tokens,
                         **kwargs,
                     )
-                elif hasattr(self.client, "create_completion"):
-                    # This is a local llama_cpp client
-                    prompt = self._format_prompt(formatted_messages)
-                    completion = self.client.create_completion(
-                        prompt=prompt,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        stop=kwargs.get("stop", ["### User:", "\n\n"]),
-                    )
-                    return GenerationResult(
-                        content=completion["choices"][0]["text"].strip(),
-                        model=model,
-                    )
                 else:
                     # Unknown client type, use mock
                     return self._mock_response(model)
@@ -458,6 +447,28 @@ async def stream(
             await self.initialize()
 
         try:
+            # In-process llama.cpp model: tokens arrive as they are sampled
+            if self.worker is not None:
+                prompt = self._format_prompt(self._convert_messages(messages))
+                chunks = self.worker.stream(
+                    prompt,
+                    temperature=kwargs.get("temperature", self.temperature),
+                    max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                    stop=kwargs.get("stop", ["### User:", "\n\n"]),
+                )
+                try:
+                    async for chunk in chunks:
+                        choice = chunk["choices"][0]
+                        if choice.get("text"):
+                            yield GenerationChunk(
+                                content=choice["text"],
+                                finish_reason=choice.get("finish_reason"),
+                            )
+                finally:
+                    # Stops generation on the worker if the consumer bails out
+                    await chunks.aclose()
+                return
+
             # If no client or it's not an HTTP client, use mock streaming
             if not self.client or not (
                 hasattr(self.client, "close") and callable(self.client.close)
@@ -544,15 +555,12 @@ async def _stream_oobabooga(
                     error_text = await response.text()
                     raise LLMError(f"API error ({response.status}): {error_text}")
 
-                buffer = ""
                 async for line in response.content.iter_any():
                     if line:
                         line_data = line.decode("utf-8")
                         if "data: " in line_data:
                             chunk_data = line_data.replace("data: ", "")
                             try:
-                                import json
-
                                 chunk_obj = json.loads(chunk_data)
                                 token = chunk_obj.get("token", {}).get("text", "")
                                 if token:
@@ -590,8 +598,6 @@ async def _stream_openai_compatible(
                 async for line in response.content.iter_lines():
                     if line and line.strip() and line.strip() != b"data: [DONE]":
                         try:
-                            import json
-
                             line_text = line.decode("utf-8")
                             if line_text.startswith("data: "):
                                 data = json.loads(line_text[6:])
@@ -603,9 +609,8 @@ async def _stream_openai_compatible(
                                 if content:
                                     yield GenerationChunk(content=content)
                         except Exception as e:
-                            raise LlmError(f"Operation failed: {e}") from e
-                            self.logger.error(f"Error parsing stream data: {e}")
+                            raise LLMError(f"Operation failed: {e}") from e
+        except LLMError:
+            raise
         except Exception as e:
-            raise LlmError(f"Operation failed: {e}") from e
-            self.logger.error(f"Error in streaming request: {e}")
-            yield GenerationChunk(content="[Error during streaming]")
+            raise LLMError(f"Operation failed: {e}") from e
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark the event-driven DAG scheduler on 10k-node graphs.
+
+Measures the scheduling overhead of ``DAGScheduler`` alone (no-op nodes) and
+end to end through ``LocalOrchestrationProvider`` for a few graph shapes:
+
+- wide: independent nodes
+- chain: one long dependency chain
+- layered: 100 layers of 100 nodes, each depending on 3 nodes of the
+  previous layer
+- diamond: one root fanning out to every node, all joined by one sink
+
+Usage:
+    python scripts/bench_dag_scheduler.py [--nodes 10000] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from pepperpy.orchestration.dag import DAGScheduler
+from pepperpy.orchestration.local import LocalOrchestrationProvider
+from pepperpy.workflow.models import Task, Workflow
+
+
+def wide(n: int) -> dict[str, set[str]]:
+    return {f"t{i}": set() for i in range(n)}
+
+
+def chain(n: int) -> dict[str, set[str]]:
+    return {f"t{i}": {f"t{i - 1}"} if i else set() for i in range(n)}
+
+
+def layered(n: int, width: int = 100, fan_in: int = 3) -> dict[str, set[str]]:
+    rng = random.Random(0)
+    graph: dict[str, set[str]] = {}
+    for i in range(n):
+        layer = i // width
+        if layer == 0:
+            graph[f"t{i}"] = set()
+            continue
+        previous = range((layer - 1) * width, layer * width)
+        graph[f"t{i}"] = {f"t{j}" for j in rng.sample(previous, fan_in)}
+    return graph
+
+
+def diamond(n: int) -> dict[str, set[str]]:
+    graph = {"t0": set()}
+    for i in range(1, n - 1):
+        graph[f"t{i}"] = {"t0"}
+    graph[f"t{n - 1}"] = {f"t{i}" for i in range(1, n - 1)}
+    return graph
+
+
+SHAPES = {"wide": wide, "chain": chain, "layered": layered, "diamond": diamond}
+
+
+async def noop(node: str) -> None:
+    return None
+
+
+async def bench_scheduler(graph: dict[str, set[str]], concurrency: int) -> float:
+    start = time.perf_counter()
+    scheduler = DAGScheduler(graph, graph, noop, max_concurrency=concurrency)
+    await scheduler.run()
+    return time.perf_counter() - start
+
+
+async def bench_provider(graph: dict[str, set[str]], concurrency: int) -> float:
+    async def step(**inputs):
+        return {}
+
+    builder = Workflow.builder().with_id("bench").with_name("bench")
+    for node in graph:
+        builder.with_task(Task(id=node, name=node, function=step))
+    for node, deps in graph.items():
+        for dep in deps:
+            builder.with_edge(dep, node)
+    workflow = builder.build()
+
+    provider = LocalOrchestrationProvider(max_concurrent_tasks=concurrency)
+    await provider.initialize()
+    await provider.register_workflow(workflow)
+    start = time.perf_counter()
+    execution_id = await provider.execute_workflow("bench")
+    execution = await provider.wait_for_execution(execution_id)
+    elapsed = time.perf_counter() - start
+    assert execution.status == "COMPLETED", execution.error
+    await provider.cleanup()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{args.nodes} nodes, concurrency {args.concurrency}")
+    print(f"{'shape':<10}{'edges':>10}{'scheduler':>14}{'provider':>14}")
+    for name, build in SHAPES.items():
+        graph = build(args.nodes)
+        edges = sum(len(deps) for deps in graph.values())
+        scheduler = await bench_scheduler(graph, args.concurrency)
+        provider = await bench_provider(graph, args.concurrency)
+        print(
+            f"{name:<10}{edges:>10}"
+            f"{scheduler * 1000:>12.1f}ms{provider * 1000:>12.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Tests for the orchestration task cache."""
+
+import dataclasses
+
+import pytest
+
+from pepperpy.orchestration.cache import MemoryTaskCache, task_cache_key
+from pepperpy.orchestration.local import LocalOrchestrationProvider
+from pepperpy.workflow.models import ExecutionStatus, Task, Workflow
+
+
+@dataclasses.dataclass
+class Options:
+    """Dataclass task input."""
+
+    size: int
+    tags: frozenset[str]
+
+
+def build_workflow(calls: list[str]) -> Workflow:
+    """Create a two-step workflow whose tasks record their calls."""
+
+    async def load(path: str, **kwargs):
+        calls.append("load")
+        return {"doc": path.upper()}
+
+    async def count(doc: str, **kwargs):
+        calls.append("count")
+        return {"length": len(doc)}
+
+    return (
+        Workflow.builder()
+        .with_id("cached")
+        .with_name("Cached")
+        .with_task(Task("load", "Load", load, cache=True))
+        .with_task(Task("count", "Count", count, cache=True))
+        .with_edge("load", "count")
+        .build()
+    )
+
+
+@pytest.mark.asyncio
+async def test_second_run_reports_cache_hits():
+    """Test that a repeated run is served from the cache and says so."""
+    calls: list[str] = []
+    provider = LocalOrchestrationProvider(cache=MemoryTaskCache())
+    await provider.register_workflow(build_workflow(calls))
+
+    first = await provider.wait_for_execution(
+        await provider.execute_workflow("cached", {"path": "a/b"})
+    )
+    assert first.status == ExecutionStatus.COMPLETED
+    assert first.cache_hits == []
+    assert calls == ["load", "count"]
+
+    calls.clear()
+    second = await provider.wait_for_execution(
+        await provider.execute_workflow("cached", {"path": "a/b"})
+    )
+    assert second.status == ExecutionStatus.COMPLETED
+    assert sorted(second.cache_hits) == ["count", "load"]
+    assert second.cache_hit_ratio == 1.0
+    assert second.outputs == first.outputs
+    assert calls == []
+
+    await provider.cleanup()
+
+
+def test_cache_key_is_independent_of_ordering():
+    """Test that set and dict ordering do not change the cache key."""
+    task = Task("t", "T", None, cache=True)
+    inputs = {"tags": {"b", "a", "c"}, "options": Options(3, frozenset({"y", "x"}))}
+    reordered = {
+        "options": Options(3, frozenset({"x", "y"})),
+        "tags": {"c", "a", "b"},
+    }
+
+    assert task_cache_key(task, inputs) == task_cache_key(task, reordered)
+    assert task_cache_key(task, {"v": (1, 2)}) != task_cache_key(task, {"v": [1, 2]})
+
+
+def test_cache_key_rejects_unstable_values():
+    """Test that values without a stable representation are refused."""
+    task = Task("t", "T", None, cache=True)
+
+    with pytest.raises(TypeError):
+        task_cache_key(task, {"value": object()})